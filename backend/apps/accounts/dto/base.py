@@ -1,8 +1,5 @@
-# Own Imports
-from apps.accounts.manager.bcrypt_manager import bcrypt_hasher
-
 # Third Party Imports
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field
 
 
 class UserSetupDTO(BaseModel):
@@ -10,7 +7,3 @@ class UserSetupDTO(BaseModel):
     last_name: str
     primary_email: EmailStr
     password: str = Field(min_length=6, max_length=28)
-
-    @validator("password")
-    def encrypt_password(cls, value: str) -> str:
-        return bcrypt_hasher.hash_password(value)
@@ -3,12 +3,13 @@ from datetime import datetime
 from typing import Text, Optional, List
 
 # Own Imports
-from apps.accounts.dto.base import UserSetupDTO, validator
+from apps.accounts.dto.base import UserSetupDTO
 
 # FastAPI Imports
 from fastapi import HTTPException
 
 # Third Party Imports
+from odmantic import ObjectId
 from pydantic import BaseModel, EmailStr, HttpUrl, Field
 
 
@@ -30,6 +31,14 @@ class UserAccountRecoverConfirmDTO(BaseModel):
     email: EmailStr
 
 
+class UserTokenRefreshDTO(BaseModel):
+    refresh_token: str
+
+
+class UserLogoutDTO(BaseModel):
+    refresh_token: Optional[str] = None
+
+
 class UserAccountChangePasswordDTO(BaseModel):
     password: str = Field(min_length=6, max_length=28)
     confirm_password: str = Field(min_length=6, max_length=28)
@@ -38,3 +47,12 @@ class UserAccountChangePasswordDTO(BaseModel):
 class UserAccountRecoverCompleteDTO(BaseModel):
     email: EmailStr
     password: str = Field(min_length=6, max_length=28)
+
+
+class UserAuthDTO(BaseModel):
+    """Slim view of a user account, holding what the auth checks need."""
+
+    id: ObjectId
+    primary_email: EmailStr
+    email_verified: bool = False
+    is_admin: bool = False
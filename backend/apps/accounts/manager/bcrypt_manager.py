@@ -1,16 +1,140 @@
+# Stdlib Imports
+import time
+import asyncio
+import multiprocessing
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+# FastAPI Imports
+from fastapi import HTTPException, status
+
+# Own Imports
+from config.secrets import get_settings
+from apps.monitoring.metrics import BCRYPT_DURATION
+
 # Third Party Imports
 from passlib.context import CryptContext
 
 
+# Set settings
+settings = get_settings()
+
+# Module level context so that pool workers can use it without pickling it
+ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Pool workers are started from a clean server process rather than forked
+# from the application, whose driver and client threads a fork would copy
+# in whatever state they are in
+mp_context = multiprocessing.get_context("forkserver")
+
+
+def _hash_password(password: str) -> str:
+    return ctx.hash(password)
+
+
+def _check_password(password: str, hashed_password: str) -> bool:
+    return ctx.verify(password, hashed_password)
+
+
 class BcryptPasswordHasher:
     """
     Responsible for the following:
 
     - hashing password
     - check/verify hashed password
+    - running both operations in a bounded process pool
     """
 
-    ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    ctx = ctx
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        """
+        This method initializes the hasher with the size of its process pool
+        and the number of operations allowed to wait for a free worker.
+
+        :param max_workers: The number of processes in the pool
+        :type max_workers: int
+
+        :param max_queue: The number of operations allowed to wait for a worker
+        :type max_queue: int
+        """
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.in_flight = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        """
+        This method creates the process pool. It is called on application startup.
+        """
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=mp_context
+            )
+
+    async def shutdown(self) -> None:
+        """
+        This method shuts down the process pool, waiting for its workers
+        without blocking the event loop. It is called on application shutdown.
+        """
+
+        if self.pool is not None:
+            pool, self.pool = self.pool, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(pool.shutdown, wait=True, cancel_futures=True)
+            )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of operations waiting for a free worker."""
+
+        return max(self.in_flight - self.max_workers, 0)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        This method returns the current state of the process pool.
+
+        :return: The pool size, in flight, queued and rejected operations.
+        :rtype: dict
+        """
+
+        return {
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "rejected": self.rejected,
+        }
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        This method runs the given function in the process pool, rejecting the
+        operation when the pool has too many operations waiting for a worker.
+        """
+
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={"message": "Server is busy. Please try again."},
+                headers={"Retry-After": "1"},
+            )
+
+        self.start()
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.pool, fn, *args)
+        finally:
+            self.in_flight -= 1
+            BCRYPT_DURATION.labels(fn.__name__.strip("_")).observe(
+                time.perf_counter() - started
+            )
 
     def hash_password(self, password: str) -> str:
         """
@@ -24,7 +148,7 @@ class BcryptPasswordHasher:
         :rtype: str
         """
 
-        return self.ctx.hash(password)
+        return _hash_password(password)
 
     def check_password(self, password: str, hashed_password: str) -> bool:
         """
@@ -40,7 +164,41 @@ class BcryptPasswordHasher:
         :rtype bool: bool
         """
 
-        return self.ctx.verify(password, hashed_password)
+        return _check_password(password, hashed_password)
+
+    async def ahash_password(self, password: str) -> str:
+        """
+        This method hashes the password in the process pool,
+        without blocking the event loop.
+
+        :param password: The password to hash
+        :type password: str
+
+        :return: The hashed password.
+        :rtype: str
+        """
+
+        return await self._run(_hash_password, password)
+
+    async def acheck_password(self, password: str, hashed_password: str) -> bool:
+        """
+        This method checks the password against the hashed_password
+        in the process pool, without blocking the event loop.
+
+        :param password: The password to be checked
+        :type password: str
+
+        :param hashed_password: The hashed password to check against
+        :type hashed_password: str
+
+        :return: True if the password matches the hashed password.
+        :rtype: bool
+        """
+
+        return await self._run(_check_password, password, hashed_password)
 
 
-bcrypt_hasher = BcryptPasswordHasher()
+bcrypt_hasher = BcryptPasswordHasher(
+    max_workers=settings.BCRYPT_POOL_WORKERS,
+    max_queue=settings.BCRYPT_POOL_MAX_QUEUE,
+)
@@ -0,0 +1,134 @@
+# Stdlib Imports
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Own Imports
+from config.secrets import get_settings
+
+
+# Set settings
+settings = get_settings()
+
+
+class UserCache:
+    """
+    Responsible for the following:
+
+    - caching resolved user accounts per worker, keyed by email and
+      by the kind of view of the account that was resolved
+    - expiring entries after a ttl and evicting the least recently used
+    - keeping track of the cache hit rate
+    """
+
+    def __init__(self, maxsize: int, ttl: int) -> None:
+        """
+        This method initializes the cache.
+
+        :param maxsize: The maximum number of entries kept in the cache
+        :type maxsize: int
+
+        :param ttl: The lifetime of an entry in seconds, 0 disables the cache
+        :type ttl: int
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self.namespaces = set()
+        self.hits = 0
+        self.misses = 0
+        self.request_hits = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, email: str, namespace: str = "user") -> Optional[Any]:
+        """
+        This method returns the cached value for the email,
+        or None if it is missing or expired.
+
+        :param email: The user email address
+        :type email: str
+
+        :param namespace: The kind of value cached
+        :type namespace: str
+
+        :return: The cached value.
+        """
+
+        if not self.enabled:
+            return None
+
+        key = (namespace, email)
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, email: str, value: Any, namespace: str = "user") -> None:
+        """
+        This method caches the value for the email,
+        evicting the least recently used entry when full.
+
+        :param email: The user email address
+        :type email: str
+
+        :param value: The value to cache
+        :type value: Any
+
+        :param namespace: The kind of value cached
+        :type namespace: str
+        """
+
+        if not self.enabled:
+            return
+
+        key = (namespace, email)
+        self.namespaces.add(namespace)
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, email: str) -> None:
+        """
+        This method removes every cached value for the email.
+
+        :param email: The user email address
+        :type email: str
+        """
+
+        for namespace in self.namespaces:
+            self.entries.pop((namespace, email), None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        This method returns the cache size and hit rate.
+
+        :return: The size, hits, misses and hit rate of the cache.
+        :rtype: dict
+        """
+
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "request_hits": self.request_hits,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+user_cache = UserCache(maxsize=settings.USER_CACHE_MAXSIZE, ttl=settings.USER_CACHE_TTL)
@@ -1,13 +1,36 @@
 # Stdlib Imports
-from datetime import datetime
+import uuid
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Type, TypeVar
 
 # FastAPI Imports
 from fastapi import HTTPException
 
 # Own Imports
 from config.database import engine
-from apps.accounts.dto.users_dto import UserCreateDTO
-from apps.accounts.models.accounts import User, OTPTimeout
+from config.secrets import get_settings
+from apps.accounts.dto.users_dto import UserCreateDTO, UserAuthDTO
+from apps.accounts.manager.cache_manager import user_cache
+from apps.accounts.manager.email_filter_manager import email_filter
+from apps.accounts.manager.token_version_manager import token_versions
+from apps.accounts.manager.bcrypt_manager import bcrypt_hasher
+from apps.accounts.models.accounts import User, OTPTimeout, RefreshToken
+
+# Third Party Imports
+from bson import ObjectId
+from odmantic import Model
+from pymongo import ReturnDocument
+
+
+# Set settings
+settings = get_settings()
+
+ModelType = TypeVar("ModelType", bound=Model)
+
+# Updating these fields revokes the tokens issued before the update
+TOKEN_VERSION_FIELDS = {"password", "is_admin", "email_verified"}
 
 
 async def setup_user_account(payload: UserCreateDTO) -> User:
@@ -20,27 +43,115 @@ async def setup_user_account(payload: UserCreateDTO) -> User:
             status_code=409, detail={"message": "Account already exists"}
         )
 
+    # Hash the password off the event loop
+    hashed_password = await bcrypt_hasher.ahash_password(payload.password)
+
     # Initialize user account instance
     user = User(
-        **payload.dict(),
+        **payload.dict(exclude={"password"}),
+        password=hashed_password,
         date_created=datetime.utcnow(),
     )
 
     # Save user to database
     await engine.save(user)
+    user_cache.invalidate(user.primary_email)
+    email_filter.add(user.primary_email)
     return user
 
 
-async def update_user_account(email: str, **kwargs: dict) -> User:
-    """
-    Responsible for updating user account
+async def partial_update(
+    model: Type[ModelType],
+    query: Dict[str, Any],
+    fields: Optional[Dict[str, Any]] = None,
+    inc: Optional[Dict[str, int]] = None,
+    expected_version: Optional[int] = None,
+    return_document: bool = False,
+) -> Optional[ModelType]:
+    """Applies a partial update to a single document in one round trip.
+
+    Models with a version field have it incremented on every update, and
+    an expected version can be given to only update the document if nobody
+    else updated it in the meantime (optimistic concurrency).
+
+    Args:
+        model (Model): the model of the document
+        query (dict): the filter matching the document
+        fields (dict): the fields to set
+        inc (dict): the fields to increment
+        expected_version (int): the version the document must be at
+        return_document (bool): return the updated document
+
+    Raises:
+        HTTPException: (409) the document was modified concurrently
+
+    Returns:
+        Model: the updated document when requested and found
     """
 
-    user = await engine.find_one(User, User.primary_email == email)
-    user.update(kwargs)
+    query = dict(query)
+    if expected_version is not None:
+        # documents created before versioning have no version field yet
+        query["version"] = expected_version or {"$in": [0, None]}
+
+    inc = dict(inc or {})
+    if "version" in model.__fields__:
+        inc["version"] = inc.get("version", 0) + 1
+
+    update: Dict[str, Any] = {}
+    if fields:
+        update["$set"] = fields
+    if inc:
+        update["$inc"] = inc
+
+    document = await engine.get_collection(model).find_one_and_update(
+        query,
+        update,
+        projection=None if return_document else {"_id": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if document is None and expected_version is not None:
+        raise HTTPException(
+            409, {"message": "Record was modified by another request. Try again."}
+        )
+    if document is None or not return_document:
+        return None
+    return model.parse_doc(document)
+
+
+async def update_user_account(
+    email: str,
+    inc: Optional[Dict[str, int]] = None,
+    expected_version: Optional[int] = None,
+    return_document: bool = True,
+    **kwargs: Any,
+) -> Optional[User]:
+    """
+    Responsible for updating user account, bumping its token version
+    when a field carried by its tokens or the password changes.
+    """
 
-    # Save user to database
-    await engine.save(user)
+    kwargs.setdefault("date_modified", datetime.utcnow())
+    revokes_tokens = bool(TOKEN_VERSION_FIELDS & set(kwargs))
+    if revokes_tokens:
+        inc = {**(inc or {}), "token_version": 1}
+        kwargs["token_version_changed_at"] = kwargs["date_modified"]
+
+    user = await partial_update(
+        User,
+        {"primary_email": email},
+        kwargs,
+        inc=inc,
+        expected_version=expected_version,
+        return_document=return_document,
+    )
+    user_cache.invalidate(email)
+    if revokes_tokens:
+        await revoke_refresh_tokens({"user_email": email})
+        if user is not None:
+            token_versions.set(
+                str(user.id), user.token_version, user.token_version_changed_at
+            )
     return user
 
 
@@ -54,13 +165,31 @@ async def user_email_exist(email: str) -> bool:
             bool: account exists
     """
 
-    user = await engine.find_one(User, User.primary_email == email)
-    if not user:
-        return False
-    return True
+    count = await engine.get_collection(User).count_documents(
+        {"primary_email": email}, limit=1
+    )
+    return count > 0
+
+
+async def find_user_document(
+    email: str, projection: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Gets the raw, unvalidated document of an user account by email.
+
+    Args:
+        email (str): the user email address
+        projection (dict): the fields to return, all of them by default
+
+    Returns:
+        dict: the user document
+    """
+
+    return await engine.get_collection(User).find_one(
+        {"primary_email": email}, projection
+    )
 
 
-async def get_user_account_by_email(email: str) -> User:
+async def get_user_account_by_email(email: str) -> Optional[User]:
     """Gets an user account by email.
 
     Args:
@@ -70,27 +199,64 @@ async def get_user_account_by_email(email: str) -> User:
         User: the user account
     """
 
-    return await engine.find_one(User, User.primary_email == email)
+    document = await find_user_document(email)
+    if document is None:
+        return None
+    return User.parse_doc(document)
 
 
-async def create_user_otp_timeout(otp_code: str, email: str):
+async def get_user_auth_view(email: str) -> Optional[UserAuthDTO]:
+    """Gets the fields of an user account needed by the auth checks.
+
+    The document is trusted as it comes from our own collection,
+    so it is not validated again.
+
+    Args:
+        email (str): the user email address
+
+    Returns:
+        UserAuthDTO: the slim user account
     """
-    Creates an otp timeout for the specified NGO account.
+
+    document = await find_user_document(
+        email, {"primary_email": 1, "email_verified": 1, "is_admin": 1}
+    )
+    if document is None:
+        return None
+
+    return UserAuthDTO.construct(
+        id=document["_id"],
+        primary_email=document["primary_email"],
+        email_verified=document.get("email_verified", False),
+        is_admin=document.get("is_admin", False),
+    )
+
+
+async def create_user_otp_timeout(otp_code: str, email: str, user_id: ObjectId):
+    """
+    Creates an otp timeout for the specified NGO account,
+    replacing the account's previous otp if there is one.
 
     Args:
         otp_code (str): the otp code
         email (str): the user email address
+        user_id (ObjectId): the user account id
     """
 
-    user = await get_user_account_by_email(email)
-
-    # Initialize otp_timeout instance and save to database
-    otp_timeout = OTPTimeout(
-        otp_code=otp_code,
-        user=user,
-        date_created=datetime.utcnow(),
+    now = datetime.utcnow()
+    await engine.get_collection(OTPTimeout).update_one(
+        {"email": email},
+        {
+            "$set": {
+                "user_id": user_id,
+                "otp_code": otp_code,
+                "otp_verified": False,
+                "date_created": now,
+                "date_modified": now,
+            }
+        },
+        upsert=True,
     )
-    await engine.save(otp_timeout)
 
 
 async def update_user_otp_timeout(otp_code: str, email: str):
@@ -100,32 +266,68 @@ async def update_user_otp_timeout(otp_code: str, email: str):
     Args:
         otp_code (str): the otp code
         email (str): the user email address
+
+    Raises:
+        HTTPException: (400) OTP does not exist
     """
 
-    user = await get_user_account_by_email(email)
+    otp_timeout = await engine.get_collection(OTPTimeout).find_one_and_update(
+        {"email": email},
+        {
+            "$set": {
+                "otp_code": otp_code,
+                "otp_verified": False,
+                "date_modified": datetime.utcnow(),
+            }
+        },
+        projection={"_id": 1},
+    )
+    if not otp_timeout:
+        raise HTTPException(400, {"message": "OTP does not exist."})
+
 
-    # Find account otp timeout document
-    otp_timeout = await engine.find_one(OTPTimeout, OTPTimeout.user == user.id)
+async def verify_user_otp(email: str, otp_code: str, timeout: int) -> bool:
+    """Atomically marks the otp of the specified NGO account as verified,
+    if it matches the otp code, has not expired and was not verified yet.
+    Verifying leaves date_modified alone, so it neither extends the
+    validity of the otp nor its ttl.
 
-    # Update otp code and save to database
-    otp_timeout.otp_code = otp_code
-    otp_timeout.date_modified = datetime.utcnow()
-    await engine.save(otp_timeout)
+    Args:
+        email (str): the user email address
+        otp_code (str): the otp code
+        timeout (int): the lifetime of the otp in minutes
 
+    Returns:
+        bool: otp is verified
+    """
 
-async def update_otp_timeout(email: str, **kwargs: dict):
+    now = datetime.utcnow()
+    otp_timeout = await engine.get_collection(OTPTimeout).find_one_and_update(
+        {
+            "email": email,
+            "otp_code": otp_code,
+            "otp_verified": False,
+            "date_modified": {"$gte": now - timedelta(minutes=timeout)},
+        },
+        {"$set": {"otp_verified": True}},
+        projection={"_id": 1},
+    )
+    return otp_timeout is not None
+
+
+async def update_otp_timeout(
+    email: str, return_document: bool = False, **kwargs: Any
+) -> Optional[OTPTimeout]:
     """Update otp timeout for the specified NGO account.
 
     Args:
         email (str): the user email address
+        return_document (bool): return the updated otp timeout
     """
 
-    user = await get_user_account_by_email(email)
-
-    # Find account otp timeout document and update it
-    otp_timeout = await engine.find_one(OTPTimeout, OTPTimeout.user == user.id)
-    otp_timeout.update(kwargs)
-    await engine.save(otp_timeout)
+    return await partial_update(
+        OTPTimeout, {"email": email}, kwargs, return_document=return_document
+    )
 
 
 async def get_user_otp_timeout(email: str) -> OTPTimeout:
@@ -133,8 +335,117 @@ async def get_user_otp_timeout(email: str) -> OTPTimeout:
     Retrieve the otp code for a given user account
     """
 
-    user = await get_user_account_by_email(email)
-    otp_timeout = await engine.find_one(OTPTimeout, OTPTimeout.user == user.id)
+    otp_timeout = await engine.find_one(OTPTimeout, OTPTimeout.email == email)
     if not otp_timeout:
         raise HTTPException(400, {"message": "OTP does not exist."})
     return otp_timeout
+
+
+def hash_refresh_token(token: str) -> str:
+    # refresh tokens are random, a fast hash is enough to not store them
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def create_refresh_token(
+    user_id: ObjectId,
+    user_email: str,
+    is_admin: bool,
+    email_verified: bool,
+    token_version: int,
+    family_id: Optional[str] = None,
+) -> str:
+    """Creates a refresh token, storing only its hash along with the claims
+    of the access tokens it renews.
+
+    Args:
+        user_id (ObjectId): the user account id
+        user_email (str): the user email address
+        is_admin (bool): the account has admin privileges
+        email_verified (bool): the account email address is verified
+        token_version (int): the token version of the account
+        family_id (str): the rotation chain of the token, a new one by default
+
+    Returns:
+        str: the refresh token
+    """
+
+    token = secrets.token_urlsafe(32)
+    now = datetime.utcnow()
+    await engine.save(
+        RefreshToken(
+            token_hash=hash_refresh_token(token),
+            family_id=family_id or uuid.uuid4().hex,
+            user_id=user_id,
+            user_email=user_email,
+            is_admin=is_admin,
+            email_verified=email_verified,
+            token_version=token_version,
+            expires_at=now + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRES),
+            date_created=now,
+        )
+    )
+    return token
+
+
+async def rotate_refresh_token(token: str) -> Optional[RefreshToken]:
+    """Atomically revokes a valid refresh token so that it is used only once.
+
+    A token presented again after its rotation was leaked, every token
+    of its rotation chain is then revoked. A token issued before the
+    token version of the account was bumped is not valid, it may have
+    been issued while the bump revoked the tokens of the account.
+
+    Args:
+        token (str): the refresh token
+
+    Returns:
+        RefreshToken: the refresh token, if it was valid
+    """
+
+    collection = engine.get_collection(RefreshToken)
+    token_hash = hash_refresh_token(token)
+    document = await collection.find_one_and_update(
+        {"_id": token_hash, "revoked": False, "expires_at": {"$gt": datetime.utcnow()}},
+        {"$set": {"revoked": True}},
+    )
+    if document is not None:
+        user = await engine.get_collection(User).find_one(
+            {"_id": document["user_id"]}, {"token_version": 1}
+        )
+        if user is None or user.get("token_version", 0) != document["token_version"]:
+            return None
+        return RefreshToken.parse_doc(document)
+
+    reused = await collection.find_one(
+        {"_id": token_hash, "revoked": True}, {"family_id": 1}
+    )
+    if reused is not None:
+        await revoke_refresh_tokens({"family_id": reused["family_id"]})
+    return None
+
+
+async def revoke_refresh_token(token: str, user_id: ObjectId) -> None:
+    """Revokes a refresh token of the user account and its rotation chain.
+
+    Args:
+        token (str): the refresh token
+        user_id (ObjectId): the user account id
+    """
+
+    document = await engine.get_collection(RefreshToken).find_one(
+        {"_id": hash_refresh_token(token), "user_id": user_id}, {"family_id": 1}
+    )
+    if document is not None:
+        await revoke_refresh_tokens({"family_id": document["family_id"]})
+
+
+async def revoke_refresh_tokens(query: Dict[str, Any]) -> None:
+    """Revokes the refresh tokens matching the query.
+
+    Args:
+        query (dict): the filter matching the refresh tokens
+    """
+
+    await engine.get_collection(RefreshToken).update_many(
+        {**query, "revoked": False}, {"$set": {"revoked": True}}
+    )
@@ -1,75 +1,199 @@
+# Stdlib Imports
+from typing import Any, Dict, Optional, Union
+
 # FastAPI Imports
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 
 # Own Imports
 from config.secrets import get_settings
 from apps.accounts.models.accounts import User
-from apps.accounts.manager.jwt.bearer import jwt_bearer
-from apps.accounts.manager.db_manager import get_user_account_by_email
+from apps.accounts.dto.users_dto import UserAuthDTO
+from apps.accounts.manager.jwt.bearer import jwt_bearer, optional_jwt_bearer
+from apps.accounts.manager.cache_manager import user_cache
+from apps.accounts.manager.revocation_manager import revoked_tokens
+from apps.accounts.manager.token_version_manager import token_versions
+from apps.accounts.manager.db_manager import (
+    get_user_account_by_email,
+    get_user_auth_view,
+)
 
 # Third Party Imports
-import jwt
+from bson import ObjectId
 
 
 # initialize settings
 settings = get_settings()
 
+# Loaders of the views of an account, full or slim
+user_loaders = {"user": get_user_account_by_email, "auth": get_user_auth_view}
+
+
+async def resolve_user(
+    request: Request, email: str, view: str = "user"
+) -> Optional[Union[User, UserAuthDTO]]:
+    """
+    This function resolves the account for the given email, looking it up
+    in the request scope first, then in the worker cache and the database.
+
+    :param request: The request object
+    :type request: Request
+
+    :param email: The user email address
+    :type email: str
+
+    :param view: "user" for the full account, "auth" for the slim auth view
+    :type view: str
+
+    :return: The User account, if it exists.
+    :rtype: User | UserAuthDTO
+    """
+
+    users = getattr(request.state, "users", None)
+    if users is None:
+        users = request.state.users = {}
+
+    if (view, email) in users:
+        user_cache.request_hits += 1
+        return users[(view, email)]
+
+    user = user_cache.get(email, view)
+    if user is None:
+        user = await user_loaders[view](email)
+        if user is not None:
+            user_cache.set(email, user, view)
+
+    users[(view, email)] = user
+    return user
+
+
+async def get_current_claims(
+    claims: Dict[str, Any] = Depends(jwt_bearer)
+) -> Dict[str, Any]:
+    """
+    This function checks that the verified JWT claims were not revoked,
+    on logout or by a bump of the account's token version, and returns them.
+
+    :param claims: Dict[str, Any] = Depends(jwt_bearer)
+    :type claims: dict
+
+    :return: The token claims.
+    :rtype: dict
+    """
+
+    if revoked_tokens.is_revoked(claims) or not token_versions.is_current(claims):
+        raise HTTPException(403, {"message": "Invalid token or expired token."})
+    return claims
+
+
+async def get_optional_claims(
+    claims: Optional[Dict[str, Any]] = Depends(optional_jwt_bearer)
+) -> Optional[Dict[str, Any]]:
+    """
+    This function returns the current token claims of routes open to
+    anonymous requests, or None when the request has no token.
+
+    :param claims: Optional[Dict[str, Any]] = Depends(optional_jwt_bearer)
+    :type claims: dict
+
+    :return: The token claims, if any.
+    :rtype: dict
+    """
+
+    if claims is None:
+        return None
+    return await get_current_claims(claims)
+
 
-async def get_current_user(token: str = Depends(jwt_bearer)) -> User:
+async def get_current_user(
+    request: Request, claims: Dict[str, Any] = Depends(get_current_claims)
+) -> User:
     """
-    This function takes a JWT token, decodes it
+    This function takes the verified JWT claims
     and returns the account that the token belongs to.
 
-    :param token: str = Depends(jwt_bearer)
-    :type token: str
+    :param request: The request object
+    :type request: Request
+
+    :param claims: Dict[str, Any] = Depends(get_current_claims)
+    :type claims: dict
 
     :return: An User account.
     :rtype: User
     """
 
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+    user = await resolve_user(request, claims["user_email"])
+    if not user:
+        raise HTTPException(404, {"message": "User does not exist!"})
+    return user
+
+
+async def get_current_auth_user(
+    request: Request, claims: Dict[str, Any] = Depends(get_current_claims)
+) -> UserAuthDTO:
+    """
+    This function takes the verified JWT claims and returns the slim
+    view of the account that the token belongs to, which is all
+    the active and admin checks need.
+
+    With JWT_CLAIMS_ONLY, tokens carrying the authorization claims are
+    trusted without loading the account, revoked ones being rejected
+    through their token version.
+
+    :param request: The request object
+    :type request: Request
+
+    :param claims: Dict[str, Any] = Depends(get_current_claims)
+    :type claims: dict
+
+    :return: The slim User account.
+    :rtype: UserAuthDTO
+    """
+
+    if settings.JWT_CLAIMS_ONLY and "token_version" in claims:
+        return UserAuthDTO.construct(
+            id=ObjectId(claims["user_id"]),
+            primary_email=claims["user_email"],
+            email_verified=claims["email_verified"],
+            is_admin=claims["is_admin"],
         )
-    except jwt.PyJWTError:
-        raise HTTPException(403, {"message": "Could not validate token."})
 
-    user = await get_user_account_by_email(payload["user_email"])
+    user = await resolve_user(request, claims["user_email"], "auth")
     if not user:
         raise HTTPException(404, {"message": "User does not exist!"})
     return user
 
 
-async def get_active_user(current_user: User = Depends(get_current_user)):
+async def get_active_user(
+    user: UserAuthDTO = Depends(get_current_auth_user),
+) -> UserAuthDTO:
     """
     This function checks if the account is not active,
     raises an exception. Otherwise, return the account.
 
-    :param current_user: User = Depends(get_current_user)
-    :type current_user: User
+    :param user: UserAuthDTO = Depends(get_current_auth_user)
+    :type user: UserAuthDTO
 
     :return: An active User account.
-    :rtype: User
+    :rtype: UserAuthDTO
     """
 
-    user = await get_user_account_by_email(current_user.primary_email)
     if not user.email_verified:
         raise HTTPException(400, {"message": "User not activated!"})
     return user
 
 
 async def get_admin_user(
-    active_user: User = Depends(get_active_user),
-) -> User:
+    active_user: UserAuthDTO = Depends(get_active_user),
+) -> UserAuthDTO:
     """
     This function checks if the account is not an admin,
     raise an exception. Otherwise, return the account.
 
-    :param active_user: User = Depends(get_active_user)
-    :type active_user: User
+    :param active_user: UserAuthDTO = Depends(get_active_user)
+    :type active_user: UserAuthDTO
 
     :return: A user with admin privileges.
-    :rtype: User
+    :rtype: UserAuthDTO
     """
 
     if not active_user.is_admin:
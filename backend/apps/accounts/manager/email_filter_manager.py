@@ -0,0 +1,269 @@
+# Stdlib Imports
+import math
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+# Own Imports
+from config.database import engine
+from config.secrets import get_settings
+from apps.accounts.models.accounts import User
+from apps.accounts.manager.refresh_manager import RefreshingMirror
+
+# Third Party Imports
+from bson import ObjectId
+
+
+# Set settings
+settings = get_settings()
+
+# Set logger
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    A bloom filter of strings: membership tests have no false negatives
+    and a false positive rate set by the capacity and the number of bits.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """
+        This method sizes the filter for the capacity and error rate.
+
+        :param capacity: The number of items the filter is sized for
+        :type capacity: int
+
+        :param error_rate: The false positive rate at capacity
+        :type error_rate: float
+        """
+
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(
+            int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8
+        )
+        self.hashes = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.items = 0
+
+    def positions(self, item: str) -> Iterator[int]:
+        # double hashing, the k positions derive from two 64 bit hashes
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self.positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.items += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.positions(item)
+        )
+
+    @property
+    def expected_error_rate(self) -> float:
+        """The false positive rate expected for the items added so far."""
+
+        return (1 - math.exp(-self.hashes * self.items / self.size)) ** self.hashes
+
+
+class EmailFilter(RefreshingMirror):
+    """
+    Responsible for the following:
+
+    - keeping a per worker bloom filter of the registered emails, built on
+      startup by streaming only the primary_email field of the users
+    - answering definite misses for unknown emails from memory, without
+      a database lookup
+    - fetching the accounts registered on other workers in the background
+      every refresh interval, an account registered on another worker can
+      be missed until then
+    - keeping track of the observed false positive rate
+    """
+
+    description = "email filter"
+
+    def __init__(
+        self, capacity: int, error_rate: float, refresh_interval: float
+    ) -> None:
+        """
+        This method initializes the email filter.
+
+        :param capacity: The minimum number of emails the filter is sized for
+        :type capacity: int
+
+        :param error_rate: The false positive rate at capacity
+        :type error_rate: float
+
+        :param refresh_interval: The seconds between two refreshes
+        :type refresh_interval: float
+        """
+
+        super().__init__(refresh_interval)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.filter: Optional[BloomFilter] = None
+        self.building: Optional[BloomFilter] = None
+        self.last_id: Optional[ObjectId] = None
+        self.accounts = 0
+        self.lookups = 0
+        self.definite_misses = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+
+    @property
+    def ready(self) -> bool:
+        return settings.EMAIL_FILTER_ENABLED and self.filter is not None
+
+    def add(self, email: str) -> None:
+        """
+        This method adds a registered email to the filter.
+
+        :param email: The user email address
+        :type email: str
+        """
+
+        for bloom_filter in (self.filter, self.building):
+            if bloom_filter is not None:
+                bloom_filter.add(email)
+
+    async def load(self) -> None:
+        """
+        This method builds the filter from the users collection, sized for
+        twice the number of accounts so that it has room to grow.
+        """
+
+        if not settings.EMAIL_FILTER_ENABLED:
+            return
+
+        collection = engine.get_collection(User)
+        accounts = await collection.estimated_document_count()
+
+        # emails registered meanwhile are added to both filters
+        self.building = BloomFilter(max(self.capacity, accounts * 2), self.error_rate)
+        last_id, accounts = None, 0
+        try:
+            async for document in collection.find(
+                {}, {"primary_email": 1}, batch_size=10000
+            ):
+                self.building.add(document["primary_email"])
+                last_id = max(last_id or document["_id"], document["_id"])
+                accounts += 1
+            self.filter, self.last_id, self.accounts = self.building, last_id, accounts
+        finally:
+            self.building = None
+
+        logger.info(
+            "Loaded %d emails into the email filter (%.1f KiB, %.4f%% false positives).",
+            self.filter.items,
+            len(self.filter.bits) / 1024,
+            self.filter.expected_error_rate * 100,
+        )
+
+    async def fetch(self, since: Optional[datetime], now: datetime) -> None:
+        """
+        This method builds the filter on the first refresh, then adds the
+        accounts stored after the last account the filter has read,
+        rebuilding the filter once it holds more emails than it is sized for.
+
+        Ids are generated by the application hosts, so an account can be
+        stored with an id below the last one read, e.g. by a host whose
+        clock is behind. Accounts are never deleted: when the collection
+        holds more accounts than the filter has read, it is rebuilt.
+        """
+
+        if not settings.EMAIL_FILTER_ENABLED:
+            return
+
+        if self.filter is None:
+            await self.load()
+            return
+
+        if self.filter.items > self.filter.capacity:
+            await self.load()
+            self.rebuilds += 1
+            return
+
+        collection = engine.get_collection(User)
+        query = {"_id": {"$gt": self.last_id}} if self.last_id is not None else {}
+        async for document in collection.find(query, {"primary_email": 1}):
+            if document["primary_email"] not in self.filter:
+                self.filter.add(document["primary_email"])
+            self.last_id = max(self.last_id or document["_id"], document["_id"])
+            self.accounts += 1
+
+        if await collection.estimated_document_count() > self.accounts:
+            await self.load()
+            self.rebuilds += 1
+
+    def may_exist(self, email: str) -> bool:
+        """
+        This method checks if an account may exist for the email. A False
+        answer is definite up to the previous refresh, the account does not
+        need to be looked up.
+
+        :param email: The user email address
+        :type email: str
+
+        :return: The account may exist.
+        :rtype: bool
+        """
+
+        if not self.ready:
+            return True
+
+        self.lookups += 1
+        if email in self.filter:
+            return True
+
+        self.definite_misses += 1
+        return False
+
+    def record_false_positive(self) -> None:
+        """Records an email the filter matched but has no account."""
+
+        if self.ready:
+            self.false_positives += 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        This method returns the filter size, memory use and false positive rates.
+
+        :return: The filter counters, memory in bytes and false positive rates.
+        :rtype: dict
+        """
+
+        bloom_filter = self.filter
+        negatives = self.definite_misses + self.false_positives
+        return {
+            "ready": int(self.ready),
+            "items": bloom_filter.items if bloom_filter else 0,
+            "capacity": bloom_filter.capacity if bloom_filter else 0,
+            "hashes": bloom_filter.hashes if bloom_filter else 0,
+            "memory_bytes": len(bloom_filter.bits) if bloom_filter else 0,
+            "expected_false_positive_rate": (
+                bloom_filter.expected_error_rate if bloom_filter else 0.0
+            ),
+            "observed_false_positive_rate": (
+                self.false_positives / negatives if negatives else 0.0
+            ),
+            "lookups": self.lookups,
+            "definite_misses": self.definite_misses,
+            "false_positives": self.false_positives,
+            "refreshes": self.refreshes,
+            "rebuilds": self.rebuilds,
+        }
+
+
+email_filter = EmailFilter(
+    capacity=settings.EMAIL_FILTER_CAPACITY,
+    error_rate=settings.EMAIL_FILTER_ERROR_RATE,
+    refresh_interval=settings.EMAIL_FILTER_REFRESH_INTERVAL,
+)
@@ -1,8 +1,10 @@
 # Stdlib Imports
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 # Own Imports
 from config.secrets import get_settings
+from config.http_client import http_client
+from apps.monitoring.metrics import time_call
 
 # Third Party Imports
 import httpx
@@ -17,8 +19,15 @@ class EmailManager(object):
     Responsible for sending emails
     """
 
-    def __init__(self, receiver_email: str) -> None:
+    timeouts = {
+        "mailtrap": settings.EMAIL_MAILTRAP_TIMEOUT,
+    }
+
+    def __init__(
+        self, receiver_email: str, client: Optional[httpx.AsyncClient] = None
+    ) -> None:
         self.receiver_email = receiver_email
+        self.client = client
         self.api_mode = settings.EMAIL_MODE
         self.api_url = settings.EMAIL_API_URL
         self.sender = settings.EMAIL_HOST_SENDER
@@ -34,7 +43,8 @@ class EmailManager(object):
 
     async def send(self, subject: str, content: str, provider: str) -> bool:
         """
-        Sends an email to the specified receiver address based on the provider.
+        Sends an email to the specified receiver address based on the provider,
+        using the application's shared http client unless one was given.
 
         Args:
             subject (str): The subject of the email to send
@@ -45,12 +55,13 @@ class EmailManager(object):
             response (bool): response of the mail
         """
 
-        async with httpx.AsyncClient() as client:
+        client = self.client or http_client.client
+        with time_call("email", provider):
             if provider == "mailtrap":
                 response = await self.with_mailtrap(client, subject, content)
             elif provider == "sendgrid":
                 response = await self.with_sendgrid(client, subject, content)
-            return response
+        return response
 
     async def with_mailtrap(
         self, client: httpx.AsyncClient, subject: str, content: str
@@ -83,6 +94,7 @@ class EmailManager(object):
                 "text": content,
             },
             headers=self.headers,
+            timeout=self.timeouts["mailtrap"],
         )
         response_data = response.json()
         if response.status_code == 200:
@@ -1,3 +1,6 @@
+# Stdlib Imports
+from typing import Any, Dict, Optional
+
 # FastAPI Imports
 from fastapi.security import HTTPBearer
 from fastapi import Request, HTTPException
@@ -21,16 +24,17 @@ class JWTBearer(HTTPBearer):
 
         super(JWTBearer, self).__init__(auto_error=auto_error)
 
-    async def __call__(self, request: Request):
+    async def __call__(self, request: Request) -> Optional[Dict[str, Any]]:
         """
         This method checks if the credentials are valid,
-        return the credentials. If not, raise an exception.
+        return the decoded token claims. If not, raise an exception.
+        Without auto_error, requests without credentials get None.
 
         :param request: The request object
         :type request: Request
 
-        :return: The token
-        :rtype: str
+        :return: The token claims
+        :rtype: dict
         """
 
         authorization_credentials = await super(JWTBearer, self).__call__(request)
@@ -39,26 +43,25 @@ class JWTBearer(HTTPBearer):
             if authorization_credentials.scheme != "Bearer":
                 raise HTTPException(403, {"message": "Invalid authentication scheme."})
 
-            if not self.verify_jwt_token(authorization_credentials.credentials):
-                raise HTTPException(403, {"message": "Invalid token or expired token."})
-
-            return authorization_credentials.credentials
+            return self.verify_jwt_token(authorization_credentials.credentials)
+        if not self.auto_error:
+            return None
         raise HTTPException(403, {"message": "Invalid authorization code."})
 
-    def verify_jwt_token(self, token: str) -> bool:
+    def verify_jwt_token(self, token: str) -> Dict[str, Any]:
         """
         This method takes a JWT token as an argument,
-        decodes it and returns a boolean value.
+        verifies it and returns its claims.
 
         :param token: The token that you want to verify
         :type token: str
 
-        :return: A boolean value.
-        :rtype: bool
+        :return: The token claims.
+        :rtype: dict
         """
 
-        payload = auth_handler.decode_jwt(token)
-        return True if payload is not None else False
+        return auth_handler.decode_jwt(token)
 
 
 jwt_bearer = JWTBearer()
+optional_jwt_bearer = JWTBearer(auto_error=False)
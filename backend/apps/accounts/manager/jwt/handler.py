@@ -1,23 +1,75 @@
 # Stdlib Imports
-from typing import Dict, Any
-from datetime import datetime, timedelta
+import time
+import uuid
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 
 # FastAPI Imports
 from fastapi import HTTPException
 
 # Own Imports
 from config.secrets import get_settings
+from apps.accounts.manager.jwt.keys import SigningKeySet, is_asymmetric
 
 # Third Party Imports
 import jwt
 
 
+class VerifiedTokenCache:
+    """
+    Responsible for remembering already verified tokens until they expire,
+    keyed by a digest of the token and bounded in size.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: bytes, claims: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+
+        self.entries[key] = (claims["exp"], claims)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
 class JWTAuthHandler:
     """
     Responsible for:
 
     - signing,
-    - encoding/decoding of tokens
+    - encoding/decoding of tokens,
+    - with the shared secret (HS256) or a key pair (RS256, EdDSA), the key
+      id of the signing key being set in the kid header of the token
     """
 
     def __init__(self):
@@ -31,57 +83,134 @@ class JWTAuthHandler:
         :param algorithm: The algorithm used to sign the token
         :type algorithm: str
 
-        :param token_lifetime: The lifetime of the token in seconds
+        :param token_lifetime: The lifetime of the token in minutes
         :type token_lifetime: int
+
+        :param leeway: The clock skew tolerated on exp and iat, in seconds
+        :type leeway: int
         """
 
         self.JWT_SECRET = get_settings().JWT_SECRET_KEY
         self.JWT_ALGORITHM = get_settings().JWT_ALGORITHM
         self.TOKEN_LIFETIME = get_settings().JWT_ACCESS_TOKEN_EXPIRES
-
-    def sign_jwt(self, user_id: str, user_email: str) -> str:
+        self.LEEWAY = get_settings().JWT_LEEWAY
+        self.verified_tokens = VerifiedTokenCache(
+            get_settings().JWT_VERIFIED_CACHE_SIZE
+        )
+        self.key_set: Optional[SigningKeySet] = None
+        if is_asymmetric(self.JWT_ALGORITHM):
+            self.key_set = SigningKeySet(
+                get_settings().JWT_KEYS_DIR,
+                self.JWT_ALGORITHM,
+                get_settings().JWT_SIGNING_KEY_ID,
+            )
+
+    def sign_jwt(
+        self,
+        user_id: str,
+        user_email: str,
+        is_admin: bool = False,
+        email_verified: bool = False,
+        token_version: int = 0,
+    ) -> str:
         """
         This method creates a JWT token with a user_email and expiration date,
         signs it with a secret key, and returns a response with the token.
 
+        The token carries the authorization claims of the account and its
+        token version, so that requests can be authorized from the claims.
+
         :param user_id: The user's ID
         :type user_id: str
 
         :param user_email: The user's email address
         :type user_email: str
 
+        :param is_admin: The account has admin privileges
+        :type is_admin: bool
+
+        :param email_verified: The account email address is verified
+        :type email_verified: bool
+
+        :param token_version: The token version of the account
+        :type token_version: int
+
         :return: The JWT token.
         """
 
+        issued_at = int(time.time())
         payload = {
             "user_id": user_id,
             "user_email": user_email,
-            "expires": str(datetime.now() + timedelta(minutes=self.TOKEN_LIFETIME)),
+            "is_admin": is_admin,
+            "email_verified": email_verified,
+            "token_version": token_version,
+            "jti": uuid.uuid4().hex,
+            "iat": issued_at,
+            "exp": issued_at + self.TOKEN_LIFETIME * 60,
         }
+        if self.key_set is not None:
+            return jwt.encode(
+                payload,
+                self.key_set.signing_key,
+                algorithm=self.JWT_ALGORITHM,
+                headers={"kid": self.key_set.signing_kid},
+            )
+
         token = jwt.encode(payload, self.JWT_SECRET, algorithm=self.JWT_ALGORITHM)
         return token
 
+    def verification_key(self, token: str) -> Any:
+        """
+        This method returns the key verifying the token, the shared secret
+        or the public key matching the kid header of the token.
+
+        :param token: The token to verify
+        :type token: str
+
+        :return: The verification key.
+        """
+
+        if self.key_set is None:
+            return self.JWT_SECRET
+
+        key = self.key_set.verification_key(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise jwt.InvalidKeyError("Unknown signing key.")
+        return key
+
     def decode_jwt(self, token: str) -> Dict[str, Any]:
         """
-        This method checks if the token is valid,
-        return the decoded token, otherwise return an empty dictionary.
+        This method checks if the token is valid and
+        return the decoded token, otherwise raise an exception.
+
+        Tokens that were already verified are served from a cache until
+        they expire, skipping the signature check and payload parsing.
 
         :param token: The token to decode
         :type token: str
 
-        :return: A dictionary of the decoded token | error message.
+        :return: A dictionary of the decoded token.
         """
 
-        decoded_token = jwt.decode(
-            token, self.JWT_SECRET, algorithms=[self.JWT_ALGORITHM]
-        )
-
-        if (
-            datetime.strptime(decoded_token["expires"], "%Y-%m-%d %H:%M:%S.%f")
-            >= datetime.now()
-        ):
+        key = self.verified_tokens.digest(token)
+        decoded_token = self.verified_tokens.get(key)
+        if decoded_token is not None:
             return decoded_token
-        raise HTTPException(403, {"message": "Token invalid."})
+
+        try:
+            decoded_token = jwt.decode(
+                token,
+                self.verification_key(token),
+                algorithms=[self.JWT_ALGORITHM],
+                leeway=self.LEEWAY,
+                options={"require": ["exp", "iat"]},
+            )
+        except jwt.PyJWTError:
+            raise HTTPException(403, {"message": "Invalid token or expired token."})
+
+        self.verified_tokens.set(key, decoded_token)
+        return decoded_token
 
 
 auth_handler = JWTAuthHandler()
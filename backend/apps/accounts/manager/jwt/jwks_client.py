@@ -0,0 +1,156 @@
+# Stdlib Imports
+import re
+import time
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Sequence
+
+# Third Party Imports
+import jwt
+import httpx
+
+
+# Set logger
+logger = logging.getLogger(__name__)
+
+
+class JWKSClient:
+    """
+    Responsible for verifying access tokens in process, for the services
+    consuming them, with the keys published at /.well-known/jwks.json:
+
+    - caching the key set for the max-age of its response
+    - fetching it again, at most once per min_refresh_interval, when a token
+      is signed with an unknown key id (i.e. after a key rotation)
+    - keeping the cached keys when the key set cannot be fetched
+    """
+
+    def __init__(
+        self,
+        url: str,
+        algorithms: Sequence[str] = ("RS256", "EdDSA"),
+        default_max_age: float = 300,
+        min_refresh_interval: float = 30,
+        leeway: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        """
+        This method initializes the client.
+
+        :param url: The url of the key set, e.g. https://api.example.com/.well-known/jwks.json
+        :type url: str
+
+        :param algorithms: The signing algorithms accepted
+        :type algorithms: Sequence[str]
+
+        :param default_max_age: The cache lifetime when the response has no max-age
+        :type default_max_age: float
+
+        :param min_refresh_interval: The seconds between two fetches for unknown keys
+        :type min_refresh_interval: float
+
+        :param leeway: The clock skew tolerated on exp and iat, in seconds
+        :type leeway: int
+
+        :param client: The http client to fetch the key set with
+        :type client: httpx.AsyncClient
+        """
+
+        self.url = url
+        self.algorithms = list(algorithms)
+        self.default_max_age = default_max_age
+        self.min_refresh_interval = min_refresh_interval
+        self.leeway = leeway
+        self.client = client or httpx.AsyncClient(timeout=5)
+        self.keys: Dict[str, Any] = {}
+        self.etag: Optional[str] = None
+        self.expires_at = 0.0
+        self.fetched_at = 0.0
+        self.lock = asyncio.Lock()
+
+    def max_age(self, response: httpx.Response) -> float:
+        match = re.search(r"max-age=(\d+)", response.headers.get("cache-control", ""))
+        return float(match.group(1)) if match else self.default_max_age
+
+    async def fetch(self) -> None:
+        """
+        This method fetches the key set, revalidating the cached one with its ETag.
+        """
+
+        headers = {"If-None-Match": self.etag} if self.etag and self.keys else {}
+        response = await self.client.get(self.url, headers=headers)
+        self.fetched_at = time.monotonic()
+
+        if response.status_code != 304:
+            response.raise_for_status()
+            self.keys = {
+                jwk["kid"]: jwt.PyJWK(jwk).key
+                for jwk in response.json()["keys"]
+                if jwk.get("alg") in self.algorithms
+            }
+            self.etag = response.headers.get("etag")
+        self.expires_at = self.fetched_at + self.max_age(response)
+
+    async def refresh(self, stale_before: float) -> None:
+        # concurrent callers wait for a single fetch
+        async with self.lock:
+            if self.fetched_at > stale_before:
+                return
+            try:
+                await self.fetch()
+            except (httpx.HTTPError, ValueError, KeyError, jwt.PyJWTError):
+                if not self.keys:
+                    raise
+                logger.warning("Could not refresh %s, keeping cached keys.", self.url)
+
+    async def get_key(self, kid: Optional[str]) -> Any:
+        """
+        This method returns the public key of the key id, fetching the
+        key set when it expired or does not know the key id.
+
+        :param kid: The key id, from the token header
+        :type kid: str
+
+        :return: The public key.
+        """
+
+        now = time.monotonic()
+        if now >= self.expires_at:
+            await self.refresh(stale_before=now)
+        elif (
+            kid not in self.keys and now - self.fetched_at >= self.min_refresh_interval
+        ):
+            await self.refresh(stale_before=now - self.min_refresh_interval)
+
+        key = self.keys.get(kid)
+        if key is None:
+            raise jwt.InvalidKeyError(f"Unknown signing key {kid!r}.")
+        return key
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """
+        This method verifies the token and returns its claims.
+
+        :param token: The access token
+        :type token: str
+
+        :raises jwt.PyJWTError: The token is invalid or expired
+
+        :return: The token claims.
+        :rtype: dict
+        """
+
+        header = jwt.get_unverified_header(token)
+        if header.get("alg") not in self.algorithms:
+            raise jwt.InvalidAlgorithmError("The algorithm is not allowed.")
+
+        return jwt.decode(
+            token,
+            await self.get_key(header.get("kid")),
+            algorithms=[header["alg"]],
+            leeway=self.leeway,
+            options={"require": ["exp", "iat"]},
+        )
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
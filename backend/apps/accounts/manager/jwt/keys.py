@@ -0,0 +1,102 @@
+# Stdlib Imports
+import os
+import json
+import hashlib
+from typing import Any, Dict, Optional, Tuple
+
+# Third Party Imports
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+
+
+# Algorithms signing with a key pair, and how to export their public keys
+ASYMMETRIC_ALGORITHMS = {
+    "RS256": RSAAlgorithm,
+    "RS384": RSAAlgorithm,
+    "RS512": RSAAlgorithm,
+    "EdDSA": OKPAlgorithm,
+}
+
+
+def is_asymmetric(algorithm: str) -> bool:
+    return algorithm in ASYMMETRIC_ALGORITHMS
+
+
+class SigningKeySet:
+    """
+    Responsible for the following:
+
+    - loading the key pairs of an asymmetric algorithm from a directory,
+      one PEM file per key named after its key id (kid)
+    - picking the key tokens are signed with, the others only verify tokens
+    - exporting the public keys as a JSON Web Key Set
+
+    Keys are rotated by adding the new key file, which publishes it, and
+    switching the signing key id once the consumers of the key set have
+    refreshed it. The previous key file can be removed, or replaced by its
+    public key, once the tokens it signed have expired.
+    """
+
+    def __init__(self, directory: str, algorithm: str, signing_kid: str) -> None:
+        """
+        This method loads the keys.
+
+        :param directory: The directory of the PEM files, private or public keys
+        :type directory: str
+
+        :param algorithm: The signing algorithm, e.g. RS256 or EdDSA
+        :type algorithm: str
+
+        :param signing_kid: The id of the key tokens are signed with
+        :type signing_kid: str
+        """
+
+        self.algorithm = algorithm
+        self.signing_kid = signing_kid
+        self.private_keys: Dict[str, Any] = {}
+        self.public_keys: Dict[str, Any] = {}
+
+        for name in sorted(os.listdir(directory)):
+            kid, extension = os.path.splitext(name)
+            if extension != ".pem":
+                continue
+            with open(os.path.join(directory, name), "rb") as pem:
+                private_key, public_key = self.load_pem(pem.read())
+            if private_key is not None:
+                self.private_keys[kid] = private_key
+            self.public_keys[kid] = public_key
+
+        if signing_kid not in self.private_keys:
+            raise ValueError(
+                f"No private key for the signing key id {signing_kid!r} in {directory}"
+            )
+
+        self.jwks = self.build_jwks()
+        self.jwks_body = json.dumps(self.jwks, separators=(",", ":")).encode()
+        self.jwks_etag = f'"{hashlib.sha256(self.jwks_body).hexdigest()[:32]}"'
+
+    @staticmethod
+    def load_pem(data: bytes) -> Tuple[Optional[Any], Any]:
+        if b"PRIVATE KEY" in data:
+            private_key = load_pem_private_key(data, password=None)
+            return private_key, private_key.public_key()
+        return None, load_pem_public_key(data)
+
+    @property
+    def signing_key(self) -> Any:
+        return self.private_keys[self.signing_kid]
+
+    def verification_key(self, kid: Optional[str]) -> Optional[Any]:
+        return self.public_keys.get(kid)
+
+    def build_jwks(self) -> Dict[str, Any]:
+        exporter = ASYMMETRIC_ALGORITHMS[self.algorithm]
+        keys = []
+        for kid, public_key in self.public_keys.items():
+            jwk = json.loads(exporter.to_jwk(public_key))
+            jwk.update({"kid": kid, "alg": self.algorithm, "use": "sig"})
+            keys.append(jwk)
+        return {"keys": keys}
@@ -0,0 +1,304 @@
+# Stdlib Imports
+import math
+import time
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+
+# FastAPI Imports
+from fastapi import HTTPException, Request, status
+
+# Own Imports
+from config.database import engine
+from config.secrets import get_settings
+from apps.accounts.models.accounts import RateLimitBucket
+
+# Third Party Imports
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+
+# Set settings
+settings = get_settings()
+
+# Set logger
+logger = logging.getLogger(__name__)
+
+# Number of times a contended bucket update is retried on the shared backend
+CAS_ATTEMPTS = 3
+
+
+def parse_rate(rate: str) -> Tuple[int, float]:
+    """
+    Parses a rate written as "<requests>/<seconds>", e.g. "5/60".
+
+    :return: The bucket capacity and the seconds it takes to refill.
+    :rtype: tuple
+    """
+
+    capacity, period = rate.split("/")
+    return int(capacity), float(period)
+
+
+def take_token(
+    tokens: float, updated_at: float, now: float, capacity: int, period: float
+) -> Tuple[float, float]:
+    """
+    Refills the bucket for the time elapsed since its last update and
+    takes a token from it.
+
+    :return: The tokens left, and the seconds to wait when the bucket is empty.
+    :rtype: tuple
+    """
+
+    rate = capacity / period
+    tokens = min(capacity, tokens + (now - updated_at) * rate)
+    if tokens < 1:
+        return tokens, (1 - tokens) / rate
+    return tokens - 1, 0.0
+
+
+class MemoryRateLimitBackend:
+    """
+    Keeps the token buckets in the worker's memory. Each worker enforces
+    the limits on its own, so the effective limit is multiplied by the
+    number of workers.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        """
+        This method initializes the backend.
+
+        :param max_keys: The number of buckets kept, least recently used first out
+        :type max_keys: int
+        """
+
+        self.max_keys = max_keys
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def consume(self, key: str, capacity: int, period: float) -> float:
+        """
+        This method takes a token from the bucket of the key.
+
+        :return: The seconds to wait before retrying, 0 when allowed.
+        :rtype: float
+        """
+
+        now = time.monotonic()
+        tokens, updated_at = self.buckets.get(key, (capacity, now))
+        tokens, retry_after = take_token(tokens, updated_at, now, capacity, period)
+
+        self.buckets[key] = (tokens, now)
+        self.buckets.move_to_end(key)
+        while len(self.buckets) > self.max_keys:
+            # evicted buckets start over full, which only loosens the limit
+            self.buckets.popitem(last=False)
+        return retry_after
+
+    def size(self) -> int:
+        return len(self.buckets)
+
+
+class MongoRateLimitBackend:
+    """
+    Keeps the token buckets in MongoDB, shared by every worker. Buckets are
+    updated with a compare and set on their previous state, and expire
+    through a ttl index once they would be full again.
+    """
+
+    async def consume(self, key: str, capacity: int, period: float) -> float:
+        """
+        This method takes a token from the bucket of the key.
+
+        :return: The seconds to wait before retrying, 0 when allowed.
+        :rtype: float
+        """
+
+        collection = engine.get_collection(RateLimitBucket)
+        for _ in range(CAS_ATTEMPTS):
+            now = time.time()
+            expires_at = datetime.utcnow() + timedelta(seconds=period)
+            document = await collection.find_one({"_id": key})
+
+            if document is None:
+                tokens, retry_after = take_token(capacity, now, now, capacity, period)
+                if retry_after:
+                    return retry_after
+                try:
+                    await collection.insert_one(
+                        {
+                            "_id": key,
+                            "tokens": tokens,
+                            "updated_at": now,
+                            "expires_at": expires_at,
+                        }
+                    )
+                    return 0.0
+                except DuplicateKeyError:
+                    continue  # created concurrently, retry on its state
+
+            tokens, retry_after = take_token(
+                document["tokens"], document["updated_at"], now, capacity, period
+            )
+            if retry_after:
+                return retry_after
+
+            result = await collection.update_one(
+                {
+                    "_id": key,
+                    "tokens": document["tokens"],
+                    "updated_at": document["updated_at"],
+                },
+                {
+                    "$set": {
+                        "tokens": tokens,
+                        "updated_at": now,
+                        "expires_at": expires_at,
+                    }
+                },
+            )
+            if result.modified_count:
+                return 0.0
+
+        # still contended, admit the request rather than fail it
+        return 0.0
+
+    def size(self) -> int:
+        return 0
+
+
+class RateLimiter:
+    """
+    Responsible for the following:
+
+    - admitting requests against per ip and per email token buckets
+    - rejecting requests over the limit with 429 and a Retry-After header
+    - letting requests through when the shared backend is unavailable
+    """
+
+    def __init__(
+        self,
+        backend: Union[MemoryRateLimitBackend, MongoRateLimitBackend],
+        enabled: bool = True,
+    ) -> None:
+        """
+        This method initializes the rate limiter.
+
+        :param backend: The backend keeping the token buckets
+        :type backend: MemoryRateLimitBackend | MongoRateLimitBackend
+
+        :param enabled: Enforce the limits
+        :type enabled: bool
+        """
+
+        self.backend = backend
+        self.enabled = enabled
+        self.allowed = 0
+        self.rejected = 0
+        self.errors = 0
+
+    async def hit(self, key: str, rate: str) -> None:
+        """
+        This method takes a token from the bucket of the key, raising
+        when the bucket is empty.
+
+        :param key: The bucket key, e.g. "login:ip:127.0.0.1"
+        :type key: str
+
+        :param rate: The limit, as "<requests>/<seconds>"
+        :type rate: str
+        """
+
+        capacity, period = parse_rate(rate)
+        try:
+            retry_after = await self.backend.consume(key, capacity, period)
+        except PyMongoError:
+            self.errors += 1
+            logger.exception("Rate limit backend failed, admitting %s.", key)
+            return
+
+        if retry_after:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail={"message": "Too many requests. Please try again later."},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        self.allowed += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        This method returns the rate limiter counters.
+
+        :return: The allowed, rejected and failed checks, and the buckets kept.
+        :rtype: dict
+        """
+
+        return {
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "buckets": self.backend.size(),
+        }
+
+
+def client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def request_email(request: Request) -> Optional[str]:
+    """
+    Reads the email of the request body. The body is cached by the
+    request, so the endpoint does not read it again.
+    """
+
+    try:
+        payload = await request.json()
+    except ValueError:
+        return None
+    email = payload.get("email") if isinstance(payload, dict) else None
+    return email.strip().lower() if isinstance(email, str) else None
+
+
+def rate_limit(
+    scope: str, per_ip: str, per_email: Optional[str] = None
+) -> Callable[[Request], Awaitable[None]]:
+    """
+    Returns a dependency limiting the route per client ip and per email
+    of the request body. Dependencies run before the endpoint, so
+    rejected requests never reach bcrypt or the database.
+
+    Args:
+        scope (str): the name of the limit, routes sharing it share buckets
+        per_ip (str): the limit per client ip, as "<requests>/<seconds>"
+        per_email (str): the limit per email, as "<requests>/<seconds>"
+
+    Returns:
+        Callable: the dependency
+    """
+
+    async def dependency(request: Request) -> None:
+        if not rate_limiter.enabled:
+            return
+
+        await rate_limiter.hit(f"{scope}:ip:{client_ip(request)}", per_ip)
+        if per_email:
+            email = await request_email(request)
+            if email:
+                await rate_limiter.hit(f"{scope}:email:{email}", per_email)
+
+    return dependency
+
+
+rate_limiter = RateLimiter(
+    backend=(
+        MongoRateLimitBackend()
+        if settings.RATE_LIMIT_BACKEND == "mongodb"
+        else MemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+    ),
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
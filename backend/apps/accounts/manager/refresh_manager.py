@@ -0,0 +1,106 @@
+# Stdlib Imports
+import abc
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+
+# Set logger
+logger = logging.getLogger(__name__)
+
+# Documents stamped this long before the previous refresh are fetched again.
+# The stamps are written with the clock of the host that changed them, which
+# can be behind the clock of the refreshing host
+REFRESH_OVERLAP = timedelta(seconds=30)
+
+
+class RefreshingMirror(abc.ABC):
+    """
+    Base of the per worker mirrors of a collection, responsible for:
+
+    - loading the mirror on startup and refreshing it in the background
+      every refresh interval
+    - the cursor of the refreshes, fetching the documents stamped since
+      the previous refresh
+
+    Subclasses implement fetch().
+    """
+
+    # What the mirror holds, in log messages
+    description = "mirror"
+
+    def __init__(self, refresh_interval: float) -> None:
+        """
+        This method initializes the mirror.
+
+        :param refresh_interval: The seconds between two refreshes
+        :type refresh_interval: float
+        """
+
+        self.refresh_interval = refresh_interval
+        self.refreshed_at: Optional[datetime] = None
+        self.task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+
+    @property
+    def since(self) -> Optional[datetime]:
+        """The stamp of the documents to fetch from, None on the first refresh."""
+
+        if self.refreshed_at is None:
+            return None
+        return self.refreshed_at - REFRESH_OVERLAP
+
+    @abc.abstractmethod
+    async def fetch(self, since: Optional[datetime], now: datetime) -> None:
+        """
+        This method updates the mirror with the documents stamped since
+        the given time, or with every current document when it is None.
+
+        :param since: The stamp of the documents to fetch from
+        :type since: datetime
+
+        :param now: The time of the refresh
+        :type now: datetime
+        """
+
+    async def refresh(self) -> None:
+        """
+        This method fetches the documents stamped since the previous refresh.
+        """
+
+        now = datetime.utcnow()
+        await self.fetch(self.since, now)
+        self.refreshed_at = now
+        self.refreshes += 1
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Could not refresh the %s.", self.description)
+
+    async def start(self) -> None:
+        """
+        This method loads the mirror and refreshes it in the background.
+        It is called on application startup.
+        """
+
+        await self.refresh()
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    async def shutdown(self) -> None:
+        """
+        This method stops the background refresh. It is called on application shutdown.
+        """
+
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
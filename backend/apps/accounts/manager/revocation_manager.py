@@ -0,0 +1,115 @@
+# Stdlib Imports
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+# Own Imports
+from config.database import engine
+from config.secrets import get_settings
+from apps.accounts.models.accounts import RevokedToken
+from apps.accounts.manager.refresh_manager import RefreshingMirror
+
+
+# Set settings
+settings = get_settings()
+
+
+class RevokedTokenSet(RefreshingMirror):
+    """
+    Responsible for the following:
+
+    - mirroring per worker the ids (jti) of the revoked access tokens
+      that have not expired yet, from the ttl indexed revoked_tokens collection
+    - recording revocations in the collection and in the set at once
+    - refreshing the set every refresh interval, for tokens revoked on
+      other workers
+    """
+
+    description = "revoked tokens"
+
+    def __init__(self, refresh_interval: float) -> None:
+        """
+        This method initializes the set.
+
+        :param refresh_interval: The seconds between two refreshes
+        :type refresh_interval: float
+        """
+
+        super().__init__(refresh_interval)
+        self.tokens: Dict[str, datetime] = {}
+        self.rejected = 0
+
+    def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        """
+        This method checks if the token of the claims was revoked.
+
+        :param claims: The verified token claims
+        :type claims: dict
+
+        :return: The token was revoked.
+        :rtype: bool
+        """
+
+        if claims.get("jti") not in self.tokens:
+            return False
+
+        self.rejected += 1
+        return True
+
+    async def revoke(self, claims: Dict[str, Any]) -> None:
+        """
+        This method revokes an access token until it expires.
+
+        :param claims: The verified token claims
+        :type claims: dict
+        """
+
+        if "jti" not in claims:
+            return
+
+        now = datetime.utcnow()
+        expires_at = datetime.utcfromtimestamp(claims["exp"]) + timedelta(
+            seconds=settings.JWT_LEEWAY
+        )
+        self.tokens[claims["jti"]] = expires_at
+        await engine.get_collection(RevokedToken).update_one(
+            {"_id": claims["jti"]},
+            {"$setOnInsert": {"expires_at": expires_at, "date_created": now}},
+            upsert=True,
+        )
+
+    async def fetch(self, since: Optional[datetime], now: datetime) -> None:
+        """
+        This method fetches the tokens revoked since the previous refresh,
+        all of the unexpired ones on the first refresh, and forgets the
+        expired ones.
+        """
+
+        query = {"expires_at": {"$gt": now}}
+        if since is not None:
+            query = {"date_created": {"$gte": since}}
+
+        async for document in engine.get_collection(RevokedToken).find(query):
+            self.tokens[document["_id"]] = document["expires_at"]
+
+        for jti, expires_at in list(self.tokens.items()):
+            if expires_at <= now:
+                del self.tokens[jti]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        This method returns the size of the set and its counters.
+
+        :return: The revoked tokens tracked, refreshes and rejected tokens.
+        :rtype: dict
+        """
+
+        return {
+            "size": len(self.tokens),
+            "refreshes": self.refreshes,
+            "rejected": self.rejected,
+        }
+
+
+revoked_tokens = RevokedTokenSet(
+    refresh_interval=settings.JWT_REVOCATION_REFRESH_INTERVAL
+)
@@ -1,5 +1,6 @@
 # Stdlib Imports
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Any, Dict, Optional
 
 # FastAPI Imports
 from fastapi import HTTPException, status
@@ -8,52 +9,192 @@ from fastapi import HTTPException, status
 from config.secrets import get_settings
 from apps.accounts.manager.utils import generate_otp_code
 from apps.accounts.manager.jwt.handler import auth_handler
-from apps.accounts.manager.email_manager import EmailManager
+from apps.jobs.manager.queue_manager import enqueue_job
 from apps.accounts.manager.bcrypt_manager import bcrypt_hasher
+from apps.accounts.manager.email_filter_manager import email_filter
+from apps.accounts.manager.revocation_manager import revoked_tokens
 from apps.accounts.manager.db_manager import (
     get_user_account_by_email,
     update_user_account,
     create_user_otp_timeout,
     update_user_otp_timeout,
-    get_user_otp_timeout,
-    update_otp_timeout,
+    verify_user_otp,
+    create_refresh_token,
+    rotate_refresh_token,
+    revoke_refresh_token,
 )
+from apps.accounts.models.accounts import User
+
+# Third Party Imports
+from bson import ObjectId
 
 
 # Initialize environment variables
 settings = get_settings()
 
 
-async def login_user_account(email: str, password: str) -> str:
-    """Responsible for authenticating an user account
+async def send_recovery_email(first_name: str, email: str, otp_code: str):
+    """Queues the account recovery email, which is sent by the job worker.
 
     Args:
-        email (str): user account email
-        password (str): user account password (raw)
+        first_name (str): the account first name
+        email (str): the account email address
+        otp_code (str): the otp code
+    """
+
+    await enqueue_job(
+        "send_email",
+        {
+            "receiver_email": email,
+            "subject": "[ACCOUNT RECOVERY]: Confirmation of Account Ownership",
+            "content": f"Hello {first_name},\n\nKindly use the OTP code ({otp_code}) to recover your account",
+            "provider": "mailtrap",
+        },
+    )
+
+
+async def get_registered_account(email: str) -> User:
+    """Gets an user account by email, answering emails the registered email
+    filter has never seen without looking them up.
+
+    Args:
+        email (str): the user account email
 
     Raises:
         HTTPException: (404) Account does not exist
-        HTTPException: (401) Invalid credentials
 
     Returns:
-        str: the signed jwt token
+        User: the user account
     """
 
-    account = await get_user_account_by_email(email)
+    account = None
+    if email_filter.may_exist(email):
+        account = await get_user_account_by_email(email)
+        if account is None:
+            email_filter.record_false_positive()
+
     if account is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account does not exist",
         )
+    return account
+
+
+async def issue_tokens(
+    user_id: ObjectId,
+    user_email: str,
+    is_admin: bool,
+    email_verified: bool,
+    token_version: int,
+    family_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Responsible for issuing an access token and the refresh token renewing it.
+
+    Args:
+        user_id (ObjectId): the user account id
+        user_email (str): the user email address
+        is_admin (bool): the account has admin privileges
+        email_verified (bool): the account email address is verified
+        token_version (int): the token version of the account
+        family_id (str): the rotation chain of the refresh token
+
+    Returns:
+        dict: the access token, its lifetime in seconds and the refresh token
+    """
 
-    if not bcrypt_hasher.check_password(password, account.password):
+    claims = {
+        "is_admin": is_admin,
+        "email_verified": email_verified,
+        "token_version": token_version,
+    }
+    return {
+        "token": auth_handler.sign_jwt(str(user_id), user_email, **claims),
+        "token_type": "bearer",
+        "expires_in": settings.JWT_ACCESS_TOKEN_EXPIRES * 60,
+        "refresh_token": await create_refresh_token(
+            user_id, user_email, family_id=family_id, **claims
+        ),
+    }
+
+
+async def login_user_account(email: str, password: str) -> Dict[str, Any]:
+    """Responsible for authenticating an user account
+
+    Args:
+        email (str): user account email
+        password (str): user account password (raw)
+
+    Raises:
+        HTTPException: (404) Account does not exist
+        HTTPException: (401) Invalid credentials
+
+    Returns:
+        dict: the signed jwt token and a refresh token
+    """
+
+    account = await get_registered_account(email)
+
+    if not await bcrypt_hasher.acheck_password(password, account.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
-    jwt_token = auth_handler.sign_jwt(str(account.id), account.primary_email)
-    return jwt_token
+    return await issue_tokens(
+        account.id,
+        account.primary_email,
+        is_admin=account.is_admin,
+        email_verified=account.email_verified,
+        token_version=account.token_version,
+    )
+
+
+async def refresh_user_tokens(refresh_token: str) -> Dict[str, Any]:
+    """Responsible for renewing the tokens of an user account, rotating the
+    refresh token. It costs two indexed lookups instead of a password check.
+
+    Args:
+        refresh_token (str): the refresh token
+
+    Raises:
+        HTTPException: (401) Invalid or expired refresh token
+
+    Returns:
+        dict: the signed jwt token and the next refresh token
+    """
+
+    stored = await rotate_refresh_token(refresh_token)
+    if stored is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+        )
+
+    return await issue_tokens(
+        stored.user_id,
+        stored.user_email,
+        is_admin=stored.is_admin,
+        email_verified=stored.email_verified,
+        token_version=stored.token_version,
+        family_id=stored.family_id,
+    )
+
+
+async def logout_user_account(
+    claims: Dict[str, Any], refresh_token: Optional[str] = None
+) -> None:
+    """Responsible for revoking the access token of the request, and the
+    refresh token issued with it when given.
+
+    Args:
+        claims (dict): the verified claims of the access token
+        refresh_token (str): the refresh token to revoke
+    """
+
+    await revoked_tokens.revoke(claims)
+    if refresh_token:
+        await revoke_refresh_token(refresh_token, ObjectId(claims["user_id"]))
 
 
 async def recover_user_account(email: str) -> bool:
@@ -63,29 +204,19 @@ async def recover_user_account(email: str) -> bool:
         email (str): the account email address
 
     Returns:
-        bool: confirmation that email was sent
+        bool: confirmation that email was queued
     """
 
-    account = await get_user_account_by_email(email)
-    if account is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Account does not exist",
-        )
+    account = await get_registered_account(email)
 
-    em = EmailManager(email)
     otp_code = generate_otp_code()
 
     # Create otp timeout for user account
-    await create_user_otp_timeout(otp_code, email)
+    await create_user_otp_timeout(otp_code, email, account.id)
 
-    # Send account recover email to user
-    sent = await em.send(
-        subject="[ACCOUNT RECOVERY]: Confirmation of Account Ownership",
-        content=f"Hello {account.first_name},\n\nKindly use the OTP code ({otp_code}) to recover your account",
-        provider="mailtrap",
-    )
-    return sent
+    # Queue account recover email to user
+    await send_recovery_email(account.first_name, email, otp_code)
+    return True
 
 
 async def resend_otp_code(email: str) -> bool:
@@ -95,29 +226,19 @@ async def resend_otp_code(email: str) -> bool:
         email (str): the account email address
 
     Returns:
-        bool: confirmation that email was sent
+        bool: confirmation that email was queued
     """
 
-    account = await get_user_account_by_email(email)
-    if account is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Account does not exist",
-        )
+    account = await get_registered_account(email)
 
-    em = EmailManager(email)
     otp_code = generate_otp_code()
 
     # Update otp timeout for user account
     await update_user_otp_timeout(otp_code, email)
 
-    # Send account recover email to user
-    sent = await em.send(
-        subject="[ACCOUNT RECOVERY]: Confirmation of Account Ownership",
-        content=f"Hello {account.first_name},\n\nKindly use the OTP code ({otp_code}) to recover your account",
-        provider="mailtrap",
-    )
-    return sent
+    # Queue account recover email to user
+    await send_recovery_email(account.first_name, email, otp_code)
+    return True
 
 
 async def verify_otp_code(email: str, otp_code: str) -> bool:
@@ -131,23 +252,7 @@ async def verify_otp_code(email: str, otp_code: str) -> bool:
         bool: otp is verified
     """
 
-    ngo_otp_timeout = await get_user_otp_timeout(email)
-
-    otp_expiry_datetime = ngo_otp_timeout.date_modified + timedelta(
-        minutes=settings.EMAIL_OTP_TIMEOUT
-    )
-    current_datetime = datetime.now().time()
-
-    if current_datetime > otp_expiry_datetime.time():
-        return False
-
-    if otp_code != ngo_otp_timeout.otp_code:
-        return False
-
-    await update_otp_timeout(
-        email, **{"otp_verified": True, "date_modified": datetime.utcnow()}
-    )
-    return True
+    return await verify_user_otp(email, otp_code, settings.EMAIL_OTP_TIMEOUT)
 
 
 async def complete_recover_account(email: str, password: str):
@@ -161,16 +266,14 @@ async def complete_recover_account(email: str, password: str):
         str: _description_
     """
 
-    ngo_account = await get_user_account_by_email(email)
+    # Hash new password and update account
+    hashed_password = await bcrypt_hasher.ahash_password(password)
+    ngo_account = await update_user_account(
+        email,
+        **{"password": hashed_password, "date_modified": datetime.utcnow()},
+    )
     if ngo_account is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account does not exist",
         )
-
-    # Hash new password and update account
-    hashed_password = bcrypt_hasher.hash_password(password)
-    await update_user_account(
-        email,
-        **{"password": hashed_password, "date_modified": datetime.utcnow()},
-    )
@@ -0,0 +1,122 @@
+# Stdlib Imports
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+# Own Imports
+from config.database import engine
+from config.secrets import get_settings
+from apps.accounts.models.accounts import User
+from apps.accounts.manager.refresh_manager import RefreshingMirror
+
+
+# Set settings
+settings = get_settings()
+
+
+class TokenVersionRegistry(RefreshingMirror):
+    """
+    Responsible for the following:
+
+    - keeping per worker the token version of the accounts whose version
+      was bumped (e.g. on a password change) within the lifetime of a token,
+      older bumps only concern tokens that already expired
+    - refreshing it from the users collection every refresh interval
+    - rejecting token claims carrying an older token version
+    """
+
+    description = "token versions"
+
+    def __init__(self, refresh_interval: float, token_lifetime: timedelta) -> None:
+        """
+        This method initializes the registry.
+
+        :param refresh_interval: The seconds between two refreshes
+        :type refresh_interval: float
+
+        :param token_lifetime: The lifetime of a token, leeway included
+        :type token_lifetime: timedelta
+        """
+
+        super().__init__(refresh_interval)
+        self.token_lifetime = token_lifetime
+        self.versions: Dict[str, Tuple[int, datetime]] = {}
+        self.rejected = 0
+
+    def set(self, user_id: str, version: int, changed_at: datetime) -> None:
+        """
+        This method records the token version of an account.
+
+        :param user_id: The user's ID
+        :type user_id: str
+
+        :param version: The current token version of the account
+        :type version: int
+
+        :param changed_at: When the version was bumped
+        :type changed_at: datetime
+        """
+
+        current = self.versions.get(user_id)
+        if current is None or current[0] < version:
+            self.versions[user_id] = (version, changed_at)
+
+    def is_current(self, claims: Dict[str, Any]) -> bool:
+        """
+        This method checks that the token version of the claims was not bumped.
+
+        :param claims: The verified token claims
+        :type claims: dict
+
+        :return: The claims are current.
+        :rtype: bool
+        """
+
+        entry = self.versions.get(claims["user_id"])
+        if entry is None or claims.get("token_version", 0) >= entry[0]:
+            return True
+
+        self.rejected += 1
+        return False
+
+    async def fetch(self, since: Optional[datetime], now: datetime) -> None:
+        """
+        This method fetches the accounts whose token version changed since
+        the previous refresh, and forgets the bumps older than a token.
+        """
+
+        expired = now - self.token_lifetime
+        async for document in engine.get_collection(User).find(
+            {"token_version_changed_at": {"$gte": max(since or expired, expired)}},
+            {"token_version": 1, "token_version_changed_at": 1},
+        ):
+            self.set(
+                str(document["_id"]),
+                document["token_version"],
+                document["token_version_changed_at"],
+            )
+
+        for user_id, (_, changed_at) in list(self.versions.items()):
+            if changed_at < expired:
+                del self.versions[user_id]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        This method returns the size of the registry and its counters.
+
+        :return: The accounts tracked, refreshes and rejected tokens.
+        :rtype: dict
+        """
+
+        return {
+            "size": len(self.versions),
+            "refreshes": self.refreshes,
+            "rejected": self.rejected,
+        }
+
+
+token_versions = TokenVersionRegistry(
+    refresh_interval=settings.JWT_TOKEN_VERSION_REFRESH_INTERVAL,
+    token_lifetime=timedelta(
+        minutes=settings.JWT_ACCESS_TOKEN_EXPIRES, seconds=settings.JWT_LEEWAY
+    ),
+)
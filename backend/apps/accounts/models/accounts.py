@@ -1,32 +1,113 @@
 # Stdlib Imports
 from datetime import datetime
+from typing import Optional
+
+# Own Imports
+from config.secrets import get_settings
 
 # Third Party Imports
 from pydantic import EmailStr
-from odmantic import Field, Model, Reference
+from odmantic import Field, Model, ObjectId
+from pymongo import ASCENDING, IndexModel
+
+
+# Set settings
+settings = get_settings()
 
 
 class User(Model):
     first_name: str
     last_name: str
-    primary_email: EmailStr = Field(index=True)
+    primary_email: EmailStr = Field(unique=True)
     email_verified: bool = Field(default=False)
     password: str = Field()
     is_admin: bool = Field(default=False)
+    version: int = Field(default=0)
+    token_version: int = Field(default=0)
+    token_version_changed_at: Optional[datetime] = Field(default=None)
     # add more fields
     date_created: datetime
-    date_modified: datetime = Field(default=datetime.utcnow())
+    date_modified: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
         collection = "users"
 
+        @staticmethod
+        def indexes():
+            # Find the accounts whose tokens were recently revoked
+            yield IndexModel([("token_version_changed_at", ASCENDING)])
+
 
 class OTPTimeout(Model):
-    user: User = Reference()
+    email: EmailStr = Field(unique=True)
+    user_id: ObjectId
     otp_code: str
     otp_verified: bool = Field(default=False)
     date_created: datetime
-    date_modified: datetime = Field(default=datetime.utcnow())
+    date_modified: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        collection = "otps"
+
+        @staticmethod
+        def indexes():
+            # Expire otps once they can no longer be verified
+            yield IndexModel(
+                [("date_modified", ASCENDING)],
+                expireAfterSeconds=settings.EMAIL_OTP_TIMEOUT * 60,
+            )
+
+
+class RefreshToken(Model):
+    token_hash: str = Field(primary_field=True)
+    family_id: str
+    user_id: ObjectId
+    user_email: EmailStr
+    is_admin: bool = Field(default=False)
+    email_verified: bool = Field(default=False)
+    token_version: int = Field(default=0)
+    revoked: bool = Field(default=False)
+    expires_at: datetime
+    date_created: datetime
 
     class Config:
-        collection = "otp_timeouts"
+        collection = "refresh_tokens"
+
+        @staticmethod
+        def indexes():
+            # Drop refresh tokens once they expire
+            yield IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
+            # Revoke the refresh tokens of an account or of a rotation chain
+            yield IndexModel([("user_email", ASCENDING)])
+            yield IndexModel([("family_id", ASCENDING)])
+
+
+class RevokedToken(Model):
+    jti: str = Field(primary_field=True)
+    expires_at: datetime
+    date_created: datetime
+
+    class Config:
+        collection = "revoked_tokens"
+
+        @staticmethod
+        def indexes():
+            # Drop revoked access tokens once they expire anyway
+            yield IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
+            # Find the tokens revoked since the previous refresh
+            yield IndexModel([("date_created", ASCENDING)])
+
+
+class RateLimitBucket(Model):
+    key: str = Field(primary_field=True)
+    tokens: float
+    updated_at: float
+    expires_at: datetime
+
+    class Config:
+        collection = "rate_limits"
+
+        @staticmethod
+        def indexes():
+            # Drop buckets once they would be full again
+            yield IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
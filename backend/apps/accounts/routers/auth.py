@@ -1,21 +1,29 @@
 # Stdlib Imports
-import json
+from typing import Any, Dict, Optional
 
 # FastAPI Imports
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends
 
 # Own Imports
+from config.secrets import get_settings
+from config.responses import FastJSONResponse
 from apps.accounts.dto.users_dto import (
     UserCreateDTO,
     UserLoginDTO,
     UserAccountRecoverDTO,
     UserAccountRecoverConfirmDTO,
     UserAccountRecoverCompleteDTO,
+    UserAuthDTO,
+    UserTokenRefreshDTO,
+    UserLogoutDTO,
 )
+from apps.accounts.manager.deps import get_current_auth_user, get_current_claims
 from apps.accounts.manager.db_manager import setup_user_account
+from apps.accounts.manager.rate_limit_manager import rate_limit
 from apps.accounts.manager.service_manager import (
     login_user_account,
+    refresh_user_tokens,
+    logout_user_account,
     recover_user_account,
     resend_otp_code,
     verify_otp_code,
@@ -23,12 +31,37 @@ from apps.accounts.manager.service_manager import (
 )
 
 
+# Set settings
+settings = get_settings()
+
 # initialize api router
 router = APIRouter(tags=["Users (auth)"], prefix="/users")
 
+# limit the routes running bcrypt, sending emails or checking otp codes,
+# per ip and per email
+register_limit = rate_limit("register", settings.RATE_LIMIT_REGISTER_PER_IP)
+login_limit = rate_limit(
+    "login", settings.RATE_LIMIT_LOGIN_PER_IP, settings.RATE_LIMIT_LOGIN_PER_EMAIL
+)
+recover_limit = rate_limit(
+    "recover",
+    settings.RATE_LIMIT_RECOVER_PER_IP,
+    settings.RATE_LIMIT_RECOVER_PER_EMAIL,
+)
+recover_verify_limit = rate_limit(
+    "recover_verify",
+    settings.RATE_LIMIT_RECOVER_PER_IP,
+    settings.RATE_LIMIT_RECOVER_PER_EMAIL,
+)
+recover_complete_limit = rate_limit(
+    "recover_complete",
+    settings.RATE_LIMIT_RECOVER_PER_IP,
+    settings.RATE_LIMIT_RECOVER_PER_EMAIL,
+)
+
 
-@router.post("/register/")
-async def create_account(payload: UserCreateDTO) -> JSONResponse:
+@router.post("/register/", dependencies=[Depends(register_limit)])
+async def create_account(payload: UserCreateDTO) -> FastJSONResponse:
     """API Router responsible for creating a new user account.
 
     Args:
@@ -39,31 +72,81 @@ async def create_account(payload: UserCreateDTO) -> JSONResponse:
     """
 
     ngo_account = await setup_user_account(payload)
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "message": "Account created successfully",
-            "data": json.loads(ngo_account.json()),
+            "data": ngo_account,
         }
     )
 
 
-@router.post("/login/")
-async def login_account(payload: UserLoginDTO) -> JSONResponse:
+@router.post("/login/", dependencies=[Depends(login_limit)])
+async def login_account(payload: UserLoginDTO) -> FastJSONResponse:
     """API Router responsible for signing in a user account.
 
     Args:
        payload (UserLoginDTO): required payload
 
     Returns:
-            data: user account data and jwt token
+            data: jwt token and refresh token
+    """
+
+    tokens = await login_user_account(payload.email, payload.password)
+    return FastJSONResponse(content=tokens)
+
+
+@router.post("/token/refresh/")
+async def refresh_token(payload: UserTokenRefreshDTO) -> FastJSONResponse:
+    """API Router responsible for renewing the tokens of a user account.
+
+    Args:
+       payload (UserTokenRefreshDTO): required payload
+
+    Returns:
+            data: jwt token and the next refresh token
+    """
+
+    tokens = await refresh_user_tokens(payload.refresh_token)
+    return FastJSONResponse(content=tokens)
+
+
+@router.post("/logout/")
+async def logout_account(
+    payload: Optional[UserLogoutDTO] = None,
+    claims: Dict[str, Any] = Depends(get_current_claims),
+) -> FastJSONResponse:
+    """API Router responsible for signing out a user account.
+
+    Args:
+       payload (UserLogoutDTO): optional payload, the refresh token to revoke
+       claims (dict): the claims of the bearer token, which is revoked
+
+    Returns:
+            data: confirmation message
+    """
+
+    await logout_user_account(claims, payload.refresh_token if payload else None)
+    return FastJSONResponse({"message": "Successfully logged out!"})
+
+
+@router.get("/me/")
+async def current_account(
+    user: UserAuthDTO = Depends(get_current_auth_user),
+) -> FastJSONResponse:
+    """API Router responsible for returning the signed in user account.
+
+    Args:
+       user (UserAuthDTO): the account the bearer token belongs to
+
+    Returns:
+            data: the user account
     """
 
-    jwt_token = await login_user_account(payload.email, payload.password)
-    return JSONResponse(content={"token": jwt_token})
+    return FastJSONResponse({"data": user})
 
 
-@router.post("/recover/")
-async def recover_account(payload: UserAccountRecoverDTO) -> JSONResponse:
+@router.post("/recover/", dependencies=[Depends(recover_limit)])
+async def recover_account(payload: UserAccountRecoverDTO) -> FastJSONResponse:
     """API Router responsible for recovering a user account.
 
     Args:
@@ -74,17 +157,17 @@ async def recover_account(payload: UserAccountRecoverDTO) -> JSONResponse:
     """
 
     await recover_user_account(payload.email)
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "message": "Account recovery initiated. Kindly check your email for otp code.",
         }
     )
 
 
-@router.post("/recover/resend/")
+@router.post("/recover/resend/", dependencies=[Depends(recover_limit)])
 async def recover_account_resend_otp(
     payload: UserAccountRecoverDTO,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """API Router responsible for resending a user account password recovery otp.
 
     Args:
@@ -96,17 +179,17 @@ async def recover_account_resend_otp(
 
     otp_resent = await resend_otp_code(payload.email)
     if otp_resent:
-        return JSONResponse({"message": "OTP successfully resent!"})
-    return JSONResponse(
+        return FastJSONResponse({"message": "OTP successfully resent!"})
+    return FastJSONResponse(
         {"detail": {"message": "OTP resend failed. Please try again."}},
         status_code=400,
     )
 
 
-@router.post("/recover/verify/")
+@router.post("/recover/verify/", dependencies=[Depends(recover_verify_limit)])
 async def recover_account_verify_otp(
     payload: UserAccountRecoverConfirmDTO,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """API Router responsible for verifying a user account password recovery otp.
 
     Args:
@@ -118,17 +201,17 @@ async def recover_account_verify_otp(
 
     otp_verified = await verify_otp_code(payload.email, payload.otp_code)
     if otp_verified:
-        return JSONResponse({"message": "OTP verified!"})
-    return JSONResponse(
+        return FastJSONResponse({"message": "OTP verified!"})
+    return FastJSONResponse(
         {"detail": {"message": "OTP verification failed. Please try again."}},
         status_code=400,
     )
 
 
-@router.post("/recover/complete/")
+@router.post("/recover/complete/", dependencies=[Depends(recover_complete_limit)])
 async def recover_account_complete(
     payload: UserAccountRecoverCompleteDTO,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """API Router responsible for completing a user account password recovery.
 
     Args:
@@ -139,4 +222,4 @@ async def recover_account_complete(
     """
 
     await complete_recover_account(payload.email, payload.password)
-    return JSONResponse({"message": "Account recovery successfully completed!"})
+    return FastJSONResponse({"message": "Account recovery successfully completed!"})
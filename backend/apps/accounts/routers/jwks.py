@@ -0,0 +1,51 @@
+# Stdlib Imports
+import json
+import hashlib
+
+# FastAPI Imports
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+# Own Imports
+from config.secrets import get_settings
+from apps.accounts.manager.jwt.handler import auth_handler
+
+
+# Set settings
+settings = get_settings()
+
+# initialize api router
+router = APIRouter(tags=["Keys"])
+
+# the shared secret is never published, its key set is empty
+if auth_handler.key_set is not None:
+    JWKS_BODY, JWKS_ETAG = (
+        auth_handler.key_set.jwks_body,
+        auth_handler.key_set.jwks_etag,
+    )
+else:
+    JWKS_BODY = json.dumps({"keys": []}).encode()
+    JWKS_ETAG = f'"{hashlib.sha256(JWKS_BODY).hexdigest()[:32]}"'
+
+
+@router.get("/.well-known/jwks.json")
+async def jwks(request: Request) -> Response:
+    """API Router publishing the public keys verifying the access tokens.
+
+    The key set can be cached for JWT_JWKS_MAX_AGE seconds, and is
+    revalidated with its ETag.
+
+    Args:
+       request (Request): the request, for its If-None-Match header
+
+    Returns:
+            Response: the JSON Web Key Set
+    """
+
+    headers = {
+        "Cache-Control": f"public, max-age={settings.JWT_JWKS_MAX_AGE}",
+        "ETag": JWKS_ETAG,
+    }
+    if request.headers.get("if-none-match") == JWKS_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(JWKS_BODY, media_type="application/json", headers=headers)
@@ -0,0 +1,31 @@
+# Stdlib Imports
+from typing import Dict
+
+# Own Imports
+from apps.jobs.registry import job_handler
+from apps.accounts.manager.email_manager import EmailManager
+
+
+@job_handler("send_email")
+async def send_email(
+    receiver_email: str, subject: str, content: str, provider: str
+) -> Dict[str, bool]:
+    """Job responsible for sending an email.
+
+    Args:
+        receiver_email (str): the receiver email address
+        subject (str): the subject of the email
+        content (str): the content of the email
+        provider (str): the email provider to use
+
+    Raises:
+        RuntimeError: the provider did not accept the email
+
+    Returns:
+        dict: confirmation that the email was sent
+    """
+
+    sent = await EmailManager(receiver_email).send(subject, content, provider)
+    if not sent:
+        raise RuntimeError("Email provider did not accept the email.")
+    return {"sent": True}
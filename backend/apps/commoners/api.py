@@ -1,73 +1,115 @@
 # Stdlib Imports
-import os
-import secrets
-from pathlib import Path
+import re
+import hashlib
+from typing import Any, Dict, Optional
 
 # FastAPI Imports
-from fastapi.responses import JSONResponse
-from fastapi import APIRouter, BackgroundTasks, File, UploadFile, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
 
 # Own Imports
+from config.responses import FastJSONResponse
+from config.secrets import get_settings
+from apps.jobs.manager.queue_manager import enqueue_job
+from apps.accounts.manager.deps import get_optional_claims
+from apps.commoners.services.streaming import stream_upload
+from apps.commoners.services.upload_index import HashingStream, upload_index
 from apps.commoners.services.cloudinary_upload import file_uploader
-from apps.commoners.utils import (
-    remove_file_from_root_directory,
-    RecursionDepth,
-)
 
-# Third Party Imports
-import aiofiles
-from asyncer import asyncify
 
-
-# initialize api router
+# initialize api router and settings
 router = APIRouter(tags=["Commoners"], prefix="/commoners")
-
-# Set value of bytes
-BYTES_SIZE: int = 1000000
-
-
-@router.post("/upload/")
+settings = get_settings()
+
+# Format of a hex encoded sha256 digest
+SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+# Request body documented for the upload route, which parses the form itself
+UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file_in_memory"],
+                    "properties": {
+                        "file_in_memory": {"type": "string", "format": "binary"}
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+@router.post("/upload/", openapi_extra=UPLOAD_REQUEST_BODY)
 async def upload_image(
-    tasks: BackgroundTasks, file_in_memory: UploadFile = File(...)
-) -> JSONResponse:
+    request: Request,
+    x_content_sha256: str = Header(None),
+    claims: Optional[Dict[str, Any]] = Depends(get_optional_claims),
+) -> FastJSONResponse:
     """API Router for uploading image.
 
-    Returns:
-        JSONResponse: _description_
-    """
+    The image is streamed to cloudinary as it is received, and rejected
+    as soon as it grows past the upload size limit.
 
-    # get parent directory
-    parent_directory = Path(__file__).absolute().parent.parent
-    image_directory = "/static/images/"
+    Uploads are indexed by the sha256 digest of their content. A client
+    that sends the digest in the X-Content-SHA256 header gets the url of
+    an identical, already uploaded image back without sending it again.
 
-    # generate a secret token hex
-    secret_filename = secrets.token_hex(8) + ".png"
+    When uploads are deferred, the image is handed to the job worker
+    and the id of the upload job is returned instead of the url. Deferred
+    uploads require a bearer token, only their owner can read the job.
 
-    # join parent and secret_filename to generate wav audio path
-    file_path = os.path.join(f"{parent_directory}{image_directory}", secret_filename)
-
-    # Read the file contents
-    file_contents = await file_in_memory.read()
-    if len(file_contents) / BYTES_SIZE >= 4:
-        raise HTTPException(400, {"message": "File size must not exceed 4MB"})
+    Returns:
+        FastJSONResponse: _description_
+    """
 
-    # override the recursion depth level to avoid infinite recursion
-    with RecursionDepth(3000):
-        # upload image to disk
-        async with aiofiles.open(file_path, "wb") as file:
-            await file.write(file_contents)
+    if x_content_sha256 and SHA256_PATTERN.match(x_content_sha256.lower()):
+        upload_url = await upload_index.lookup(x_content_sha256.lower())
+        if upload_url is not None:
+            return upload_response(upload_url, x_content_sha256.lower())
+
+    if settings.UPLOAD_DEFERRED and claims is None:
+        raise HTTPException(401, {"message": "Authentication required."})
+
+    file_stream = await stream_upload(request, "file_in_memory")
+
+    if settings.UPLOAD_DEFERRED:
+        file_contents = b"".join([chunk async for chunk in file_stream])
+        digest = hashlib.sha256(file_contents).hexdigest()
+
+        upload_url = await upload_index.lookup(digest)
+        if upload_url is not None:
+            return upload_response(upload_url, digest)
+
+        job = await enqueue_job(
+            "upload_image",
+            {"file_contents": file_contents, "digest": digest},
+            owner_id=claims["user_id"],
+        )
+        return FastJSONResponse(
+            {
+                "message": "File upload queued",
+                "data": {"job_id": str(job.id)},
+            },
+            status_code=202,
+        )
+
+    # upload image to cloudinary, hashing it on the way
+    hashing_stream = HashingStream(file_stream)
+    upload_url = await file_uploader.upload_stream(hashing_stream)
+    upload_url = await upload_index.store(
+        hashing_stream.digest, upload_url, hashing_stream.size
+    )
 
-    # upload audio to cloudinary
-    upload_url = await asyncify(file_uploader.upload_file)(file_path)
+    return upload_response(upload_url, hashing_stream.digest)
 
-    # remove uploaded files from the parent directory
-    tasks.add_task(
-        remove_file_from_root_directory, f"{parent_directory}{image_directory}"
-    )
 
-    return JSONResponse(
+def upload_response(upload_url: str, digest: str) -> FastJSONResponse:
+    return FastJSONResponse(
         {
             "message": "File upload successfully",
-            "data": {"upload_url": upload_url},
+            "data": {"upload_url": upload_url, "digest": digest},
         }
     )
@@ -0,0 +1,15 @@
+# Stdlib Imports
+from datetime import datetime
+
+# Third Party Imports
+from odmantic import Field, Model
+
+
+class UploadedFile(Model):
+    digest: str = Field(unique=True)
+    secure_url: str
+    size: int
+    date_created: datetime
+
+    class Config:
+        collection = "uploaded_files"
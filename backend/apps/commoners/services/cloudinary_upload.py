@@ -1,12 +1,25 @@
+# Stdlib Imports
+import time
+import random
+import asyncio
+import secrets
+from typing import AsyncIterable, AsyncIterator, Dict, Optional, Union
+
 # Own Imports
 from config.secrets import get_settings
+from config.http_client import http_client
+from apps.monitoring.metrics import time_call
 
 # FastAPI Imports
 from fastapi import HTTPException
 
 # Third Party Imports
-from cloudinary import config
-from cloudinary.uploader import upload
+import httpx
+from cloudinary.utils import api_sign_request
+
+
+# Upstream status codes worth retrying
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
 
 
 class CloudinaryFileUploader:
@@ -14,6 +27,8 @@ class CloudinaryFileUploader:
     This service is responsible for:
 
     - uploading files to cloudinary.
+    - streaming files to cloudinary as they are received.
+    - limiting the number of uploads in flight.
     """
 
     def __init__(self) -> None:
@@ -22,31 +37,174 @@ class CloudinaryFileUploader:
         """
 
         self.settings = get_settings()
-        self.config = config(
-            api_key=self.settings.CLOUDINARY_API_KEY,
-            cloud_name=self.settings.CLOUDINARY_NAME,
-            api_secret=self.settings.CLOUDINARY_API_SECRET,
+        self.upload_url = (
+            f"{self.settings.CLOUDINARY_API_URL}/{self.settings.CLOUDINARY_NAME}"
+            "/image/upload"
+        )
+        self.timeout = self.settings.CLOUDINARY_UPLOAD_TIMEOUT
+        self.retries = self.settings.CLOUDINARY_UPLOAD_RETRIES
+        self.max_concurrent = self.settings.CLOUDINARY_MAX_CONCURRENT_UPLOADS
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Limits uploads in flight, created inside the running event loop."""
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    def signed_params(self) -> Dict[str, str]:
+        """
+        This method returns the authentication fields of a signed upload.
+
+        :return: The api key, timestamp and signature.
+        :rtype: dict
+        """
+
+        params = {"timestamp": str(int(time.time()))}
+        params["signature"] = api_sign_request(
+            params, self.settings.CLOUDINARY_API_SECRET
         )
+        params["api_key"] = self.settings.CLOUDINARY_API_KEY
+        return params
 
-    def upload_file(self, file_path: str) -> None:
+    @staticmethod
+    async def multipart_body(
+        boundary: str,
+        fields: Dict[str, str],
+        chunks: AsyncIterable[bytes],
+        filename: str,
+    ) -> AsyncIterator[bytes]:
+        """
+        This method encodes the fields and the file chunks as a multipart body,
+        without holding more than one chunk of the file at a time.
         """
-        This method uploads a file.
 
-        :param file_path: The path of the audio.
-        :type file_path: str
+        for name, value in fields.items():
+            yield (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode()
+
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        async for chunk in chunks:
+            yield chunk
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    @staticmethod
+    async def single_chunk(content: bytes) -> AsyncIterator[bytes]:
+        yield content
+
+    async def send(
+        self, chunks: Union[bytes, AsyncIterable[bytes]], filename: str
+    ) -> httpx.Response:
+        """
+        This method sends one signed upload request to cloudinary,
+        waiting for a free upload slot first.
+        """
+
+        if isinstance(chunks, bytes):
+            chunks = self.single_chunk(chunks)
+
+        boundary = secrets.token_hex(16)
+        async with self.semaphore:
+            return await http_client.client.post(
+                self.upload_url,
+                content=self.multipart_body(
+                    boundary, self.signed_params(), chunks, filename
+                ),
+                headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+                timeout=self.timeout,
+            )
+
+    @staticmethod
+    def secure_url(response: httpx.Response) -> str:
+        """
+        This method returns the url of the uploaded file,
+        or raises an exception when the upload failed.
         """
 
         try:
-            data = upload(file=file_path)
-            return data["secure_url"]
-        except Exception as e:
+            data = response.json()
+        except ValueError as e:
+            raise HTTPException(400, {"message": "File upload failed", "meta": str(e)})
+
+        if response.status_code != 200:
             raise HTTPException(
                 400,
                 {
                     "message": "File upload failed",
-                    "meta": str(e),
+                    "meta": data.get("error", {}).get("message"),
                 },
             )
+        return data["secure_url"]
+
+    async def upload_file(self, file: bytes, filename: str = "file") -> str:
+        """
+        This method uploads a file, retrying on transient upstream errors.
+
+        :param file: The content of the file.
+        :type file: bytes
+
+        :param filename: The name of the file.
+        :type filename: str
+
+        :return: The url of the uploaded file.
+        :rtype: str
+        """
+
+        with time_call("cloudinary", "upload_file"):
+            for attempt in range(self.retries + 1):
+                last_attempt = attempt == self.retries
+                try:
+                    response = await self.send(file, filename)
+                except httpx.TransportError as e:
+                    if last_attempt:
+                        raise HTTPException(
+                            400, {"message": "File upload failed", "meta": str(e)}
+                        )
+                else:
+                    if (
+                        response.status_code not in TRANSIENT_STATUS_CODES
+                        or last_attempt
+                    ):
+                        return self.secure_url(response)
+
+                await asyncio.sleep(random.uniform(0, 0.5 * 2**attempt))
+
+    async def upload_stream(
+        self, chunks: AsyncIterable[bytes], filename: str = "file"
+    ) -> str:
+        """
+        This method uploads a file to cloudinary while its chunks are
+        still being received, without buffering it in memory or on disk.
+
+        The chunks can only be read once, so streamed uploads are not retried.
+
+        :param chunks: The content of the file.
+        :type chunks: AsyncIterable[bytes]
+
+        :param filename: The name of the file.
+        :type filename: str
+
+        :return: The url of the uploaded file.
+        :rtype: str
+        """
+
+        with time_call("cloudinary", "upload_stream"):
+            try:
+                response = await self.send(chunks, filename)
+            except httpx.HTTPError as e:
+                raise HTTPException(
+                    400, {"message": "File upload failed", "meta": str(e)}
+                )
+            return self.secure_url(response)
 
 
 file_uploader = CloudinaryFileUploader()
@@ -0,0 +1,199 @@
+# Stdlib Imports
+from typing import AsyncIterator, List, Optional
+
+# FastAPI Imports
+from fastapi import HTTPException, Request
+
+# Own Imports
+from config.secrets import get_settings
+
+# Third Party Imports
+from multipart.multipart import MultipartParser, parse_options_header
+
+
+# Set settings
+settings = get_settings()
+
+# Room left in the request body for the multipart boundaries and part headers
+MULTIPART_OVERHEAD: int = 16 * 1024
+
+
+class MultipartFileStream:
+    """
+    Responsible for the following:
+
+    - validating the request headers and finding the file field before
+      the upload is handed to the provider
+    - parsing a multipart request body as it arrives
+    - yielding the content of a single file field chunk by chunk
+    - rejecting the upload as soon as it grows past the size limit
+    """
+
+    def __init__(self, request: Request, field_name: str, max_size: int) -> None:
+        """
+        This method initializes the stream.
+
+        :param request: The request carrying the multipart body
+        :type request: Request
+
+        :param field_name: The name of the file field to stream
+        :type field_name: str
+
+        :param max_size: The maximum size of the file in bytes
+        :type max_size: int
+        """
+
+        self.request = request
+        self.field_name = field_name
+        self.max_size = max_size
+        self.size = 0
+        self.filename: Optional[str] = None
+        self.found = False
+        self.ended = False
+
+        self._parser: Optional[MultipartParser] = None
+        self._body: Optional[AsyncIterator[bytes]] = None
+        self._header_field = b""
+        self._header_value = b""
+        self._in_field = False
+        self._chunks: List[bytes] = []
+
+    def check_headers(self) -> None:
+        """
+        This method rejects the upload before reading it when the declared
+        body size is invalid or already too large, or the multipart
+        boundary is missing, and sets up the parser.
+        """
+
+        content_length = self.request.headers.get("content-length")
+        if content_length:
+            try:
+                body_size = int(content_length)
+            except ValueError:
+                raise HTTPException(400, {"message": "Invalid Content-Length header."})
+            if body_size > self.max_size + MULTIPART_OVERHEAD:
+                raise self.too_large()
+
+        _, params = parse_options_header(self.request.headers.get("content-type", ""))
+        boundary = params.get(b"boundary")
+        if not boundary:
+            raise HTTPException(400, {"message": "Missing boundary in multipart."})
+
+        self._parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self.on_part_begin,
+                "on_header_field": self.on_header_field,
+                "on_header_value": self.on_header_value,
+                "on_header_end": self.on_header_end,
+                "on_part_data": self.on_part_data,
+                "on_part_end": self.on_part_end,
+            },
+        )
+        self._body = self.request.stream().__aiter__()
+
+    async def read(self) -> None:
+        """
+        This method feeds the next piece of the request body to the parser.
+        """
+
+        try:
+            data = await self._body.__anext__()
+        except StopAsyncIteration:
+            self._parser.finalize()
+            self.ended = True
+        else:
+            self._parser.write(data)
+
+    async def open(self) -> None:
+        """
+        This method validates the headers and reads the body up to the
+        headers of the file field, so that a request without the field
+        is rejected before any of it is uploaded.
+        """
+
+        self.check_headers()
+        while not self.found and not self.ended:
+            await self.read()
+        if not self.found:
+            raise self.missing_field()
+
+    def missing_field(self) -> HTTPException:
+        return HTTPException(
+            422, {"message": f"Missing file field '{self.field_name}'."}
+        )
+
+    def too_large(self) -> HTTPException:
+        limit = self.max_size / 1000000
+        return HTTPException(400, {"message": f"File size must not exceed {limit:g}MB"})
+
+    def on_part_begin(self) -> None:
+        self._in_field = False
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        if self._header_field.lower() == b"content-disposition":
+            _, options = parse_options_header(self._header_value)
+            name = options.get(b"name", b"").decode("latin-1")
+            if name == self.field_name and not self.found:
+                self._in_field = self.found = True
+                filename = options.get(b"filename")
+                self.filename = filename.decode("latin-1") if filename else None
+        self._header_field = b""
+        self._header_value = b""
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_field:
+            self._chunks.append(data[start:end])
+
+    def on_part_end(self) -> None:
+        self._in_field = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """
+        This method feeds the rest of the request body to the parser and
+        yields the file content as soon as it has been parsed.
+        """
+
+        if self._parser is None:
+            await self.open()
+
+        while True:
+            chunks, self._chunks = self._chunks, []
+            for chunk in chunks:
+                self.size += len(chunk)
+                if self.size > self.max_size:
+                    raise self.too_large()
+                yield chunk
+            if self.ended:
+                break
+            await self.read()
+
+        if not self.found:
+            raise self.missing_field()
+
+
+async def stream_upload(request: Request, field_name: str) -> MultipartFileStream:
+    """
+    This function returns a stream over the content of the
+    file field of a multipart request, capped at UPLOAD_MAX_SIZE.
+    Invalid requests are rejected here, before the stream is consumed.
+
+    :param request: The request carrying the multipart body
+    :type request: Request
+
+    :param field_name: The name of the file field to stream
+    :type field_name: str
+
+    :return: The file stream.
+    :rtype: MultipartFileStream
+    """
+
+    file_stream = MultipartFileStream(request, field_name, settings.UPLOAD_MAX_SIZE)
+    await file_stream.open()
+    return file_stream
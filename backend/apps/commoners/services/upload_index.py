@@ -0,0 +1,153 @@
+# Stdlib Imports
+import hashlib
+from datetime import datetime
+from collections import OrderedDict
+from typing import AsyncIterable, AsyncIterator, Dict, Optional
+
+# Own Imports
+from config.database import engine
+from config.secrets import get_settings
+from apps.commoners.models import UploadedFile
+
+# Third Party Imports
+from pymongo import ReturnDocument
+
+
+# Set settings
+settings = get_settings()
+
+
+class HashingStream:
+    """
+    Responsible for computing the sha256 digest of a stream
+    while its chunks are passed through.
+    """
+
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self.chunks = chunks
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.chunks:
+            self.hash.update(chunk)
+            self.size += len(chunk)
+            yield chunk
+
+    @property
+    def digest(self) -> str:
+        return self.hash.hexdigest()
+
+
+class UploadIndex:
+    """
+    Responsible for the following:
+
+    - mapping the sha256 digest of uploaded files to their url
+    - keeping the most recent entries in memory, in front of the database
+    - counting the uploads served from the index
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        This method initializes the index.
+
+        :param maxsize: The number of entries kept in memory
+        :type maxsize: int
+        """
+
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[str, str]" = OrderedDict()
+        self.memory_hits = 0
+        self.database_hits = 0
+        self.misses = 0
+
+    def remember(self, digest: str, secure_url: str) -> None:
+        if self.maxsize <= 0:
+            return
+
+        self.entries[digest] = secure_url
+        self.entries.move_to_end(digest)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    async def lookup(self, digest: str) -> Optional[str]:
+        """
+        This method returns the url of a file already uploaded
+        with the given digest, if any.
+
+        :param digest: The sha256 digest of the file
+        :type digest: str
+
+        :return: The url of the uploaded file.
+        :rtype: str
+        """
+
+        secure_url = self.entries.get(digest)
+        if secure_url is not None:
+            self.entries.move_to_end(digest)
+            self.memory_hits += 1
+            return secure_url
+
+        document = await engine.get_collection(UploadedFile).find_one(
+            {"digest": digest}, {"secure_url": 1, "_id": 0}
+        )
+        if document is None:
+            self.misses += 1
+            return None
+
+        self.database_hits += 1
+        self.remember(digest, document["secure_url"])
+        return document["secure_url"]
+
+    async def store(self, digest: str, secure_url: str, size: int) -> str:
+        """
+        This method records the url of an uploaded file. When the same
+        content was recorded concurrently, the first url is kept and returned.
+
+        :param digest: The sha256 digest of the file
+        :type digest: str
+
+        :param secure_url: The url of the uploaded file
+        :type secure_url: str
+
+        :param size: The size of the file in bytes
+        :type size: int
+
+        :return: The url recorded for the digest.
+        :rtype: str
+        """
+
+        document = await engine.get_collection(UploadedFile).find_one_and_update(
+            {"digest": digest},
+            {
+                "$setOnInsert": {
+                    "secure_url": secure_url,
+                    "size": size,
+                    "date_created": datetime.utcnow(),
+                }
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        self.remember(digest, document["secure_url"])
+        return document["secure_url"]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        This method returns the dedupe counters.
+
+        :return: The size of the memory index, hits and misses.
+        :rtype: dict
+        """
+
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "memory_hits": self.memory_hits,
+            "database_hits": self.database_hits,
+            "misses": self.misses,
+        }
+
+
+upload_index = UploadIndex(settings.UPLOAD_INDEX_CACHE_SIZE)
@@ -0,0 +1,26 @@
+# Stdlib Imports
+from typing import Dict
+
+# Own Imports
+from apps.jobs.registry import job_handler
+from apps.commoners.services.upload_index import upload_index
+from apps.commoners.services.cloudinary_upload import file_uploader
+
+
+@job_handler("upload_image")
+async def upload_image(file_contents: bytes, digest: str) -> Dict[str, str]:
+    """Job responsible for uploading an image to cloudinary.
+
+    Args:
+        file_contents (bytes): the content of the image
+        digest (str): the sha256 digest of the image
+
+    Returns:
+        dict: the url and digest of the uploaded image
+    """
+
+    upload_url = await upload_index.lookup(digest)
+    if upload_url is None:
+        upload_url = await file_uploader.upload_file(file_contents)
+        upload_url = await upload_index.store(digest, upload_url, len(file_contents))
+    return {"upload_url": upload_url, "digest": digest}
@@ -0,0 +1,45 @@
+# Stdlib Imports
+from typing import Any, Dict
+
+# FastAPI Imports
+from fastapi import APIRouter, Depends, HTTPException
+
+# Own Imports
+from config.responses import FastJSONResponse
+from apps.jobs.manager.queue_manager import get_job
+from apps.accounts.manager.deps import get_current_claims
+
+
+# initialize api router
+router = APIRouter(tags=["Jobs"], prefix="/jobs")
+
+
+@router.get("/{job_id}/")
+async def get_job_status(
+    job_id: str, claims: Dict[str, Any] = Depends(get_current_claims)
+) -> FastJSONResponse:
+    """API Router responsible for reporting the status of a job
+    queued by the current user.
+
+    Args:
+       job_id (str): the id of the job
+       claims (dict): the verified token claims of the current user
+
+    Returns:
+            data: the status, attempts and result of the job
+    """
+
+    job = await get_job(job_id, claims["user_id"])
+    if job is None:
+        raise HTTPException(404, {"message": "Job does not exist"})
+
+    return FastJSONResponse(
+        {
+            "data": {
+                "job_id": str(job.id),
+                "status": job.status,
+                "attempts": job.attempts,
+                "result": job.result,
+            }
+        }
+    )
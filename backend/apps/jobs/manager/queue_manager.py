@@ -0,0 +1,222 @@
+# Stdlib Imports
+import random
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+
+# Own Imports
+from config.database import engine
+from config.secrets import get_settings
+from apps.jobs.models.jobs import Job, JobStatus
+
+# Third Party Imports
+from bson import ObjectId
+from pymongo import ASCENDING, ReturnDocument
+
+
+# Set settings
+settings = get_settings()
+
+
+async def enqueue_job(
+    name: str,
+    payload: Dict[str, Any],
+    max_attempts: Optional[int] = None,
+    delay: float = 0,
+    owner_id: Optional[str] = None,
+) -> Job:
+    """Adds a job to the queue.
+
+    Args:
+        name (str): the name of the registered job handler
+        payload (dict): the keyword arguments given to the handler
+        max_attempts (int): the number of attempts before dead-lettering
+        delay (float): the number of seconds to wait before running the job
+        owner_id (str): the id of the user allowed to read the job's status
+
+    Returns:
+        Job: the queued job
+    """
+
+    now = datetime.utcnow()
+    job = Job(
+        name=name,
+        payload=payload,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_at=now + timedelta(seconds=delay),
+        owner_id=owner_id,
+        date_created=now,
+        date_modified=now,
+    )
+    await engine.save(job)
+    return job
+
+
+async def claim_job(names: List[str], worker_id: str) -> Optional[Job]:
+    """Atomically claims the next due job and leases it to the worker.
+
+    A job is due when it is pending and its run_at has passed, or when
+    it is running but the worker holding its lease stopped renewing it
+    and it has attempts left.
+
+    Args:
+        names (list): the job names the worker can handle
+        worker_id (str): the id of the claiming worker
+
+    Returns:
+        Job: the claimed job, or None when no job is due
+    """
+
+    now = datetime.utcnow()
+    document = await engine.get_collection(Job).find_one_and_update(
+        {
+            "name": {"$in": names},
+            "$or": [
+                {"status": JobStatus.PENDING, "run_at": {"$lte": now}},
+                {
+                    "status": JobStatus.RUNNING,
+                    "lease_expires_at": {"$lte": now},
+                    "$expr": {"$lt": ["$attempts", "$max_attempts"]},
+                },
+            ],
+        },
+        {
+            "$set": {
+                "status": JobStatus.RUNNING,
+                "worker_id": worker_id,
+                "lease_expires_at": now + timedelta(seconds=settings.JOB_LEASE),
+                "date_modified": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("run_at", ASCENDING)],
+        return_document=ReturnDocument.AFTER,
+    )
+    if document is None:
+        return None
+    return Job.parse_doc(document)
+
+
+async def complete_job(job: Job, result: Optional[Dict[str, Any]] = None) -> None:
+    """Marks a job as done, stores its result and drops its payload.
+
+    Args:
+        job (Job): the claimed job
+        result (dict): the result returned by the handler
+    """
+
+    await engine.get_collection(Job).update_one(
+        {"_id": job.id, "worker_id": job.worker_id},
+        {
+            "$set": {
+                "status": JobStatus.DONE,
+                "result": result,
+                "lease_expires_at": None,
+                "date_modified": datetime.utcnow(),
+            },
+            "$unset": {"payload": ""},
+        },
+    )
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter, capped by JOB_BACKOFF_MAX."""
+
+    ceiling = min(
+        settings.JOB_BACKOFF_BASE * 2 ** (attempts - 1), settings.JOB_BACKOFF_MAX
+    )
+    return random.uniform(ceiling / 2, ceiling)
+
+
+async def fail_job(job: Job, error: str) -> None:
+    """Schedules a failed job for a retry, or dead-letters it
+    once it has used all of its attempts.
+
+    Args:
+        job (Job): the claimed job
+        error (str): the error raised by the handler
+    """
+
+    now = datetime.utcnow()
+    update: Dict[str, Any] = {
+        "$set": {
+            "last_error": error,
+            "lease_expires_at": None,
+            "date_modified": now,
+        }
+    }
+    if job.attempts >= job.max_attempts:
+        update["$set"]["status"] = JobStatus.DEAD
+        update["$unset"] = {"payload": ""}
+    else:
+        update["$set"]["status"] = JobStatus.PENDING
+        update["$set"]["run_at"] = now + timedelta(seconds=retry_delay(job.attempts))
+
+    await engine.get_collection(Job).update_one(
+        {"_id": job.id, "worker_id": job.worker_id}, update
+    )
+
+
+async def dead_letter_expired_jobs() -> int:
+    """Dead-letters the running jobs whose lease expired on their last
+    attempt, e.g. because their worker crashed or was killed while running
+    them. They are left out of claim_job, which would otherwise retry them
+    forever.
+
+    Returns:
+        int: the number of dead-lettered jobs
+    """
+
+    now = datetime.utcnow()
+    result = await engine.get_collection(Job).update_many(
+        {
+            "status": JobStatus.RUNNING,
+            "lease_expires_at": {"$lte": now},
+            "$expr": {"$gte": ["$attempts", "$max_attempts"]},
+        },
+        {
+            "$set": {
+                "status": JobStatus.DEAD,
+                "last_error": "Lease expired on the last attempt",
+                "lease_expires_at": None,
+                "date_modified": now,
+            },
+            "$unset": {"payload": ""},
+        },
+    )
+    return result.modified_count
+
+
+async def extend_job_lease(job: Job) -> None:
+    """Renews the lease of a job that is still running.
+
+    Args:
+        job (Job): the claimed job
+    """
+
+    await engine.get_collection(Job).update_one(
+        {"_id": job.id, "worker_id": job.worker_id, "status": JobStatus.RUNNING},
+        {
+            "$set": {
+                "lease_expires_at": datetime.utcnow()
+                + timedelta(seconds=settings.JOB_LEASE)
+            }
+        },
+    )
+
+
+async def get_job(job_id: str, owner_id: str) -> Optional[Job]:
+    """Gets a job of the user by id.
+
+    Args:
+        job_id (str): the job id
+        owner_id (str): the id of the user who queued the job
+
+    Returns:
+        Job: the job, or None if it does not exist or belongs to someone else
+    """
+
+    if not ObjectId.is_valid(job_id):
+        return None
+    return await engine.find_one(
+        Job, Job.id == ObjectId(job_id), Job.owner_id == owner_id
+    )
@@ -0,0 +1,157 @@
+# Stdlib Imports
+import time
+import uuid
+import socket
+import asyncio
+import logging
+from typing import Optional, Set
+
+# Own Imports
+from config.secrets import get_settings
+from apps.jobs.models.jobs import Job
+from apps.jobs.registry import job_handlers
+from apps.jobs.manager.queue_manager import (
+    claim_job,
+    complete_job,
+    fail_job,
+    extend_job_lease,
+    dead_letter_expired_jobs,
+)
+
+
+# Set settings and logger
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """
+    Responsible for the following:
+
+    - claiming due jobs from the queue
+    - running them with their registered handler, a few at a time
+    - renewing the lease of running jobs
+    - recording their result, or scheduling a retry when they fail
+    - dead-lettering the jobs whose lease expired on their last attempt
+    """
+
+    def __init__(
+        self, concurrency: Optional[int] = None, poll_interval: Optional[float] = None
+    ) -> None:
+        """
+        This method initializes the worker.
+
+        :param concurrency: The number of jobs run at the same time
+        :type concurrency: int
+
+        :param poll_interval: The seconds to wait when the queue is empty
+        :type poll_interval: float
+        """
+
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL
+        self.worker_id = f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.stopping = asyncio.Event()
+        self.tasks: Set[asyncio.Task] = set()
+        self.swept_at = 0.0
+
+    def stop(self) -> None:
+        """
+        This method asks the worker to stop claiming jobs.
+        Jobs already running are allowed to finish.
+        """
+
+        self.stopping.set()
+
+    async def run(self) -> None:
+        """
+        This method claims and runs jobs until the worker is stopped.
+        """
+
+        names = list(job_handlers)
+        slots = asyncio.Semaphore(self.concurrency)
+        logger.info("Worker %s handling jobs: %s", self.worker_id, names)
+
+        while not self.stopping.is_set():
+            await self.sweep_expired_jobs()
+            await slots.acquire()
+            try:
+                job = await claim_job(names, self.worker_id)
+            except Exception:
+                logger.exception("Could not claim a job.")
+                job = None
+
+            if job is None:
+                slots.release()
+                try:
+                    await asyncio.wait_for(self.stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            task = asyncio.create_task(self.process(job))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+            task.add_done_callback(lambda _: slots.release())
+
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def sweep_expired_jobs(self) -> None:
+        """
+        This method dead-letters the exhausted jobs whose lease expired,
+        at most once per lease period.
+        """
+
+        if time.monotonic() - self.swept_at < settings.JOB_LEASE:
+            return
+        self.swept_at = time.monotonic()
+
+        try:
+            dead = await dead_letter_expired_jobs()
+        except Exception:
+            logger.exception("Could not dead-letter the expired jobs.")
+            return
+        if dead:
+            logger.warning("Dead-lettered %d jobs whose lease expired.", dead)
+
+    async def keep_lease(self, job: Job) -> None:
+        """
+        This method renews the lease of the job while it is running.
+        """
+
+        while True:
+            await asyncio.sleep(settings.JOB_LEASE / 3)
+            try:
+                await extend_job_lease(job)
+            except Exception:
+                # retried on the next tick, before the lease expires
+                logger.exception("Could not renew the lease of job %s.", job.id)
+
+    async def process(self, job: Job) -> None:
+        """
+        This method runs a claimed job and records its outcome.
+
+        :param job: The claimed job
+        :type job: Job
+        """
+
+        lease = asyncio.create_task(self.keep_lease(job))
+        try:
+            try:
+                result = await job_handlers[job.name](**job.payload)
+            except Exception as e:
+                logger.exception("Job %s (%s) failed.", job.id, job.name)
+                outcome = fail_job(job, repr(e))
+            else:
+                outcome = complete_job(job, result)
+
+            try:
+                await outcome
+            except Exception:
+                # the job is claimed again once its lease expires
+                logger.exception(
+                    "Could not record the outcome of job %s (%s).", job.id, job.name
+                )
+        finally:
+            lease.cancel()
@@ -0,0 +1,59 @@
+# Stdlib Imports
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Own Imports
+from config.secrets import get_settings
+
+# Third Party Imports
+from odmantic import Field, Model
+from pymongo import ASCENDING, IndexModel
+
+
+# Set settings
+settings = get_settings()
+
+
+class JobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    DEAD = "dead"
+
+
+class Job(Model):
+    name: str
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    status: str = Field(default=JobStatus.PENDING)
+    attempts: int = Field(default=0)
+    max_attempts: int
+    run_at: datetime
+    lease_expires_at: Optional[datetime] = None
+    worker_id: Optional[str] = None
+    owner_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    last_error: Optional[str] = None
+    date_created: datetime
+    date_modified: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        collection = "jobs"
+
+        # The payload of done and dead jobs is dropped
+        parse_doc_with_default_factories = True
+
+        @staticmethod
+        def indexes():
+            # Used to claim the next due job
+            yield IndexModel([("status", ASCENDING), ("run_at", ASCENDING)])
+
+            # Removes done and dead jobs once retained long enough. "dead"
+            # and "done" are the only statuses in this range, as partial
+            # indexes cannot use $in before MongoDB 6.0
+            yield IndexModel(
+                [("date_modified", ASCENDING)],
+                expireAfterSeconds=settings.JOB_RETENTION,
+                partialFilterExpression={
+                    "status": {"$gte": JobStatus.DEAD, "$lte": JobStatus.DONE}
+                },
+            )
@@ -0,0 +1,24 @@
+# Stdlib Imports
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+JobHandler = Callable[..., Awaitable[Optional[Dict[str, Any]]]]
+
+# Handlers available to the worker, keyed by job name
+job_handlers: Dict[str, JobHandler] = {}
+
+
+def job_handler(name: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    This decorator registers a coroutine as the handler of the named job.
+    The job payload is passed to the handler as keyword arguments.
+
+    :param name: The name of the job
+    :type name: str
+    """
+
+    def decorator(handler: JobHandler) -> JobHandler:
+        job_handlers[name] = handler
+        return handler
+
+    return decorator
@@ -0,0 +1,42 @@
+# FastAPI Imports
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+# Own Imports
+from config.database import database
+from apps.monitoring.metrics import render_metrics, stats_collector
+from apps.accounts.manager.cache_manager import user_cache
+from apps.accounts.manager.jwt.handler import auth_handler
+from apps.accounts.manager.bcrypt_manager import bcrypt_hasher
+from apps.accounts.manager.rate_limit_manager import rate_limiter
+from apps.accounts.manager.email_filter_manager import email_filter
+from apps.accounts.manager.revocation_manager import revoked_tokens
+from apps.accounts.manager.token_version_manager import token_versions
+from apps.commoners.services.upload_index import upload_index
+
+
+# initialize api router
+router = APIRouter(tags=["Monitoring"])
+
+# export the counters kept by the in-process caches and pools
+stats_collector.register("bcrypt_pool", bcrypt_hasher.stats)
+stats_collector.register("user_cache", user_cache.stats)
+stats_collector.register("jwt_verified_cache", auth_handler.verified_tokens.stats)
+stats_collector.register("upload_index", upload_index.stats)
+stats_collector.register("mongodb_pool", database.pool_listener.stats)
+stats_collector.register("rate_limiter", rate_limiter.stats)
+stats_collector.register("email_filter", email_filter.stats)
+stats_collector.register("token_versions", token_versions.stats)
+stats_collector.register("revoked_tokens", revoked_tokens.stats)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """API Router exposing the application metrics in the prometheus text format.
+
+    Returns:
+            Response: the metrics
+    """
+
+    content, content_type = render_metrics()
+    return Response(content, media_type=content_type)
@@ -0,0 +1,45 @@
+# Stdlib Imports
+from typing import Dict, Tuple
+
+# Own Imports
+from apps.monitoring.metrics import MONGODB_COMMAND_DURATION
+
+# Third Party Imports
+from pymongo import monitoring
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """
+    Records the duration of every MongoDB command, by collection and command.
+
+    Only the started event carries the command, so the collection is kept
+    until the command succeeds or fails.
+    """
+
+    def __init__(self) -> None:
+        self.collections: Dict[Tuple, str] = {}
+
+    @staticmethod
+    def key(event) -> Tuple:
+        return (event.connection_id, event.request_id)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        target = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            target = event.command.get("collection")
+        self.collections[self.key(event)] = target if isinstance(target, str) else ""
+
+    def record(self, event, outcome: str) -> None:
+        collection = self.collections.pop(self.key(event), "")
+        MONGODB_COMMAND_DURATION.labels(
+            collection, event.command_name, outcome
+        ).observe(event.duration_micros / 1e6)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self.record(event, "success")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self.record(event, "error")
+
+
+command_metrics_listener = CommandMetricsListener()
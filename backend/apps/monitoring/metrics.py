@@ -0,0 +1,132 @@
+# Stdlib Imports
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Tuple
+
+# Third Party Imports
+from prometheus_client import (
+    REGISTRY,
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+
+# Metrics are shared across workers through files in this directory when set
+MULTIPROCESS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests handled, by route and status code.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests, by route.",
+    ["method", "route"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled, by route.",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+MONGODB_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds",
+    "Time spent on MongoDB commands, by collection and command.",
+    ["collection", "command", "outcome"],
+)
+EXTERNAL_CALL_DURATION = Histogram(
+    "external_call_duration_seconds",
+    "Time spent on calls to external services (email, cloudinary).",
+    ["service", "operation", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+BCRYPT_DURATION = Histogram(
+    "bcrypt_duration_seconds",
+    "Time spent hashing and checking passwords, including the pool queue.",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 2, 5),
+)
+
+
+@contextmanager
+def time_call(service: str, operation: str) -> Iterator[None]:
+    """
+    Records the duration of a call to an external service,
+    labelled with whether it raised an exception.
+    """
+
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        EXTERNAL_CALL_DURATION.labels(service, operation, outcome).observe(
+            time.perf_counter() - started
+        )
+
+
+class StatsCollector:
+    """
+    Exports the stats() counters of the in-process caches and pools as gauges.
+
+    These live in the memory of each worker, so they are labelled with the
+    pid of the worker that answered the scrape.
+    """
+
+    def __init__(self) -> None:
+        self.sources: Dict[str, Callable[[], Dict[str, float]]] = {}
+
+    def register(self, name: str, stats: Callable[[], Dict[str, float]]) -> None:
+        self.sources[name] = stats
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        pid = str(os.getpid())
+        for name, stats in self.sources.items():
+            for key, value in stats().items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                gauge = GaugeMetricFamily(
+                    f"{name}_{key}", f"{name} {key.replace('_', ' ')}.", labels=["pid"]
+                )
+                gauge.add_metric([pid], value)
+                yield gauge
+
+
+stats_collector = StatsCollector()
+if MULTIPROCESS_DIR is None:
+    REGISTRY.register(stats_collector)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Renders the metrics in the prometheus text format,
+    aggregated across workers in multiprocess mode.
+
+    :return: The metrics and their content type.
+    :rtype: tuple
+    """
+
+    if MULTIPROCESS_DIR is None:
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(stats_collector)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drops the live gauges of this worker when it shuts down."""
+
+    if MULTIPROCESS_DIR is not None:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,60 @@
+# Stdlib Imports
+import time
+
+# Starlette Imports
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Own Imports
+from apps.monitoring.metrics import (
+    HTTP_REQUESTS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+
+
+class MetricsMiddleware:
+    """
+    Records the latency, status code and in flight count of http requests.
+
+    Requests are labelled with the path template of their route
+    (e.g. /jobs/{job_id}/) so that path parameters do not create new series.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    @staticmethod
+    def route_name(scope: Scope) -> str:
+        for route in scope["app"].routes:
+            match, _ = route.matches(scope)
+            if match != Match.NONE:
+                return route.path
+        return "unmatched"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = self.route_name(scope)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route).observe(
+                time.perf_counter() - started
+            )
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            in_progress.dec()
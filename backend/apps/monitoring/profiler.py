@@ -0,0 +1,131 @@
+# Stdlib Imports
+import os
+import re
+import hmac
+import time
+import random
+import logging
+from typing import Optional
+
+# Starlette Imports
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:  # pragma: no cover - pyinstrument is optional
+    Profiler = None
+
+
+# Set logger
+logger = logging.getLogger(__name__)
+
+# Header carrying the profiler secret
+PROFILE_HEADER = b"x-profile"
+
+
+def profiler_available() -> bool:
+    return Profiler is not None
+
+
+class ProfilerMiddleware:
+    """
+    Profiles a sample of the requests, and every request carrying the
+    profiler secret in the X-Profile header, with pyinstrument.
+
+    Profiles are written in the speedscope format to a directory that keeps
+    only the most recent ones. A single request is profiled at a time per
+    worker, requests arriving meanwhile are not sampled.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        directory: str,
+        sample_rate: float = 0.0,
+        secret: str = "",
+        interval: float = 0.001,
+        max_files: int = 100,
+    ) -> None:
+        """
+        This method initializes the middleware.
+
+        :param directory: The directory the profiles are written to
+        :type directory: str
+
+        :param sample_rate: The fraction of requests to profile
+        :type sample_rate: float
+
+        :param secret: The X-Profile header value that forces profiling
+        :type secret: str
+
+        :param interval: The sampling interval of the profiler in seconds
+        :type interval: float
+
+        :param max_files: The number of profiles kept in the directory
+        :type max_files: int
+        """
+
+        self.app = app
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.secret = secret.encode()
+        self.interval = interval
+        self.max_files = max_files
+        self.active = False
+        os.makedirs(directory, exist_ok=True)
+
+    def should_profile(self, scope: Scope) -> bool:
+        if self.active:
+            return False
+        if self.secret:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return hmac.compare_digest(value, self.secret)
+        return random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self.active = True
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+            self.active = False
+            await run_in_threadpool(self.save, profiler, scope)
+
+    def save(self, profiler: "Profiler", scope: Scope) -> Optional[str]:
+        """
+        This method writes the profile and removes the oldest profiles
+        beyond the number of files kept.
+
+        :return: The path of the profile
+        :rtype: str
+        """
+
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", scope["path"]).strip("-") or "root"
+        path = os.path.join(
+            self.directory,
+            f"{time.time_ns()}-{scope['method']}-{slug[:64]}.speedscope.json",
+        )
+        try:
+            with open(path, "w") as profile:
+                profile.write(profiler.output(SpeedscopeRenderer()))
+
+            profiles = sorted(
+                name
+                for name in os.listdir(self.directory)
+                if name.endswith(".speedscope.json")
+            )
+            for name in profiles[: -self.max_files]:
+                os.remove(os.path.join(self.directory, name))
+        except OSError:
+            logger.exception("Could not save the profile of %s.", scope["path"])
+            return None
+        return path
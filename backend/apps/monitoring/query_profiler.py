@@ -0,0 +1,259 @@
+# Stdlib Imports
+import json
+import asyncio
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+# Starlette Imports
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Own Imports
+from config.database import database
+
+# Third Party Imports
+from pymongo import monitoring
+
+
+# Set logger
+logger = logging.getLogger(__name__)
+
+# Commands that can be explained
+EXPLAINABLE_COMMANDS = {
+    "find",
+    "aggregate",
+    "count",
+    "distinct",
+    "findAndModify",
+    "update",
+    "delete",
+}
+
+# Command fields that explain does not accept
+SESSION_FIELDS = {
+    "lsid",
+    "txnNumber",
+    "autocommit",
+    "startTransaction",
+    "readConcern",
+    "writeConcern",
+}
+
+
+class QueryLog:
+    """The database commands issued while handling a request."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.commands: Counter = Counter()
+        self.slow: List[Tuple[str, Dict[str, Any], float]] = []
+
+
+# The query log of the request being handled
+current_query_log: ContextVar[Optional[QueryLog]] = ContextVar(
+    "current_query_log", default=None
+)
+
+
+def log_event(event: str, **fields: Any) -> None:
+    logger.warning(json.dumps({"event": event, **fields}, default=str))
+
+
+def command_target(command_name: str, command: Dict[str, Any]) -> str:
+    target = command.get("collection" if command_name == "getMore" else command_name)
+    return target if isinstance(target, str) else ""
+
+
+def redact(value: Any) -> Any:
+    """
+    Replaces the values of a query with "?", keeping its shape (fields,
+    operators and nesting), so that logged queries carry no user data.
+    """
+
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return None if value is None else "?"
+
+
+def plan_summary(plan: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Walks the winning plan of an explain output, returning its stages
+    and the indexes it uses.
+    """
+
+    stages, indexes = [], []
+    pending = [plan]
+    while pending:
+        stage = pending.pop()
+        stages.append(stage.get("stage", ""))
+        if "indexName" in stage:
+            indexes.append(stage["indexName"])
+        pending.extend(stage.get("inputStages", []))
+        if "inputStage" in stage:
+            pending.append(stage["inputStage"])
+    return {"stages": stages, "indexes": indexes}
+
+
+class QueryProfilerListener(monitoring.CommandListener):
+    """
+    Counts the database commands of the current request and keeps the
+    ones slower than the budget, so that they can be explained.
+
+    Motor runs the commands in threads that inherit the context of the
+    request, so the query log of the request is available here.
+    """
+
+    def __init__(self, slow_ms: float) -> None:
+        self.slow_ms = slow_ms
+        self.pending: Dict[Tuple, Tuple[str, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def key(event) -> Tuple:
+        return (event.connection_id, event.request_id)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self.pending[self.key(event)] = (event.database_name, event.command)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self.record(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self.record(event)
+
+    def record(self, event) -> None:
+        database_name, command = self.pending.pop(self.key(event), ("", None))
+        duration_ms = event.duration_micros / 1000
+        query_log = current_query_log.get()
+
+        if query_log is not None:
+            query_log.count += 1
+            query_log.duration += duration_ms
+            target = command_target(event.command_name, command or {})
+            query_log.commands[f"{event.command_name} {target}".strip()] += 1
+
+        if (
+            command is None
+            or duration_ms < self.slow_ms
+            or event.command_name not in EXPLAINABLE_COMMANDS
+        ):
+            return
+        if query_log is not None:
+            query_log.slow.append((database_name, command, duration_ms))
+        else:
+            log_event(
+                "slow_query",
+                command=event.command_name,
+                collection=command_target(event.command_name, command),
+                duration_ms=round(duration_ms, 2),
+            )
+
+
+class QueryProfilerMiddleware:
+    """
+    Tracks the database commands of every request. Once the response is
+    sent it logs requests issuing more commands than the threshold (a
+    sign of N+1 queries) and explains their slow commands.
+    """
+
+    def __init__(
+        self, app: ASGIApp, max_queries: int = 10, explain: bool = True
+    ) -> None:
+        """
+        This method initializes the middleware.
+
+        :param max_queries: The number of commands a request may issue
+        :type max_queries: int
+
+        :param explain: Explain the slow commands of the request
+        :type explain: bool
+        """
+
+        self.app = app
+        self.max_queries = max_queries
+        self.explain = explain
+        self.tasks = set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        query_log = QueryLog()
+        token = current_query_log.set(query_log)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_query_log.reset(token)
+            self.report(scope, query_log)
+
+    def report(self, scope: Scope, query_log: QueryLog) -> None:
+        request = f"{scope['method']} {scope['path']}"
+        if query_log.count > self.max_queries:
+            log_event(
+                "too_many_queries",
+                request=request,
+                queries=query_log.count,
+                duration_ms=round(query_log.duration, 2),
+                commands=dict(query_log.commands.most_common(5)),
+            )
+
+        for database_name, command, duration_ms in query_log.slow:
+            if not self.explain:
+                log_event(
+                    "slow_query",
+                    request=request,
+                    command=next(iter(command)),
+                    duration_ms=round(duration_ms, 2),
+                )
+                continue
+
+            # explain in the background, the response is already sent
+            task = asyncio.create_task(
+                self.explain_command(request, database_name, command, duration_ms)
+            )
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def explain_command(
+        self,
+        request: str,
+        database_name: str,
+        command: Dict[str, Any],
+        duration_ms: float,
+    ) -> None:
+        """
+        This method explains a slow command and logs its winning plan.
+        """
+
+        command_name = next(iter(command))
+        command = {
+            key: value
+            for key, value in command.items()
+            if not key.startswith("$") and key not in SESSION_FIELDS
+        }
+        try:
+            explained = await database.client[database_name].command(
+                {"explain": command, "verbosity": "queryPlanner"}
+            )
+            if "queryPlanner" not in explained:
+                # aggregations report the plan of their first stage
+                explained = explained["stages"][0]["$cursor"]
+            winning_plan = explained["queryPlanner"]["winningPlan"]
+            plan = plan_summary(winning_plan.get("queryPlan", winning_plan))
+        except Exception as e:
+            # the error message can quote the query values
+            plan = {"error": type(e).__name__}
+
+        log_event(
+            "slow_query",
+            request=request,
+            command=command_name,
+            collection=command_target(command_name, command),
+            duration_ms=round(duration_ms, 2),
+            filter=redact(command.get("filter", command.get("query"))),
+            plan=plan,
+        )
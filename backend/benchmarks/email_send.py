@@ -0,0 +1,95 @@
+"""
+Benchmarks EmailManager sends per second against a local stub provider,
+opening a client per send (the previous behaviour) versus borrowing the
+application's shared, pooled client.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.email_send --sends 500 --concurrency 20
+"""
+
+# Stdlib Imports
+import time
+import asyncio
+import argparse
+
+# Own Imports
+from config.http_client import http_client
+from apps.accounts.manager.email_manager import EmailManager
+
+# Third Party Imports
+import httpx
+
+
+STUB_RESPONSE = b'{"success": true}'
+
+
+async def handle_stub_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Answers every request on a keep-alive connection with a success body."""
+
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(STUB_RESPONSE), STUB_RESPONSE)
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def run(sends: int, concurrency: int, shared: bool, url: str) -> float:
+    """Sends the emails and returns the number of sends per second."""
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send_one() -> None:
+        async with semaphore:
+            em = EmailManager("receiver@example.com")
+            em.api_mode, em.api_url = "production", url
+            if shared:
+                await em.send("subject", "content", provider="mailtrap")
+            else:
+                async with httpx.AsyncClient() as client:
+                    await em.with_mailtrap(client, "subject", "content")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send_one() for _ in range(sends)))
+    return sends / (time.perf_counter() - started)
+
+
+async def main(sends: int, concurrency: int) -> None:
+    server = await asyncio.start_server(handle_stub_connection, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    url = f"http://{host}:{port}/"
+
+    http_client.start()
+    try:
+        for label, shared in (("client per send", False), ("shared client", True)):
+            rate = await run(sends, concurrency, shared, url)
+            print(f"{label:>16}: {rate:,.0f} sends/s")
+    finally:
+        await http_client.shutdown()
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sends", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sends, args.concurrency))
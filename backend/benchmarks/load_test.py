@@ -0,0 +1,268 @@
+"""
+Load tests the auth and upload flows of the application in process.
+
+Virtual users run register -> login -> /users/me/ -> token refresh ->
+recover -> verify -> complete -> login, and upload an image, against the ASGI application. The
+email provider and Cloudinary are answered by a local stand-in on the shared
+http client, and the job worker runs in process to deliver the emails.
+
+The database is kept in memory, or with --mongodb is a throwaway database on
+MONGODB_URI (e.g. the docker compose db service), dropped after the run.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.load_test --users 50 --iterations 4 --output load.json
+    python -m benchmarks.load_test --compare load.json
+"""
+
+# Stdlib Imports
+import os
+import json
+import time
+import uuid
+import asyncio
+import argparse
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+# Own Imports
+from config.secrets import get_settings
+from config.database import database
+from config.http_client import http_client
+from entrypoint import application
+from apps.jobs.manager.worker_manager import JobWorker
+from apps.accounts.manager.rate_limit_manager import rate_limiter
+from apps.accounts.manager.db_manager import get_user_otp_timeout
+
+# Register the job handlers run by the in process worker
+import apps.accounts.tasks  # noqa: F401
+import apps.commoners.tasks  # noqa: F401
+
+# Third Party Imports
+import httpx
+
+
+class StandInProviders:
+    """
+    Answers the requests the application makes to the email provider
+    and Cloudinary, after a simulated network latency.
+    """
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.requests: Dict[str, int] = defaultdict(int)
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.latency)
+        if request.url.path.endswith("/image/upload"):
+            self.requests["cloudinary"] += 1
+            url = f"https://res.cloudinary.test/{uuid.uuid4().hex}.png"
+            return httpx.Response(200, json={"secure_url": url})
+
+        self.requests["email"] += 1
+        return httpx.Response(200, json={"success": True})
+
+
+class LoadTest:
+    """Runs the virtual users and records the latency of every request."""
+
+    def __init__(self, client: httpx.AsyncClient, upload_size: int) -> None:
+        self.client = client
+        self.upload_size = upload_size
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(
+        self, method: str, path: str, route: Optional[str] = None, **kwargs: Any
+    ) -> httpx.Response:
+        route = f"{method} {route or path}"
+        started = time.perf_counter()
+        response = await self.client.request(method, path, **kwargs)
+        self.latencies[route].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[route] += 1
+        return response
+
+    async def auth_flow(self) -> None:
+        email = f"load-{uuid.uuid4().hex}@example.com"
+        password, new_password = "password1", "password2"
+
+        await self.request(
+            "POST",
+            "/users/register/",
+            json={
+                "first_name": "Load",
+                "last_name": "Test",
+                "primary_email": email,
+                "password": password,
+            },
+        )
+        response = await self.request(
+            "POST", "/users/login/", json={"email": email, "password": password}
+        )
+        tokens = response.json()
+        await self.request(
+            "GET",
+            "/users/me/",
+            headers={"Authorization": f"Bearer {tokens.get('token')}"},
+        )
+        await self.request(
+            "POST",
+            "/users/token/refresh/",
+            json={"refresh_token": tokens.get("refresh_token")},
+        )
+
+        await self.request("POST", "/users/recover/", json={"email": email})
+        otp_timeout = await get_user_otp_timeout(email)
+        await self.request(
+            "POST",
+            "/users/recover/verify/",
+            json={"email": email, "otp_code": otp_timeout.otp_code},
+        )
+        await self.request(
+            "POST",
+            "/users/recover/complete/",
+            json={"email": email, "password": new_password},
+        )
+        await self.request(
+            "POST", "/users/login/", json={"email": email, "password": new_password}
+        )
+
+    async def upload_flow(self) -> None:
+        await self.request(
+            "POST",
+            "/commoners/upload/",
+            files={
+                "file_in_memory": (
+                    "image.png",
+                    os.urandom(self.upload_size),
+                    "image/png",
+                )
+            },
+        )
+
+    async def virtual_user(self, iterations: int) -> None:
+        for _ in range(iterations):
+            await self.auth_flow()
+            await self.upload_flow()
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Nearest rank percentile of the values, in milliseconds."""
+
+    ordered = sorted(values)
+    rank = max(int(round(percent / 100 * len(ordered))) - 1, 0)
+    return ordered[rank] * 1000
+
+
+def summarize(load_test: LoadTest, duration: float) -> Dict[str, Dict[str, float]]:
+    return {
+        route: {
+            "requests": len(latencies),
+            "errors": load_test.errors[route],
+            "rps": len(latencies) / duration,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+        }
+        for route, latencies in sorted(load_test.latencies.items())
+    }
+
+
+def print_report(
+    routes: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Any]] = None
+) -> None:
+    print(
+        f"{'route':<32}{'requests':>9}{'errors':>8}{'rps':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        + (f"{'p95 vs base':>13}" if baseline else "")
+    )
+    for route, stats in routes.items():
+        line = (
+            f"{route:<32}{stats['requests']:>9}{stats['errors']:>8}"
+            f"{stats['rps']:>9.1f}{stats['p50_ms']:>9.1f}"
+            f"{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+        )
+        previous = (baseline or {}).get("routes", {}).get(route)
+        if previous:
+            change = (stats["p95_ms"] / previous["p95_ms"] - 1) * 100
+            line += f"{change:>+12.1f}%"
+        print(line)
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    # run against an in memory or a throwaway database
+    settings = get_settings()
+    settings.USE_TEST_DB = not args.mongodb
+
+    # every virtual user shares the client ip
+    rate_limiter.enabled = args.rate_limit
+    settings.MONGODB_DATABASE = f"load_test_{uuid.uuid4().hex[:8]}"
+
+    # answer the email provider and cloudinary locally
+    providers = StandInProviders(args.provider_latency / 1000)
+    http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(providers))
+
+    await application.router.startup()
+    worker = JobWorker(poll_interval=0.05)
+    worker_task = asyncio.create_task(worker.run())
+
+    load_test = LoadTest(
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=application),
+            base_url="http://load-test",
+            timeout=None,
+        ),
+        args.upload_size,
+    )
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(load_test.virtual_user(args.iterations) for _ in range(args.users))
+        )
+        duration = time.perf_counter() - started
+    finally:
+        worker.stop()
+        await worker_task
+        await load_test.client.aclose()
+        await database.client.drop_database(settings.MONGODB_DATABASE)
+        await application.router.shutdown()
+
+    return {
+        "users": args.users,
+        "iterations": args.iterations,
+        "provider_latency_ms": args.provider_latency,
+        "database": "mongodb" if args.mongodb else "memory",
+        "duration_s": duration,
+        "provider_requests": dict(providers.requests),
+        "routes": summarize(load_test, duration),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=2)
+    parser.add_argument("--upload-size", type=int, default=64 * 1024)
+    parser.add_argument("--provider-latency", type=float, default=20, help="in ms")
+    parser.add_argument(
+        "--mongodb", action="store_true", help="run against MONGODB_URI"
+    )
+    parser.add_argument(
+        "--rate-limit", action="store_true", help="enforce the auth rate limits"
+    )
+    parser.add_argument("--output", help="save the results to this json file")
+    parser.add_argument("--compare", help="compare with the results of a saved run")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as previous:
+            baseline = json.load(previous)
+    print_report(results["routes"], baseline)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
@@ -0,0 +1,254 @@
+"""
+Micro-benchmarks of the primitives every request goes through: JWT signing
+and verification, the bearer dependency, bcrypt at the configured cost, DTO
+validation, User construction and serialization, and the middleware stack.
+
+Results are machine specific, so baselines are recorded locally rather than
+committed. compare exits with status 1 when a benchmark got slower than its
+baseline by more than the tolerance.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.micro run --output micro-baseline.json
+    python -m benchmarks.micro compare micro-baseline.json --tolerance 0.15
+"""
+
+# Stdlib Imports
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Starlette Imports
+from starlette.requests import Request
+
+# Own Imports
+from entrypoint import application
+from apps.accounts.models.accounts import User
+from apps.accounts.dto.users_dto import UserCreateDTO
+from apps.accounts.manager.jwt.bearer import jwt_bearer
+from apps.accounts.manager.bcrypt_manager import bcrypt_hasher
+from apps.accounts.manager.jwt.handler import (
+    JWTAuthHandler,
+    VerifiedTokenCache,
+    auth_handler,
+)
+
+
+# Number of timed rounds, the median round is reported
+ROUNDS = 7
+
+USER_ID = "64b7f1f4c1d2e3a4b5c6d7e8"
+USER_EMAIL = "ada@example.com"
+USER_PAYLOAD = {
+    "first_name": "Ada",
+    "last_name": "Lovelace",
+    "primary_email": USER_EMAIL,
+    "password": "password1",
+}
+
+
+def time_sync(fn: Callable[[], Any], number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - started
+
+
+def time_async(fn: Callable[[], Awaitable[Any]], number: int) -> float:
+    async def run() -> float:
+        started = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        return time.perf_counter() - started
+
+    return asyncio.run(run())
+
+
+def measure(
+    timer: Callable[[Callable, int], float], fn: Callable, number: int
+) -> Dict[str, Any]:
+    """Runs the benchmark for a number of rounds, in microseconds per call."""
+
+    timer(fn, max(number // 10, 1))  # warm up
+    per_call = [timer(fn, number) / number * 1e6 for _ in range(ROUNDS)]
+    return {
+        "us_per_op": statistics.median(per_call),
+        "min_us_per_op": min(per_call),
+        "number": number,
+        "rounds": ROUNDS,
+    }
+
+
+def asgi_call(app: Callable, path: str = "/") -> Callable[[], Awaitable[None]]:
+    """Returns a coroutine function sending a GET request to the ASGI app."""
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"benchmark"), (b"origin", b"http://benchmark")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("benchmark", 80),
+    }
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        pass
+
+    async def call() -> None:
+        await app(dict(scope), receive, send)
+
+    return call
+
+
+def benchmarks() -> Dict[str, Callable[[], Dict[str, Any]]]:
+    token = auth_handler.sign_jwt(USER_ID, USER_EMAIL)
+    auth_handler.decode_jwt(token)
+
+    uncached_handler = JWTAuthHandler()
+    uncached_handler.verified_tokens = VerifiedTokenCache(maxsize=0)
+
+    bearer_scope = {
+        "type": "http",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    }
+    hashed_password = bcrypt_hasher.hash_password("password1")
+    user = User(
+        **UserCreateDTO(**USER_PAYLOAD).dict(exclude={"password"}),
+        password=hashed_password,
+        date_created=datetime.utcnow(),
+    )
+
+    return {
+        "jwt_sign": lambda: measure(
+            time_sync, lambda: auth_handler.sign_jwt(USER_ID, USER_EMAIL), 5000
+        ),
+        "jwt_decode_cached": lambda: measure(
+            time_sync, lambda: auth_handler.decode_jwt(token), 20000
+        ),
+        "jwt_decode_uncached": lambda: measure(
+            time_sync, lambda: uncached_handler.decode_jwt(token), 5000
+        ),
+        "jwt_bearer_call": lambda: measure(
+            time_async, lambda: jwt_bearer(Request(bearer_scope)), 10000
+        ),
+        "bcrypt_hash": lambda: measure(
+            time_sync, lambda: bcrypt_hasher.hash_password("password1"), 3
+        ),
+        "bcrypt_check": lambda: measure(
+            time_sync,
+            lambda: bcrypt_hasher.check_password("password1", hashed_password),
+            3,
+        ),
+        "user_create_dto_validation": lambda: measure(
+            time_sync, lambda: UserCreateDTO(**USER_PAYLOAD), 10000
+        ),
+        "user_model_construction": lambda: measure(
+            time_sync,
+            lambda: User(
+                **USER_PAYLOAD,
+                date_created=user.date_created,
+            ),
+            10000,
+        ),
+        "user_model_json": lambda: measure(time_sync, user.json, 10000),
+        "request_router_only": lambda: measure(
+            time_async, asgi_call(application.router), 2000
+        ),
+        "request_full_middleware_stack": lambda: measure(
+            time_async, asgi_call(application), 2000
+        ),
+    }
+
+
+def run(only: Optional[List[str]] = None) -> Dict[str, Any]:
+    results = {}
+    for name, benchmark in benchmarks().items():
+        if only and name not in only:
+            continue
+        results[name] = benchmark()
+        print(f"{name:>32}: {results[name]['us_per_op']:12.2f} us/op")
+
+    if "request_router_only" in results and "request_full_middleware_stack" in results:
+        overhead = (
+            results["request_full_middleware_stack"]["us_per_op"]
+            - results["request_router_only"]["us_per_op"]
+        )
+        print(f"{'middleware stack overhead':>32}: {overhead:12.2f} us/request")
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "date": datetime.utcnow().isoformat(),
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Prints the change of every benchmark against the baseline and
+    returns the names of the benchmarks that regressed.
+    """
+
+    regressions = []
+    print(f"\n{'benchmark':>32}  {'baseline':>10}  {'current':>10}  change")
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(f"{name:>32}  {'-':>10}  {result['us_per_op']:10.2f}  new")
+            continue
+
+        change = result["us_per_op"] / previous["us_per_op"] - 1
+        regressed = change > tolerance
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:>32}  {previous['us_per_op']:10.2f}  {result['us_per_op']:10.2f}"
+            f"  {change:+.1%}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", help="save the results as a baseline")
+    run_parser.add_argument("--only", nargs="*", help="benchmarks to run")
+
+    compare_parser = commands.add_parser("compare", help="compare with a baseline")
+    compare_parser.add_argument("baseline", help="results saved by run --output")
+    compare_parser.add_argument("--tolerance", type=float, default=0.15)
+    compare_parser.add_argument("--only", nargs="*", help="benchmarks to run")
+    args = parser.parse_args()
+
+    results = run(args.only)
+
+    if args.command == "run" and args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.command == "compare":
+        with open(args.baseline) as baseline:
+            regressions = compare(json.load(baseline), results, args.tolerance)
+        if regressions:
+            print(f"\nRegressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
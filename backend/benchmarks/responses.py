@@ -0,0 +1,74 @@
+"""
+Benchmarks rendering the register response: the previous model.json(),
+json.loads() and stdlib JSONResponse round trip versus FastJSONResponse
+serializing the odmantic model directly.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.responses --iterations 20000
+"""
+
+# Stdlib Imports
+import json
+import time
+import argparse
+from datetime import datetime
+from typing import Callable
+
+# Starlette Imports
+from starlette.responses import JSONResponse
+
+# Own Imports
+from config.responses import FastJSONResponse, orjson
+from apps.accounts.models.accounts import User
+
+
+def build_user() -> User:
+    return User(
+        first_name="Ada",
+        last_name="Lovelace",
+        primary_email="ada@example.com",
+        password="$2b$12$" + "x" * 53,
+        date_created=datetime.utcnow(),
+    )
+
+
+def measure(label: str, render: Callable[[], bytes], iterations: int) -> float:
+    """Renders the response and prints the time per response in microseconds."""
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    per_response = (time.perf_counter() - started) / iterations * 1e6
+    print(f"{label:>24}: {per_response:8.2f} us/response")
+    return per_response
+
+
+def main(iterations: int) -> None:
+    user = build_user()
+
+    def stdlib_round_trip() -> bytes:
+        return JSONResponse(
+            {"message": "Account created successfully", "data": json.loads(user.json())}
+        ).body
+
+    def fast_response() -> bytes:
+        return FastJSONResponse(
+            {"message": "Account created successfully", "data": user}
+        ).body
+
+    # both paths must produce the same document
+    assert json.loads(stdlib_round_trip()) == json.loads(fast_response())
+
+    print(f"encoder: {'orjson' if orjson is not None else 'stdlib json'}")
+    before = measure("json.loads(model.json())", stdlib_round_trip, iterations)
+    after = measure("FastJSONResponse", fast_response, iterations)
+    print(f"{'saved':>24}: {before - after:8.2f} us/response")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    main(args.iterations)
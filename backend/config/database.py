@@ -1,13 +1,207 @@
 # Stdlib Imports
-import os
+import time
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+# Own Imports
+from config.secrets import get_settings
+from config.memory_database import InMemoryClient, InMemoryEngine
 
 # Third party Imports
 from odmantic import AIOEngine
+from pymongo import monitoring
 from motor.motor_asyncio import AsyncIOMotorClient
 
 
-# Set up motor client and odmantic engine
-client = AsyncIOMotorClient(os.environ["MONGODB_URI"])
-engine = AIOEngine(
-    client=client, database="<project_db>"
-)  # replace <project_db> with database name
+# Set settings
+settings = get_settings()
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """
+    Responsible for recording connection pool metrics from pymongo's events:
+
+    - how long operations wait to check out a connection
+    - how many connections are open and checked out
+    - how many check outs failed (e.g. wait queue timeouts)
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.open_connections = 0
+        self.checked_out = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+
+    def connection_check_out_started(self, event) -> None:
+        # check out start and end are reported on the same thread
+        self.local.started = time.perf_counter()
+
+    def connection_checked_out(self, event) -> None:
+        waited = time.perf_counter() - getattr(
+            self.local, "started", time.perf_counter()
+        )
+        with self.lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.checkout_wait_total += waited
+            self.checkout_wait_max = max(self.checkout_wait_max, waited)
+
+    def connection_check_out_failed(self, event) -> None:
+        with self.lock:
+            self.checkout_failures += 1
+
+    def connection_checked_in(self, event) -> None:
+        with self.lock:
+            self.checked_out -= 1
+
+    def connection_created(self, event) -> None:
+        with self.lock:
+            self.open_connections += 1
+
+    def connection_closed(self, event) -> None:
+        with self.lock:
+            self.open_connections -= 1
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def stats(self) -> Dict[str, float]:
+        """
+        This method returns the connection pool metrics.
+
+        :return: The connection counts and check out wait times in seconds.
+        :rtype: dict
+        """
+
+        with self.lock:
+            return {
+                "open_connections": self.open_connections,
+                "checked_out": self.checked_out,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "checkout_wait_total": self.checkout_wait_total,
+                "checkout_wait_max": self.checkout_wait_max,
+                "checkout_wait_avg": (
+                    self.checkout_wait_total / self.checkouts if self.checkouts else 0.0
+                ),
+            }
+
+
+class DatabaseManager:
+    """
+    Responsible for the following:
+
+    - creating the motor client and odmantic engine from the settings,
+      or an in memory client and engine when USE_TEST_DB is set
+    - warming the connection pool up on application startup
+    - closing the client on application shutdown
+    """
+
+    def __init__(self) -> None:
+        self.client: Optional[Union[AsyncIOMotorClient, InMemoryClient]] = None
+        self._engine: Optional[AIOEngine] = None
+        self.pool_listener = PoolMetricsListener()
+        self.listeners: List[Any] = []
+
+    def add_listener(self, listener: Any) -> None:
+        """
+        This method adds a pymongo event listener to the client.
+        Listeners must be added before the client is created.
+        """
+
+        self.listeners.append(listener)
+
+    def start(self) -> None:
+        """
+        This method creates the client and the engine.
+        """
+
+        if self._engine is not None:
+            return
+
+        if settings.USE_TEST_DB:
+            self.client = InMemoryClient()
+            self._engine = InMemoryEngine(
+                client=self.client, database=settings.MONGODB_DATABASE
+            )
+            return
+
+        options: Dict[str, Any] = {
+            "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+            "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+            "event_listeners": [self.pool_listener, *self.listeners],
+        }
+        if settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS:
+            options["waitQueueTimeoutMS"] = settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS
+        if settings.MONGODB_COMPRESSORS:
+            options["compressors"] = settings.MONGODB_COMPRESSORS
+
+        self.client = AsyncIOMotorClient(settings.MONGODB_URI, **options)
+        self._engine = AIOEngine(client=self.client, database=settings.MONGODB_DATABASE)
+
+    async def warm_up(self) -> None:
+        """
+        This method opens minPoolSize connections up front, so that the
+        first requests of the worker do not pay for connecting.
+        """
+
+        self.start()
+        await asyncio.gather(
+            *(
+                self.client.admin.command("ping")
+                for _ in range(max(settings.MONGODB_MIN_POOL_SIZE, 1))
+            )
+        )
+
+    def shutdown(self) -> None:
+        """
+        This method closes the client and its connections.
+        """
+
+        if self.client is not None:
+            self.client.close()
+        self.client = None
+        self._engine = None
+
+    @property
+    def engine(self) -> AIOEngine:
+        """The odmantic engine, created on first use outside the application."""
+
+        if self._engine is None:
+            self.start()
+        return self._engine
+
+
+class EngineProxy:
+    """
+    Stands in for the engine at import time, forwarding to the engine
+    created by the database manager once the application starts.
+    """
+
+    def __init__(self, manager: DatabaseManager) -> None:
+        self._manager = manager
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._manager.engine, name)
+
+
+# Set up database manager and odmantic engine
+database = DatabaseManager()
+engine = EngineProxy(database)
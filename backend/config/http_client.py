@@ -0,0 +1,73 @@
+# Stdlib Imports
+import logging
+import importlib.util
+from typing import Optional
+
+# Own Imports
+from config.secrets import get_settings
+
+# Third Party Imports
+import httpx
+
+
+# Set settings and logger
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class HTTPClientManager:
+    """
+    Responsible for the following:
+
+    - creating the shared outbound http client on application startup
+    - closing it on application shutdown
+
+    Services borrow the client instead of opening their own, so connections
+    to third party providers are pooled and kept alive across requests.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def start(self) -> None:
+        """
+        This method creates the shared client from the settings.
+        """
+
+        if self._client is not None:
+            return
+
+        http2 = settings.HTTP_CLIENT_HTTP2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the h2 package is missing.")
+            http2 = False
+
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=settings.HTTP_CLIENT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    async def shutdown(self) -> None:
+        """
+        This method closes the shared client and its pooled connections.
+        """
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client, created on first use outside the application."""
+
+        if self._client is None:
+            self.start()
+        return self._client
+
+
+http_client = HTTPClientManager()
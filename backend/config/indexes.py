@@ -0,0 +1,193 @@
+# Stdlib Imports
+import asyncio
+import logging
+from typing import Any, Dict, List, Sequence, Set, Type
+
+# Own Imports
+from config.database import database, engine
+from apps.jobs.models.jobs import Job
+from apps.commoners.models import UploadedFile
+from apps.accounts.models.accounts import (
+    User,
+    OTPTimeout,
+    RefreshToken,
+    RevokedToken,
+    RateLimitBucket,
+)
+
+# Third Party Imports
+from odmantic import Model
+from odmantic.index import ODMBaseIndex
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+
+# Set logger
+logger = logging.getLogger(__name__)
+
+# Models whose indexes are managed on startup
+DATABASE_MODELS: List[Type[Model]] = [
+    User,
+    OTPTimeout,
+    RefreshToken,
+    RevokedToken,
+    RateLimitBucket,
+    UploadedFile,
+    Job,
+]
+
+# Index options compared with the existing indexes
+INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+# Errors of indexes created or dropped concurrently by another process
+INDEX_NOT_FOUND = 27
+INDEX_CONFLICTS = {85, 86}  # IndexOptionsConflict, IndexKeySpecsConflict
+
+
+def expected_indexes(model: Type[Model]) -> List[IndexModel]:
+    indexes = []
+    for index in model.__indexes__():
+        if isinstance(index, ODMBaseIndex):
+            index = index.get_pymongo_index()
+        indexes.append(index)
+    return indexes
+
+
+def expected_index_names(model: Type[Model]) -> List[str]:
+    return [index.document["name"] for index in expected_indexes(model)]
+
+
+def index_differences(expected: Dict[str, Any], existing: Dict[str, Any]) -> Set[str]:
+    """Returns the parts of an existing index that differ from its declaration."""
+
+    expected_key = [(field, int(order)) for field, order in expected["key"].items()]
+    existing_key = [(field, int(order)) for field, order in existing["key"]]
+    if expected_key != existing_key:
+        return {"key"}
+
+    return {
+        option
+        for option in INDEX_OPTIONS
+        if (expected.get(option) or None) != (existing.get(option) or None)
+    }
+
+
+async def create_index(collection: Any, index: IndexModel) -> bool:
+    """
+    Creates an index, tolerating another process creating it at the same
+    time, possibly with other options during a rolling deploy.
+
+    Returns:
+        bool: the index was created by this call
+    """
+
+    try:
+        await collection.create_indexes([index])
+    except OperationFailure as e:
+        if e.code not in INDEX_CONFLICTS:
+            raise
+        logger.warning(
+            "Index %s on %s was created concurrently with other options.",
+            index.document["name"],
+            collection.name,
+        )
+        return False
+    return True
+
+
+async def configure_indexes(
+    models: Sequence[Type[Model]] = DATABASE_MODELS, migrate: bool = False
+) -> Dict[str, List[str]]:
+    """
+    Creates the missing indexes declared on the models and verifies they
+    all exist. The ttl of a ttl index (e.g. the otp ttl) is updated in place
+    with collMod, which is safe while other processes start.
+
+    Indexes whose key or other options changed have to be dropped and
+    recreated. Only the migration does it (migrate=True), as run once by the
+    job worker or `python -m config.indexes`. Application workers log them
+    and keep the existing index.
+
+    Args:
+        models (list): the models to configure
+        migrate (bool): replace the indexes whose key or options changed
+
+    Raises:
+        RuntimeError: an expected index is missing after configuration
+
+    Returns:
+        dict: the names of the indexes created, per collection
+    """
+
+    created: Dict[str, List[str]] = {}
+    for model in models:
+        collection = engine.get_collection(model)
+        existing = await collection.index_information()
+        created[model.__collection__] = []
+
+        for index in expected_indexes(model):
+            name = index.document["name"]
+            if name not in existing:
+                if await create_index(collection, index):
+                    created[model.__collection__].append(name)
+                continue
+
+            changes = index_differences(index.document, existing[name])
+            if not changes:
+                continue
+
+            if changes == {"expireAfterSeconds"}:
+                await engine.database.command(
+                    {
+                        "collMod": collection.name,
+                        "index": {
+                            "name": name,
+                            "expireAfterSeconds": index.document["expireAfterSeconds"],
+                        },
+                    }
+                )
+                logger.info("Updated the ttl of %s on %s.", name, collection.name)
+            elif migrate:
+                try:
+                    await collection.drop_index(name)
+                except OperationFailure as e:
+                    if e.code != INDEX_NOT_FOUND:
+                        raise
+                await create_index(collection, index)
+                logger.info("Recreated %s on %s.", name, collection.name)
+            else:
+                logger.warning(
+                    "Index %s on %s differs in %s, run the index migration.",
+                    name,
+                    collection.name,
+                    ", ".join(sorted(changes)),
+                )
+
+        existing = await collection.index_information()
+        missing = set(expected_index_names(model)) - set(existing)
+        if missing:
+            raise RuntimeError(
+                f"Missing indexes on {model.__collection__}: {sorted(missing)}"
+            )
+
+        if created[model.__collection__]:
+            logger.info(
+                "Created indexes on %s: %s",
+                model.__collection__,
+                ", ".join(created[model.__collection__]),
+            )
+
+    return created
+
+
+async def main() -> None:
+    await database.warm_up()
+    try:
+        await configure_indexes(migrate=True)
+    finally:
+        database.shutdown()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,797 @@
+# Stdlib Imports
+import re
+import time
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+# Third Party Imports
+from bson import ObjectId
+from odmantic import AIOEngine, Model
+from odmantic.engine import AIOCursor
+from odmantic.field import ODMReference
+from pymongo import IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from pymongo.results import DeleteResult, InsertOneResult, UpdateResult
+
+
+# Stands for a field missing from a document
+MISSING = object()
+
+# Collections with ttl indexes are swept at most this often, in seconds
+TTL_SWEEP_INTERVAL = 1
+
+
+def clone(value: Any) -> Any:
+    """Copies the containers of a value, so stored documents are not shared."""
+
+    if isinstance(value, dict):
+        return {key: clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [clone(item) for item in value]
+    return value
+
+
+def get_path(document: Mapping[str, Any], path: str) -> Any:
+    value: Any = document
+    for part in path.split("."):
+        if not isinstance(value, Mapping) or part not in value:
+            return MISSING
+        value = value[part]
+    return value
+
+
+def set_path(document: Dict[str, Any], path: str, value: Any) -> None:
+    *parents, last = path.split(".")
+    for part in parents:
+        document = document.setdefault(part, {})
+    document[last] = value
+
+
+def unset_path(document: Dict[str, Any], path: str) -> None:
+    *parents, last = path.split(".")
+    for part in parents:
+        document = document.get(part)
+        if not isinstance(document, dict):
+            return
+    document.pop(last, None)
+
+
+def search(pattern: Any, value: Any, flags: int = 0) -> bool:
+    """Matches a string or the strings of an array, as a regular expression query."""
+
+    if isinstance(value, list):
+        return any(search(pattern, item, flags) for item in value)
+    if not isinstance(value, str):
+        return False
+    if isinstance(pattern, re.Pattern):
+        return bool(pattern.search(value))
+    return bool(re.search(pattern, value, flags))
+
+
+def equals(value: Any, expected: Any) -> bool:
+    if isinstance(expected, re.Pattern):
+        return search(expected, value)
+    if value is MISSING:
+        return expected is None
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return value == expected
+
+
+def compare(value: Any, argument: Any, operator: str) -> bool:
+    if value is MISSING or value is None or argument is None:
+        return False
+    try:
+        if operator == "$gt":
+            return value > argument
+        if operator == "$gte":
+            return value >= argument
+        if operator == "$lt":
+            return value < argument
+        return value <= argument
+    except TypeError:
+        return False
+
+
+def is_operator_expression(condition: Any) -> bool:
+    return (
+        isinstance(condition, Mapping)
+        and len(condition) > 0
+        and all(key.startswith("$") for key in condition)
+    )
+
+
+def match_condition(value: Any, condition: Any) -> bool:
+    if not is_operator_expression(condition):
+        return equals(value, condition)
+
+    for operator, argument in condition.items():
+        if operator == "$eq":
+            matched = equals(value, argument)
+        elif operator == "$ne":
+            matched = not equals(value, argument)
+        elif operator in ("$gt", "$gte", "$lt", "$lte"):
+            matched = compare(value, argument, operator)
+        elif operator == "$in":
+            matched = any(equals(value, item) for item in argument)
+        elif operator == "$nin":
+            matched = not any(equals(value, item) for item in argument)
+        elif operator == "$exists":
+            matched = (value is not MISSING) == bool(argument)
+        elif operator == "$regex":
+            matched = search(
+                argument, value, re.I if "i" in condition.get("$options", "") else 0
+            )
+        elif operator == "$options":
+            matched = True
+        elif operator == "$not":
+            matched = not match_condition(value, argument)
+        else:
+            raise NotImplementedError(f"Unsupported query operator: {operator}")
+
+        if not matched:
+            return False
+    return True
+
+
+def evaluate(document: Mapping[str, Any], expression: Any) -> Any:
+    """Evaluates an aggregation expression of field paths, literals and comparisons."""
+
+    if isinstance(expression, str) and expression.startswith("$"):
+        value = get_path(document, expression[1:])
+        return None if value is MISSING else value
+    if not is_operator_expression(expression):
+        return expression
+
+    (operator, arguments), *_ = expression.items()
+    if operator in ("$eq", "$ne"):
+        first, second = (evaluate(document, argument) for argument in arguments)
+        return (first == second) == (operator == "$eq")
+    if operator in ("$gt", "$gte", "$lt", "$lte"):
+        first, second = (evaluate(document, argument) for argument in arguments)
+        return compare(first, second, operator)
+    raise NotImplementedError(f"Unsupported expression operator: {operator}")
+
+
+def matches(document: Mapping[str, Any], query: Optional[Mapping[str, Any]]) -> bool:
+    """Checks if a document matches a query, supporting the common operators."""
+
+    for key, condition in (query or {}).items():
+        if key == "$expr":
+            matched = bool(evaluate(document, condition))
+        elif key == "$and":
+            matched = all(matches(document, part) for part in condition)
+        elif key == "$or":
+            matched = any(matches(document, part) for part in condition)
+        elif key == "$nor":
+            matched = not any(matches(document, part) for part in condition)
+        elif key.startswith("$"):
+            raise NotImplementedError(f"Unsupported query operator: {key}")
+        else:
+            matched = match_condition(get_path(document, key), condition)
+
+        if not matched:
+            return False
+    return True
+
+
+def project(
+    document: Mapping[str, Any], projection: Optional[Union[Mapping, Sequence]]
+) -> Dict[str, Any]:
+    if not projection:
+        return clone(dict(document))
+    if not isinstance(projection, Mapping):
+        projection = {field: 1 for field in projection}
+
+    fields = {key: value for key, value in projection.items() if key != "_id"}
+    if any(fields.values()) or (not fields and projection.get("_id")):
+        result = {
+            field: clone(document[field]) for field in fields if field in document
+        }
+        if projection.get("_id", 1) and "_id" in document:
+            result["_id"] = document["_id"]
+        return result
+
+    excluded = set(fields) | ({"_id"} if not projection.get("_id", 1) else set())
+    return {
+        field: clone(value)
+        for field, value in document.items()
+        if field not in excluded
+    }
+
+
+def sort_documents(
+    documents: List[Dict[str, Any]], sort: Optional[Union[Mapping, Sequence]]
+) -> List[Dict[str, Any]]:
+    if not sort:
+        return documents
+    keys = list(sort.items()) if isinstance(sort, Mapping) else list(sort)
+
+    # stable sorts, from the least to the most significant key
+    for field, direction in reversed(keys):
+
+        def sort_key(document: Dict[str, Any]) -> Tuple:
+            value = get_path(document, field)
+            if value is MISSING or value is None:
+                return (0, 0)
+            return (1, value)
+
+        documents.sort(key=sort_key, reverse=direction == -1)
+    return documents
+
+
+def upsert_document(query: Mapping[str, Any]) -> Dict[str, Any]:
+    """Builds the document inserted by an upsert from the equalities of its query."""
+
+    document: Dict[str, Any] = {}
+    for key, condition in query.items():
+        if key.startswith("$"):
+            continue
+        if is_operator_expression(condition):
+            if "$eq" in condition:
+                set_path(document, key, clone(condition["$eq"]))
+        else:
+            set_path(document, key, clone(condition))
+    return document
+
+
+def apply_update(
+    document: Dict[str, Any], update: Mapping[str, Any], inserting: bool
+) -> None:
+    if not is_operator_expression(update):
+        raise ValueError("update only works with $ operators")
+
+    for operator, fields in update.items():
+        for path, value in fields.items():
+            if operator == "$set":
+                set_path(document, path, clone(value))
+            elif operator == "$setOnInsert":
+                if inserting:
+                    set_path(document, path, clone(value))
+            elif operator == "$inc":
+                current = get_path(document, path)
+                set_path(document, path, (0 if current is MISSING else current) + value)
+            elif operator == "$unset":
+                unset_path(document, path)
+            elif operator == "$push":
+                current = get_path(document, path)
+                set_path(
+                    document, path, (list(current) if current is not MISSING else [])
+                )
+                get_path(document, path).append(clone(value))
+            else:
+                raise NotImplementedError(f"Unsupported update operator: {operator}")
+
+
+class InMemoryCursor:
+    """The subset of a motor cursor used by odmantic: to_list and async for."""
+
+    def __init__(self, documents: List[Dict[str, Any]]) -> None:
+        self.documents = documents
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.documents[:length] if length else list(self.documents)
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        for document in self.documents:
+            yield document
+
+
+class InMemoryCollection:
+    """
+    Responsible for keeping the documents of a collection in memory,
+    implementing the subset of the motor collection api the application uses:
+
+    - find, find_one and find_one_and_update, with projections and sorts
+    - insert, update (upserts, $set, $setOnInsert, $inc, $unset, $push) and delete
+    - count_documents
+    - indexes, enforcing unique indexes and expiring documents of ttl
+      indexes, partial ones included
+    """
+
+    def __init__(self, database: "InMemoryDatabase", name: str) -> None:
+        self.database = database
+        self.name = name
+        self.documents: Dict[Any, Dict[str, Any]] = {}
+        self.indexes: Dict[str, Dict[str, Any]] = {
+            "_id_": {"key": [("_id", 1)], "v": 2}
+        }
+        self.unique_values: Dict[str, Dict[Tuple, Any]] = {}
+        self.swept_at = 0.0
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.database.name}.{self.name}"
+
+    # Indexes
+
+    @staticmethod
+    def index_fields(index: Dict[str, Any]) -> List[str]:
+        return [field for field, _ in index["key"]]
+
+    def index_value(self, name: str, document: Mapping[str, Any]) -> Optional[Tuple]:
+        index = self.indexes[name]
+        value = tuple(
+            None if get_path(document, field) is MISSING else get_path(document, field)
+            for field in self.index_fields(index)
+        )
+        if index.get("sparse") and all(item is None for item in value):
+            return None
+        return value
+
+    def check_unique(self, document: Mapping[str, Any]) -> None:
+        for name, values in self.unique_values.items():
+            value = self.index_value(name, document)
+            owner = values.get(value, MISSING) if value is not None else MISSING
+            if owner is not MISSING and owner != document["_id"]:
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error collection: {self.full_name} "
+                    f"index: {name} dup key: {value}",
+                    11000,
+                )
+
+    def index_document(self, document: Mapping[str, Any]) -> None:
+        for name, values in self.unique_values.items():
+            value = self.index_value(name, document)
+            if value is not None:
+                values[value] = document["_id"]
+
+    def unindex_document(self, document: Mapping[str, Any]) -> None:
+        for name, values in self.unique_values.items():
+            value = self.index_value(name, document)
+            if value is not None and values.get(value) == document["_id"]:
+                del values[value]
+
+    async def create_indexes(
+        self, indexes: Sequence[IndexModel], session: Any = None, **kwargs: Any
+    ) -> List[str]:
+        names = []
+        for index_model in indexes:
+            document = dict(index_model.document)
+            name = document.pop("name")
+            index = {"key": list(document.pop("key").items()), "v": 2, **document}
+
+            existing = self.indexes.get(name)
+            if existing is not None and existing != index:
+                raise OperationFailure(
+                    f"An existing index has the same name as the requested index: {name}",
+                    85,
+                )
+
+            if index.get("unique") and name not in self.unique_values:
+                self.indexes[name] = index
+                self.unique_values[name] = {}
+                try:
+                    for stored in self.documents.values():
+                        self.check_unique(stored)
+                        self.index_document(stored)
+                except DuplicateKeyError:
+                    del self.indexes[name], self.unique_values[name]
+                    raise
+            self.indexes[name] = index
+            names.append(name)
+        return names
+
+    async def create_index(self, keys: Any, **kwargs: Any) -> str:
+        return (await self.create_indexes([IndexModel(keys, **kwargs)]))[0]
+
+    async def drop_index(self, name: str, session: Any = None, **kwargs: Any) -> None:
+        if name == "_id_" or name not in self.indexes:
+            raise OperationFailure(f"index not found with name [{name}]", 27)
+        del self.indexes[name]
+        self.unique_values.pop(name, None)
+
+    async def index_information(self, session: Any = None) -> Dict[str, Any]:
+        return clone(self.indexes)
+
+    def sweep_expired(self) -> None:
+        """Removes the documents expired by ttl indexes, like mongod's ttl monitor."""
+
+        now = time.monotonic()
+        if now - self.swept_at < TTL_SWEEP_INTERVAL:
+            return
+        self.swept_at = now
+
+        for index in self.indexes.values():
+            if "expireAfterSeconds" not in index:
+                continue
+            field = index["key"][0][0]
+            cutoff = datetime.utcnow() - timedelta(seconds=index["expireAfterSeconds"])
+            for document in list(self.documents.values()):
+                value = get_path(document, field)
+                if (
+                    isinstance(value, datetime)
+                    and value < cutoff
+                    and matches(document, index.get("partialFilterExpression"))
+                ):
+                    self.remove(document)
+
+    # Reads
+
+    def candidates(self, query: Optional[Mapping[str, Any]]) -> Iterable[Dict]:
+        """
+        Returns the documents that may match the query, looking them up
+        by _id or by a unique index when the query pins them by equality.
+        """
+
+        self.sweep_expired()
+        query = query or {}
+
+        def pinned(field: str) -> Any:
+            condition = query.get(field, MISSING)
+            if is_operator_expression(condition):
+                condition = (
+                    condition.get("$eq", MISSING) if len(condition) == 1 else MISSING
+                )
+            if isinstance(condition, (dict, list, re.Pattern)):
+                return MISSING
+            return condition
+
+        _id = pinned("_id")
+        if _id is not MISSING:
+            document = self.documents.get(_id)
+            return [document] if document is not None else []
+
+        for name, values in self.unique_values.items():
+            value = tuple(
+                pinned(field) for field in self.index_fields(self.indexes[name])
+            )
+            if all(item is not MISSING and item is not None for item in value):
+                _id = values.get(value)
+                return [self.documents[_id]] if _id is not None else []
+
+        return list(self.documents.values())
+
+    def select(
+        self,
+        query: Optional[Mapping[str, Any]],
+        sort: Optional[Union[Mapping, Sequence]] = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> List[Dict[str, Any]]:
+        documents = [
+            document for document in self.candidates(query) if matches(document, query)
+        ]
+        documents = sort_documents(documents, sort)[skip:]
+        return documents[:limit] if limit else documents
+
+    def find(
+        self,
+        filter: Optional[Mapping[str, Any]] = None,
+        projection: Optional[Union[Mapping, Sequence]] = None,
+        skip: int = 0,
+        limit: int = 0,
+        sort: Optional[Union[Mapping, Sequence]] = None,
+        session: Any = None,
+        **kwargs: Any,
+    ) -> InMemoryCursor:
+        return InMemoryCursor(
+            [
+                project(document, projection)
+                for document in self.select(filter, sort, skip, limit)
+            ]
+        )
+
+    async def find_one(
+        self,
+        filter: Optional[Mapping[str, Any]] = None,
+        projection: Optional[Union[Mapping, Sequence]] = None,
+        *args: Any,
+        sort: Optional[Union[Mapping, Sequence]] = None,
+        session: Any = None,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]:
+        documents = self.select(filter, sort, limit=1)
+        return project(documents[0], projection) if documents else None
+
+    async def count_documents(
+        self,
+        filter: Mapping[str, Any],
+        session: Any = None,
+        limit: int = 0,
+        skip: int = 0,
+        **kwargs: Any,
+    ) -> int:
+        return len(self.select(filter, skip=skip, limit=limit))
+
+    async def estimated_document_count(self, **kwargs: Any) -> int:
+        return len(self.documents)
+
+    # Writes
+
+    def insert(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        document.setdefault("_id", ObjectId())
+        if document["_id"] in self.documents:
+            raise DuplicateKeyError(
+                f"E11000 duplicate key error collection: {self.full_name} "
+                f"index: _id_ dup key: {document['_id']}",
+                11000,
+            )
+        self.check_unique(document)
+        self.documents[document["_id"]] = document
+        self.index_document(document)
+        return document
+
+    def replace(self, current: Dict[str, Any], document: Dict[str, Any]) -> None:
+        self.check_unique(document)
+        self.unindex_document(current)
+        self.documents[document["_id"]] = document
+        self.index_document(document)
+
+    def remove(self, document: Dict[str, Any]) -> None:
+        self.unindex_document(document)
+        del self.documents[document["_id"]]
+
+    def update(
+        self,
+        query: Mapping[str, Any],
+        update: Mapping[str, Any],
+        upsert: bool = False,
+        sort: Optional[Union[Mapping, Sequence]] = None,
+        many: bool = False,
+    ) -> Tuple[List[Tuple[Dict, Dict]], Optional[Dict[str, Any]]]:
+        """
+        Applies the update to the matching documents, or inserts one on upsert.
+
+        :return: The (before, after) documents updated and the upserted document.
+        :rtype: tuple
+        """
+
+        documents = self.select(query, sort, limit=0 if many else 1)
+        if not documents and upsert:
+            document = upsert_document(query)
+            apply_update(document, update, inserting=True)
+            return [], self.insert(document)
+
+        updated = []
+        for current in documents:
+            document = clone(current)
+            apply_update(document, update, inserting=False)
+            if document.get("_id") != current["_id"]:
+                raise OperationFailure("Performing an update on the path '_id' ", 66)
+            self.replace(current, document)
+            updated.append((current, document))
+        return updated, None
+
+    async def insert_one(
+        self, document: Dict[str, Any], session: Any = None, **kwargs: Any
+    ) -> InsertOneResult:
+        stored = self.insert(clone(document))
+        document.setdefault("_id", stored["_id"])
+        return InsertOneResult(stored["_id"], True)
+
+    async def insert_many(
+        self, documents: Iterable[Dict[str, Any]], **kwargs: Any
+    ) -> List[Any]:
+        return [(await self.insert_one(document)).inserted_id for document in documents]
+
+    async def update_one(
+        self,
+        filter: Mapping[str, Any],
+        update: Mapping[str, Any],
+        upsert: bool = False,
+        session: Any = None,
+        **kwargs: Any,
+    ) -> UpdateResult:
+        updated, inserted = self.update(filter, update, upsert)
+        return self.update_result(updated, inserted)
+
+    async def update_many(
+        self,
+        filter: Mapping[str, Any],
+        update: Mapping[str, Any],
+        upsert: bool = False,
+        session: Any = None,
+        **kwargs: Any,
+    ) -> UpdateResult:
+        updated, inserted = self.update(filter, update, upsert, many=True)
+        return self.update_result(updated, inserted)
+
+    @staticmethod
+    def update_result(
+        updated: List[Tuple[Dict, Dict]], inserted: Optional[Dict[str, Any]]
+    ) -> UpdateResult:
+        raw_result: Dict[str, Any] = {
+            "n": len(updated) + (1 if inserted else 0),
+            "nModified": sum(1 for before, after in updated if before != after),
+        }
+        if inserted is not None:
+            raw_result["upserted"] = inserted["_id"]
+        return UpdateResult(raw_result, True)
+
+    async def find_one_and_update(
+        self,
+        filter: Mapping[str, Any],
+        update: Mapping[str, Any],
+        projection: Optional[Union[Mapping, Sequence]] = None,
+        sort: Optional[Union[Mapping, Sequence]] = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        session: Any = None,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]:
+        updated, inserted = self.update(filter, update, upsert, sort)
+        if inserted is not None:
+            document = inserted if return_document == ReturnDocument.AFTER else None
+        elif updated:
+            before, after = updated[0]
+            document = after if return_document == ReturnDocument.AFTER else before
+        else:
+            document = None
+        return project(document, projection) if document is not None else None
+
+    async def delete_one(
+        self, filter: Mapping[str, Any], session: Any = None, **kwargs: Any
+    ) -> DeleteResult:
+        documents = self.select(filter, limit=1)
+        for document in documents:
+            self.remove(document)
+        return DeleteResult({"n": len(documents)}, True)
+
+    async def delete_many(
+        self, filter: Mapping[str, Any], session: Any = None, **kwargs: Any
+    ) -> DeleteResult:
+        documents = self.select(filter)
+        for document in documents:
+            self.remove(document)
+        return DeleteResult({"n": len(documents)}, True)
+
+    async def drop(self, **kwargs: Any) -> None:
+        self.database.collections.pop(self.name, None)
+
+
+class InMemoryDatabase:
+    """A database of in memory collections, created on first use."""
+
+    def __init__(self, client: "InMemoryClient", name: str) -> None:
+        self.client = client
+        self.name = name
+        self.collections: Dict[str, InMemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> InMemoryCollection:
+        if name not in self.collections:
+            self.collections[name] = InMemoryCollection(self, name)
+        return self.collections[name]
+
+    def __getattr__(self, name: str) -> InMemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    def get_collection(self, name: str, **kwargs: Any) -> InMemoryCollection:
+        return self[name]
+
+    async def list_collection_names(self, **kwargs: Any) -> List[str]:
+        return list(self.collections)
+
+    async def drop_collection(self, name: str, **kwargs: Any) -> None:
+        self.collections.pop(name, None)
+
+    async def command(self, command: Union[str, Mapping[str, Any]], **kwargs: Any):
+        name = command if isinstance(command, str) else next(iter(command))
+        if name == "ping":
+            return {"ok": 1.0}
+        if name == "dropDatabase":
+            await self.client.drop_database(self.name)
+            return {"ok": 1.0}
+        if name == "collMod" and "index" in command:
+            options = dict(command["index"])
+            index = self[command["collMod"]].indexes.get(options.pop("name"))
+            if index is None:
+                raise OperationFailure("cannot find index", 27)
+            index.update(options)
+            return {"ok": 1.0}
+        raise OperationFailure(f"Command {name} is not supported in memory", 59)
+
+
+class InMemorySession:
+    """A session that does nothing, for the operations that open one."""
+
+    async def __aenter__(self) -> "InMemorySession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+    async def end_session(self) -> None:
+        pass
+
+
+class InMemoryClient:
+    """Stands in for the motor client, holding in memory databases."""
+
+    def __init__(self) -> None:
+        self.databases: Dict[str, InMemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> InMemoryDatabase:
+        if name not in self.databases:
+            self.databases[name] = InMemoryDatabase(self, name)
+        return self.databases[name]
+
+    def get_database(self, name: str, **kwargs: Any) -> InMemoryDatabase:
+        return self[name]
+
+    @property
+    def admin(self) -> InMemoryDatabase:
+        return self["admin"]
+
+    async def start_session(self, **kwargs: Any) -> InMemorySession:
+        return InMemorySession()
+
+    async def drop_database(self, name: Union[str, InMemoryDatabase], **kwargs: Any):
+        self.databases.pop(getattr(name, "name", name), None)
+
+    def close(self) -> None:
+        self.databases.clear()
+
+
+class InMemoryEngine(AIOEngine):
+    """
+    Odmantic engine over the in memory client. Saving, deleting and counting
+    go through AIOEngine unchanged; finding is reimplemented as AIOEngine
+    relies on aggregation pipelines, references are resolved in python.
+    """
+
+    def __init__(
+        self, client: Optional[InMemoryClient] = None, database: str = "test"
+    ) -> None:
+        super().__init__(client=client or InMemoryClient(), database=database)
+
+    def resolve_references(
+        self, model: Type[Model], document: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        for field_name in model.__references__:
+            reference: ODMReference = model.__odm_fields__[field_name]
+            referenced = self.database[reference.model.__collection__].select(
+                {"_id": document.get(reference.key_name)}, limit=1
+            )
+            if referenced:
+                document[reference.key_name] = self.resolve_references(
+                    reference.model, clone(referenced[0])
+                )
+            else:
+                # unbound references are dropped, like the $unwind of AIOEngine
+                document.pop(reference.key_name, None)
+        return document
+
+    def find(
+        self,
+        model: Type[Model],
+        *queries: Any,
+        sort: Optional[Any] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        session: Any = None,
+    ) -> AIOCursor:
+        """Search for Model instances matching the query filter provided."""
+
+        # validates the arguments the same way as AIOEngine.find
+        pipeline = self._prepare_find_pipeline(
+            model, *queries, sort=sort, skip=skip, limit=limit
+        )
+        sort_expression = self._validate_sort_argument(sort)
+
+        documents = self.get_collection(model).select(
+            pipeline[0]["$match"],
+            list(sort_expression.items()) if sort_expression else None,
+            skip,
+            limit or 0,
+        )
+        return AIOCursor(
+            model,
+            InMemoryCursor(
+                [self.resolve_references(model, clone(doc)) for doc in documents]
+            ),
+        )
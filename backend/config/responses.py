@@ -0,0 +1,67 @@
+# Stdlib Imports
+import json
+from enum import Enum
+from datetime import date, datetime
+from typing import Any
+
+# Starlette Imports
+from starlette.responses import JSONResponse
+
+# Third Party Imports
+from bson import ObjectId
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Converts the values json does not support natively:
+    pydantic and odmantic models, ObjectIds, datetimes and enums.
+    """
+
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def dumps(content: Any) -> bytes:
+        """Serializes the content to json bytes with orjson."""
+
+        return orjson.dumps(content, default=encode_default)
+
+else:
+
+    def dumps(content: Any) -> bytes:
+        """Serializes the content to json bytes with the standard library."""
+
+        return json.dumps(
+            content,
+            default=encode_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when it is installed, falling back
+    to the standard library otherwise. Models, ObjectIds and datetimes in
+    the content are serialized directly.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -30,9 +30,79 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = environ("JWT_SECRET_KEY", cast=str)
     JWT_ALGORITHM: str = environ("JWT_ALGORITHM", cast=str)
     JWT_ACCESS_TOKEN_EXPIRES: int = environ("JWT_ACCESS_TOKEN_EXPIRES", cast=int)
+    JWT_LEEWAY: int = environ("JWT_LEEWAY", default=10, cast=int)
+    JWT_VERIFIED_CACHE_SIZE: int = environ(
+        "JWT_VERIFIED_CACHE_SIZE", default=4096, cast=int
+    )
+    JWT_REFRESH_TOKEN_EXPIRES: int = environ(
+        "JWT_REFRESH_TOKEN_EXPIRES", default=30, cast=int
+    )
+    JWT_REVOCATION_REFRESH_INTERVAL: float = environ(
+        "JWT_REVOCATION_REFRESH_INTERVAL", default=5, cast=float
+    )
+    JWT_KEYS_DIR: str = environ("JWT_KEYS_DIR", default="keys", cast=str)
+    JWT_SIGNING_KEY_ID: str = environ("JWT_SIGNING_KEY_ID", default="", cast=str)
+    JWT_JWKS_MAX_AGE: int = environ("JWT_JWKS_MAX_AGE", default=300, cast=int)
+    JWT_CLAIMS_ONLY: bool = environ("JWT_CLAIMS_ONLY", default=False, cast=bool)
+    JWT_TOKEN_VERSION_REFRESH_INTERVAL: float = environ(
+        "JWT_TOKEN_VERSION_REFRESH_INTERVAL", default=5, cast=float
+    )
+
+    # Bcrypt configuration
+    BCRYPT_POOL_WORKERS: int = environ("BCRYPT_POOL_WORKERS", default=2, cast=int)
+    BCRYPT_POOL_MAX_QUEUE: int = environ("BCRYPT_POOL_MAX_QUEUE", default=64, cast=int)
 
     # database configuration
-    USE_TEST_DB: bool = False
+    USE_TEST_DB: bool = environ("USE_TEST_DB", default=False, cast=bool)
+    MONGODB_URI: str = environ("MONGODB_URI", cast=str)
+    MONGODB_DATABASE: str = environ("MONGODB_DATABASE", default="project_db", cast=str)
+    MONGODB_MAX_POOL_SIZE: int = environ("MONGODB_MAX_POOL_SIZE", default=100, cast=int)
+    MONGODB_MIN_POOL_SIZE: int = environ("MONGODB_MIN_POOL_SIZE", default=0, cast=int)
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = environ(
+        "MONGODB_WAIT_QUEUE_TIMEOUT_MS", default=0, cast=int
+    )
+    MONGODB_COMPRESSORS: str = environ("MONGODB_COMPRESSORS", default="", cast=str)
+
+    # User cache configuration (ttl in seconds, 0 disables the cache)
+    USER_CACHE_TTL: int = environ("USER_CACHE_TTL", default=0, cast=int)
+    USER_CACHE_MAXSIZE: int = environ("USER_CACHE_MAXSIZE", default=1024, cast=int)
+
+    # Registered email filter configuration
+    EMAIL_FILTER_ENABLED: bool = environ(
+        "EMAIL_FILTER_ENABLED", default=True, cast=bool
+    )
+    EMAIL_FILTER_CAPACITY: int = environ(
+        "EMAIL_FILTER_CAPACITY", default=100000, cast=int
+    )
+    EMAIL_FILTER_ERROR_RATE: float = environ(
+        "EMAIL_FILTER_ERROR_RATE", default=0.01, cast=float
+    )
+    EMAIL_FILTER_REFRESH_INTERVAL: float = environ(
+        "EMAIL_FILTER_REFRESH_INTERVAL", default=5, cast=float
+    )
+
+    # Rate limit configuration (rates as "<requests>/<seconds>")
+    RATE_LIMIT_ENABLED: bool = environ("RATE_LIMIT_ENABLED", default=True, cast=bool)
+    RATE_LIMIT_BACKEND: str = environ("RATE_LIMIT_BACKEND", default="memory", cast=str)
+    RATE_LIMIT_MAX_KEYS: int = environ("RATE_LIMIT_MAX_KEYS", default=100000, cast=int)
+    RATE_LIMIT_TRUST_FORWARDED: bool = environ(
+        "RATE_LIMIT_TRUST_FORWARDED", default=False, cast=bool
+    )
+    RATE_LIMIT_LOGIN_PER_IP: str = environ(
+        "RATE_LIMIT_LOGIN_PER_IP", default="30/60", cast=str
+    )
+    RATE_LIMIT_LOGIN_PER_EMAIL: str = environ(
+        "RATE_LIMIT_LOGIN_PER_EMAIL", default="10/300", cast=str
+    )
+    RATE_LIMIT_REGISTER_PER_IP: str = environ(
+        "RATE_LIMIT_REGISTER_PER_IP", default="10/60", cast=str
+    )
+    RATE_LIMIT_RECOVER_PER_IP: str = environ(
+        "RATE_LIMIT_RECOVER_PER_IP", default="10/300", cast=str
+    )
+    RATE_LIMIT_RECOVER_PER_EMAIL: str = environ(
+        "RATE_LIMIT_RECOVER_PER_EMAIL", default="3/300", cast=str
+    )
 
     # Email configuration
     EMAIL_MODE: str = environ("EMAIL_MODE", cast=str)
@@ -40,11 +110,75 @@ class Settings(BaseSettings):
     EMAIL_HOST_TOKEN: str = environ("EMAIL_HOST_TOKEN", cast=str)
     EMAIL_OTP_TIMEOUT: int = environ("EMAIL_OTP_TIMEOUT", cast=int)
     EMAIL_HOST_SENDER: str = environ("EMAIL_HOST_SENDER", cast=str)
+    EMAIL_MAILTRAP_TIMEOUT: float = environ(
+        "EMAIL_MAILTRAP_TIMEOUT", default=10, cast=float
+    )
+
+    # Outbound http client configuration (timeouts in seconds)
+    HTTP_CLIENT_HTTP2: bool = environ("HTTP_CLIENT_HTTP2", default=False, cast=bool)
+    HTTP_CLIENT_TIMEOUT: float = environ("HTTP_CLIENT_TIMEOUT", default=10, cast=float)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = environ(
+        "HTTP_CLIENT_MAX_CONNECTIONS", default=100, cast=int
+    )
+    HTTP_CLIENT_MAX_KEEPALIVE: int = environ(
+        "HTTP_CLIENT_MAX_KEEPALIVE", default=20, cast=int
+    )
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = environ(
+        "HTTP_CLIENT_KEEPALIVE_EXPIRY", default=30, cast=float
+    )
+
+    # Job queue configuration (durations in seconds)
+    JOB_MAX_ATTEMPTS: int = environ("JOB_MAX_ATTEMPTS", default=5, cast=int)
+    JOB_LEASE: int = environ("JOB_LEASE", default=60, cast=int)
+    JOB_BACKOFF_BASE: float = environ("JOB_BACKOFF_BASE", default=5, cast=float)
+    JOB_BACKOFF_MAX: float = environ("JOB_BACKOFF_MAX", default=600, cast=float)
+    JOB_POLL_INTERVAL: float = environ("JOB_POLL_INTERVAL", default=1, cast=float)
+    JOB_WORKER_CONCURRENCY: int = environ(
+        "JOB_WORKER_CONCURRENCY", default=10, cast=int
+    )
+    JOB_RETENTION: int = environ("JOB_RETENTION", default=604800, cast=int)
+
+    # Upload configuration (sizes in bytes)
+    UPLOAD_MAX_SIZE: int = environ("UPLOAD_MAX_SIZE", default=4000000, cast=int)
+    UPLOAD_DEFERRED: bool = environ("UPLOAD_DEFERRED", default=False, cast=bool)
+    UPLOAD_INDEX_CACHE_SIZE: int = environ(
+        "UPLOAD_INDEX_CACHE_SIZE", default=4096, cast=int
+    )
 
     # Cloudinary configuration
     CLOUDINARY_NAME: str = environ("CLOUDINARY_NAME", cast=str)
     CLOUDINARY_API_KEY: str = environ("CLOUDINARY_API_KEY", cast=str)
     CLOUDINARY_API_SECRET: str = environ("CLOUDINARY_API_SECRET", cast=str)
+    CLOUDINARY_API_URL: str = environ(
+        "CLOUDINARY_API_URL", default="https://api.cloudinary.com/v1_1", cast=str
+    )
+    CLOUDINARY_UPLOAD_TIMEOUT: float = environ(
+        "CLOUDINARY_UPLOAD_TIMEOUT", default=30, cast=float
+    )
+    CLOUDINARY_UPLOAD_RETRIES: int = environ(
+        "CLOUDINARY_UPLOAD_RETRIES", default=2, cast=int
+    )
+    CLOUDINARY_MAX_CONCURRENT_UPLOADS: int = environ(
+        "CLOUDINARY_MAX_CONCURRENT_UPLOADS", default=10, cast=int
+    )
+
+    # Request profiler configuration (interval in seconds)
+    PROFILER_ENABLED: bool = environ("PROFILER_ENABLED", default=False, cast=bool)
+    PROFILER_SAMPLE_RATE: float = environ(
+        "PROFILER_SAMPLE_RATE", default=0.0, cast=float
+    )
+    PROFILER_SECRET: str = environ("PROFILER_SECRET", default="", cast=str)
+    PROFILER_INTERVAL: float = environ("PROFILER_INTERVAL", default=0.001, cast=float)
+    PROFILER_DIR: str = environ("PROFILER_DIR", default="/tmp/profiles", cast=str)
+    PROFILER_MAX_FILES: int = environ("PROFILER_MAX_FILES", default=100, cast=int)
+
+    # Query profiler configuration
+    QUERY_PROFILER_ENABLED: bool = environ(
+        "QUERY_PROFILER_ENABLED", default=False, cast=bool
+    )
+    QUERY_SLOW_MS: float = environ("QUERY_SLOW_MS", default=100, cast=float)
+    QUERY_MAX_PER_REQUEST: int = environ("QUERY_MAX_PER_REQUEST", default=10, cast=int)
+    QUERY_EXPLAIN: bool = environ("QUERY_EXPLAIN", default=True, cast=bool)
 
 
 @lru_cache(maxsize=None)
@@ -1,3 +1,6 @@
+# Stdlib Imports
+import logging
+
 # FastAPI Imports
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -7,13 +10,35 @@ from starlette.middleware.sessions import SessionMiddleware
 
 # Own Imports
 from config.secrets import get_settings
+from config.database import database
+from config.responses import FastJSONResponse
+from config.indexes import configure_indexes
+from config.http_client import http_client
+from apps.jobs.api import router as jobs_router
+from apps.monitoring.api import router as monitoring_router
+from apps.monitoring.metrics import mark_process_dead
+from apps.monitoring.middleware import MetricsMiddleware
+from apps.monitoring.profiler import ProfilerMiddleware, profiler_available
+from apps.monitoring.listeners import command_metrics_listener
+from apps.monitoring.query_profiler import (
+    QueryProfilerListener,
+    QueryProfilerMiddleware,
+)
 from apps.commoners.api import router as commoners_router
 from apps.accounts.routers.auth import router as auth_router
+from apps.accounts.routers.jwks import router as jwks_router
+from apps.accounts.manager.bcrypt_manager import bcrypt_hasher
+from apps.accounts.manager.email_filter_manager import email_filter
+from apps.accounts.manager.revocation_manager import revoked_tokens
+from apps.accounts.manager.token_version_manager import token_versions
 
 
 # Initialize get_settings
 secrets = get_settings()
 
+# Set logger
+logger = logging.getLogger(__name__)
+
 
 # initialize application
 application = FastAPI(
@@ -22,6 +47,7 @@ application = FastAPI(
     version=secrets.API_VERSION,
     contact=secrets.API_CONTACT,
     openapi_url="/api-docs.json",
+    default_response_class=FastJSONResponse,
 )
 
 # mount middlewares
@@ -33,6 +59,54 @@ application.add_middleware(
     allow_headers=secrets.ALLOWED_HEADERS,
 )
 application.add_middleware(SessionMiddleware, secret_key=secrets.JWT_SECRET_KEY)
+application.add_middleware(MetricsMiddleware)
+
+# profile sampled requests, only mounted when enabled
+if secrets.PROFILER_ENABLED and not profiler_available():
+    logger.warning("PROFILER_ENABLED is set but pyinstrument is not installed.")
+elif secrets.PROFILER_ENABLED:
+    application.add_middleware(
+        ProfilerMiddleware,
+        directory=secrets.PROFILER_DIR,
+        sample_rate=secrets.PROFILER_SAMPLE_RATE,
+        secret=secrets.PROFILER_SECRET,
+        interval=secrets.PROFILER_INTERVAL,
+        max_files=secrets.PROFILER_MAX_FILES,
+    )
+
+# time every database command
+database.add_listener(command_metrics_listener)
+
+# log slow database commands and requests issuing too many, only when enabled
+if secrets.QUERY_PROFILER_ENABLED:
+    database.add_listener(QueryProfilerListener(slow_ms=secrets.QUERY_SLOW_MS))
+    application.add_middleware(
+        QueryProfilerMiddleware,
+        max_queries=secrets.QUERY_MAX_PER_REQUEST,
+        explain=secrets.QUERY_EXPLAIN,
+    )
+
+
+@application.on_event("startup")
+async def startup() -> None:
+    bcrypt_hasher.start()
+    http_client.start()
+    await database.warm_up()
+    await configure_indexes()
+    await email_filter.start()
+    await token_versions.start()
+    await revoked_tokens.start()
+
+
+@application.on_event("shutdown")
+async def shutdown() -> None:
+    await bcrypt_hasher.shutdown()
+    await email_filter.shutdown()
+    await token_versions.shutdown()
+    await revoked_tokens.shutdown()
+    await http_client.shutdown()
+    database.shutdown()
+    mark_process_dead()
 
 
 @application.get(
@@ -62,4 +136,7 @@ async def read_root() -> dict:
 
 # include routers
 application.include_router(auth_router)
+application.include_router(jwks_router)
 application.include_router(commoners_router)
+application.include_router(jobs_router)
+application.include_router(monitoring_router)
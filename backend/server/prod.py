@@ -1,6 +1,16 @@
+# Stdlib Imports
+import os
+import shutil
+
 # Uvicorn Imports
 import uvicorn
 
 
 if __name__ == "__main__":
+    # workers share their metrics through this directory, cleared on every start
+    metrics_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir)
+
     uvicorn.run("entrypoint:application", host="0.0.0.0", port=80, workers=4)
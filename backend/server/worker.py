@@ -0,0 +1,37 @@
+# Stdlib Imports
+import signal
+import asyncio
+import logging
+
+# Own Imports
+from config.database import database
+from config.indexes import configure_indexes
+from config.http_client import http_client
+from apps.jobs.manager.worker_manager import JobWorker
+
+# Register job handlers
+import apps.accounts.tasks  # noqa: F401
+import apps.commoners.tasks  # noqa: F401
+
+
+async def main() -> None:
+    worker = JobWorker()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    http_client.start()
+    await database.warm_up()
+    # the worker runs the index migration, application workers only verify
+    await configure_indexes(migrate=True)
+    try:
+        await worker.run()
+    finally:
+        await http_client.shutdown()
+        database.shutdown()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,26 @@
+# Stdlib Imports
+import os
+
+
+# Settings the application cannot start without, for the tests that
+# do not run against a configured environment
+TEST_SETTINGS = {
+    "ALLOWED_METHODS": "get,options,post,put,delete",
+    "ALLOWED_ORIGINS": "http://localhost",
+    "JWT_SECRET_KEY": "test-secret",
+    "JWT_ALGORITHM": "HS256",
+    "JWT_ACCESS_TOKEN_EXPIRES": "15",
+    "MONGODB_URI": "mongodb://localhost:27017",
+    "EMAIL_MODE": "sandbox",
+    "EMAIL_API_URL": "http://email.test/",
+    "EMAIL_HOST_TOKEN": "test-token",
+    "EMAIL_OTP_TIMEOUT": "5",
+    "EMAIL_HOST_SENDER": "sender@example.com",
+    "CLOUDINARY_NAME": "test",
+    "CLOUDINARY_API_KEY": "test-key",
+    "CLOUDINARY_API_SECRET": "test-secret",
+    "USE_TEST_DB": "True",
+}
+
+for name, value in TEST_SETTINGS.items():
+    os.environ.setdefault(name, value)
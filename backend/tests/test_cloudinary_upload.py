@@ -0,0 +1,185 @@
+# Stdlib Imports
+import asyncio
+from typing import AsyncIterator, Callable, Iterator, List
+
+# FastAPI Imports
+from fastapi import HTTPException
+
+# Own Imports
+from config.http_client import http_client
+from apps.commoners.services import cloudinary_upload
+from apps.commoners.services.cloudinary_upload import CloudinaryFileUploader
+
+# Third Party Imports
+import httpx
+import pytest
+
+
+pytestmark = pytest.mark.anyio
+
+UPLOADED = {"secure_url": "https://res.cloudinary.com/test/image/upload/a.png"}
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cloudinary_upload.random, "uniform", lambda a, b: 0)
+
+
+@pytest.fixture
+def requests() -> List[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def provider(
+    requests: List[httpx.Request],
+) -> Iterator[Callable[[Callable], None]]:
+    """Routes the shared http client to a local stand-in of cloudinary."""
+
+    def use(handler: Callable) -> None:
+        async def record(request: httpx.Request) -> httpx.Response:
+            await request.aread()
+            requests.append(request)
+            return await handler(request)
+
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+
+    yield use
+    http_client._client = None
+
+
+@pytest.fixture
+def uploader() -> CloudinaryFileUploader:
+    uploader = CloudinaryFileUploader()
+    uploader.retries = 2
+    return uploader
+
+
+async def chunks() -> AsyncIterator[bytes]:
+    yield b"first "
+    yield b"second"
+
+
+async def test_upload_file_retries_server_errors(provider, requests, uploader):
+    statuses = iter([503, 502, 200])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        status_code = next(statuses)
+        return httpx.Response(status_code, json=UPLOADED if status_code == 200 else {})
+
+    provider(handler)
+
+    assert await uploader.upload_file(b"image") == UPLOADED["secure_url"]
+    assert len(requests) == 3
+    assert all(b"image" in request.content for request in requests)
+
+
+async def test_upload_file_gives_up_after_the_last_retry(provider, requests, uploader):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={"error": {"message": "unavailable"}})
+
+    provider(handler)
+
+    with pytest.raises(HTTPException) as error:
+        await uploader.upload_file(b"image")
+    assert error.value.detail["meta"] == "unavailable"
+    assert len(requests) == uploader.retries + 1
+
+
+async def test_upload_file_does_not_retry_client_errors(provider, requests, uploader):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, json={"error": {"message": "bad image"}})
+
+    provider(handler)
+
+    with pytest.raises(HTTPException):
+        await uploader.upload_file(b"image")
+    assert len(requests) == 1
+
+
+async def test_upload_file_retries_transport_errors(provider, requests, uploader):
+    attempts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json=UPLOADED)
+
+    provider(handler)
+
+    assert await uploader.upload_file(b"image") == UPLOADED["secure_url"]
+    assert len(requests) == 2
+
+
+async def test_upload_file_applies_the_upload_timeout(provider, requests, uploader):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    provider(handler)
+    uploader.timeout = 1.5
+
+    with pytest.raises(HTTPException) as error:
+        await uploader.upload_file(b"image")
+    assert error.value.detail["meta"] == "timed out"
+    assert len(requests) == uploader.retries + 1
+    assert requests[0].extensions["timeout"] == httpx.Timeout(1.5).as_dict()
+
+
+async def test_uploads_in_flight_are_limited(provider, requests, uploader):
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=UPLOADED)
+
+    provider(handler)
+    uploader.max_concurrent = 2
+
+    await asyncio.gather(*(uploader.upload_file(b"image") for _ in range(6)))
+    assert len(requests) == 6
+    assert peak == 2
+
+
+async def test_upload_stream_sends_the_chunks(provider, requests, uploader):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=UPLOADED)
+
+    provider(handler)
+
+    assert await uploader.upload_stream(chunks()) == UPLOADED["secure_url"]
+    assert b"first second" in requests[0].content
+
+
+async def test_upload_stream_does_not_retry_server_errors(provider, requests, uploader):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, json={"error": {"message": "unavailable"}})
+
+    provider(handler)
+
+    with pytest.raises(HTTPException):
+        await uploader.upload_stream(chunks())
+    assert len(requests) == 1
+
+
+async def test_upload_stream_does_not_retry_transport_errors(
+    provider, requests, uploader
+):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    provider(handler)
+
+    with pytest.raises(HTTPException):
+        await uploader.upload_stream(chunks())
+    assert len(requests) == 1
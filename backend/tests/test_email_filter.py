@@ -0,0 +1,75 @@
+# Stdlib Imports
+from datetime import datetime, timedelta
+
+# Own Imports
+from config.database import engine
+from apps.accounts.models.accounts import User
+from apps.accounts.manager.email_filter_manager import EmailFilter
+
+# Third Party Imports
+import pytest
+from bson import ObjectId
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def email_filter() -> EmailFilter:
+    await engine.get_collection(User).drop()
+    email_filter = EmailFilter(capacity=1000, error_rate=0.01, refresh_interval=5)
+    await email_filter.refresh()
+    return email_filter
+
+
+async def store_account(email: str, created_at: datetime = None) -> None:
+    """Stores an account the way another worker would, without the filter."""
+
+    await engine.get_collection(User).insert_one(
+        {
+            "_id": ObjectId.from_datetime(created_at) if created_at else ObjectId(),
+            "primary_email": email,
+        }
+    )
+
+
+async def test_unknown_emails_are_definite_misses(email_filter):
+    assert not email_filter.may_exist("nobody@example.com")
+    assert email_filter.stats()["definite_misses"] == 1
+
+
+async def test_registered_emails_are_found_without_a_refresh(email_filter):
+    email_filter.add("new@example.com")
+
+    assert email_filter.may_exist("new@example.com")
+    assert email_filter.stats()["refreshes"] == 1
+
+
+async def test_accounts_stored_on_other_workers_are_found_after_a_refresh(
+    email_filter,
+):
+    await store_account("other@example.com")
+
+    # misses are answered from memory until the next refresh
+    assert not email_filter.may_exist("other@example.com")
+
+    await email_filter.refresh()
+
+    assert email_filter.may_exist("other@example.com")
+
+
+async def test_accounts_stored_with_an_older_id_are_found(email_filter):
+    await store_account("first@example.com")
+    await email_filter.refresh()
+
+    # stored by a host whose clock is an hour behind
+    await store_account("skewed@example.com", datetime.utcnow() - timedelta(hours=1))
+    await email_filter.refresh()
+
+    assert email_filter.may_exist("skewed@example.com")
+    assert email_filter.stats()["rebuilds"] == 1
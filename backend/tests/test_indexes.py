@@ -0,0 +1,133 @@
+# Stdlib Imports
+import asyncio
+from typing import Any, List, Tuple
+
+# Own Imports
+from config.database import engine
+from config.secrets import get_settings
+from config.indexes import configure_indexes, expected_indexes
+from config.memory_database import InMemoryCollection, InMemoryDatabase
+from apps.accounts.models.accounts import OTPTimeout, User
+
+# Third Party Imports
+import pytest
+from pymongo import ASCENDING, IndexModel
+
+
+pytestmark = pytest.mark.anyio
+
+OTP_TTL_INDEX = "date_modified_1"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+async def clean_collections():
+    for model in (User, OTPTimeout):
+        await engine.get_collection(model).drop()
+    yield
+
+
+@pytest.fixture
+def calls(monkeypatch) -> List[Tuple[Any, ...]]:
+    """Records the index commands sent to the database, as sent to MongoDB."""
+
+    calls = []
+    create_indexes = InMemoryCollection.create_indexes
+    drop_index = InMemoryCollection.drop_index
+    command = InMemoryDatabase.command
+
+    async def record_create_indexes(self, indexes, *args, **kwargs):
+        calls.append(("createIndexes", self.name, [i.document for i in indexes]))
+        return await create_indexes(self, indexes, *args, **kwargs)
+
+    async def record_drop_index(self, name, *args, **kwargs):
+        calls.append(("dropIndex", self.name, name))
+        return await drop_index(self, name, *args, **kwargs)
+
+    async def record_command(self, document, *args, **kwargs):
+        calls.append(("command", document))
+        return await command(self, document, *args, **kwargs)
+
+    monkeypatch.setattr(InMemoryCollection, "create_indexes", record_create_indexes)
+    monkeypatch.setattr(InMemoryCollection, "drop_index", record_drop_index)
+    monkeypatch.setattr(InMemoryDatabase, "command", record_command)
+    return calls
+
+
+def otp_ttl_index() -> IndexModel:
+    return next(
+        index
+        for index in expected_indexes(OTPTimeout)
+        if index.document["name"] == OTP_TTL_INDEX
+    )
+
+
+async def create_otp_indexes(ttl_index: IndexModel) -> None:
+    """Creates the otp indexes as declared, except the given ttl index."""
+
+    await engine.get_collection(OTPTimeout).create_indexes(
+        [
+            index
+            for index in expected_indexes(OTPTimeout)
+            if index.document["name"] != OTP_TTL_INDEX
+        ]
+        + [ttl_index]
+    )
+
+
+async def test_concurrent_startups_create_the_indexes_once(calls):
+    results = await asyncio.gather(*(configure_indexes([User]) for _ in range(4)))
+
+    indexes = await engine.get_collection(User).index_information()
+    assert sorted(name for created in results for name in created["users"]) == sorted(
+        set(indexes) - {"_id_"}
+    )
+    assert calls == [
+        ("createIndexes", "users", [index.document]) for index in expected_indexes(User)
+    ]
+
+
+async def test_ttl_changes_are_applied_in_place(calls):
+    collection = engine.get_collection(OTPTimeout)
+    await create_otp_indexes(
+        IndexModel([("date_modified", ASCENDING)], expireAfterSeconds=1)
+    )
+    calls.clear()
+
+    await configure_indexes([OTPTimeout])
+
+    ttl = get_settings().EMAIL_OTP_TIMEOUT * 60
+    indexes = await collection.index_information()
+    assert indexes[OTP_TTL_INDEX]["expireAfterSeconds"] == ttl
+    assert calls == [
+        (
+            "command",
+            {
+                "collMod": collection.name,
+                "index": {"name": OTP_TTL_INDEX, "expireAfterSeconds": ttl},
+            },
+        )
+    ]
+
+
+async def test_other_option_changes_wait_for_the_migration(calls):
+    collection = engine.get_collection(OTPTimeout)
+    await create_otp_indexes(IndexModel([("date_modified", ASCENDING)], sparse=True))
+    calls.clear()
+
+    await configure_indexes([OTPTimeout])
+    assert (await collection.index_information())[OTP_TTL_INDEX].get("sparse")
+    assert calls == []
+
+    await configure_indexes([OTPTimeout], migrate=True)
+    index = (await collection.index_information())[OTP_TTL_INDEX]
+    assert not index.get("sparse")
+    assert "expireAfterSeconds" in index
+    assert calls == [
+        ("dropIndex", collection.name, OTP_TTL_INDEX),
+        ("createIndexes", collection.name, [otp_ttl_index().document]),
+    ]
@@ -0,0 +1,48 @@
+# Stdlib Imports
+import re
+
+# Own Imports
+from config.database import engine
+from apps.accounts.models.accounts import User
+
+# Third Party Imports
+import pytest
+from odmantic import query
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+async def users() -> None:
+    await engine.get_collection(User).drop()
+    await engine.get_collection(User).insert_many(
+        [
+            {"primary_email": "ada@example.com", "tags": ["admin", "staff"]},
+            {"primary_email": "bob@example.org", "tags": ["staff"]},
+            {"primary_email": 42},
+        ]
+    )
+
+
+async def test_odmantic_match_queries_are_regular_expressions():
+    assert await engine.count(User, query.match(User.primary_email, r"\.com$")) == 1
+    assert await engine.count(User, query.match(User.primary_email, "example")) == 2
+
+
+async def test_compiled_patterns_match_strings_only():
+    collection = engine.get_collection(User)
+
+    assert await collection.count_documents({"primary_email": re.compile("4")}) == 0
+    assert await collection.count_documents({"tags": re.compile("^adm")}) == 1
+    assert (
+        await collection.count_documents(
+            {"primary_email": {"$regex": re.compile("^BOB", re.I)}}
+        )
+        == 1
+    )